@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Measure how export-published-gallery.py scales with the size of universal.db.
+
+For each size a throwaway universal.db and a matching existing export are
+generated (see synthetic_corpus) in a temporary directory, then the
+exporter's own functions are timed: the streamed joined query plus merge,
+the report, and rendering gallery.json. Nothing in the repo is read or
+written. Per-item time that stays flat from
+the smallest to the largest size means the export scales linearly.
+
+    python scripts/benchmark-export-gallery.py
+    python scripts/benchmark-export-gallery.py --sizes 1500 20000 --output .cache/export-benchmark.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from gallery_data import render_items
+from synthetic_corpus import export_items, synthetic_rows, write_universal_db
+
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+EXPORT_SCRIPT = SCRIPT_DIR / "export-published-gallery.py"
+DEFAULT_SIZES = (1500, 10000, 50000, 200000)
+
+
+def load_script(script_path: Path, module_name: str):
+    """Import one of the hyphenated sibling scripts as a module."""
+    spec = importlib.util.spec_from_file_location(module_name, script_path)
+    if spec is None or spec.loader is None:
+        raise RuntimeError(f"Unable to load {script_path}")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def run_size(export: Any, work_dir: Path, count: int, ratio: float, repeat: int) -> dict[str, Any]:
+    db_path = work_dir / f"universal-{count}.db"
+    started = time.perf_counter()
+    rows = list(synthetic_rows(count))
+    write_universal_db(db_path, rows)
+    existing_items = export_items(rows, ratio)
+    generate_seconds = time.perf_counter() - started
+    del rows
+
+    best: dict[str, float] = {}
+    for _ in range(repeat):
+        timings: dict[str, float] = {}
+        started = time.perf_counter()
+        connection = export.open_db(db_path)
+        connection.execute("BEGIN")
+        marks = export.read_sync_marks(connection)
+        stats = export.ExportStats()
+        merged_items = export.merge_export(existing_items, export.iter_db_items(connection), stats)
+        connection.execute("COMMIT")
+        connection.close()
+        timings["query_merge"] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        export.build_report(
+            db_path=db_path,
+            checkpoint_result=None,
+            existing_count=len(existing_items),
+            stats=stats,
+            json_changed=False,
+            js_changed=False,
+            payload_changed=False,
+            apply_changes=False,
+            sync={"mode": "full", "rows_read": stats.db["rows"]},
+            db_published=marks["published"],
+        )
+        timings["report"] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        render_items(merged_items)
+        timings["render"] = time.perf_counter() - started
+        timings["total"] = sum(timings.values())
+        for stage, seconds in timings.items():
+            best[stage] = min(best.get(stage, seconds), seconds)
+
+    return {
+        "items": count,
+        "published": marks["published"],
+        "existing_export_items": len(existing_items),
+        "generate_seconds": round(generate_seconds, 4),
+        "seconds": {stage: round(seconds, 4) for stage, seconds in best.items()},
+        "us_per_item": round(best["total"] / max(count, 1) * 1e6, 2),
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark export-published-gallery.py against synthetic databases.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), help="gallery_items row counts to test")
+    parser.add_argument("--existing-ratio", type=float, default=0.9, help="Share of rows already present in the existing export")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per size; the fastest is reported")
+    parser.add_argument("--output", type=Path, help="Also write the results as JSON to this path")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    export = load_script(EXPORT_SCRIPT, "export_published_gallery")
+
+    results = []
+    print(f"{'Items':>8}{'Query+merge':>13}{'Report':>9}{'Render':>9}{'Total':>9}{'us/item':>9}")
+    with tempfile.TemporaryDirectory(prefix="export-benchmark-") as work_dir:
+        for count in sorted(args.sizes):
+            result = run_size(export, Path(work_dir), count, args.existing_ratio, max(args.repeat, 1))
+            results.append(result)
+            seconds = result["seconds"]
+            print(
+                f"{count:>8,}{seconds['query_merge']:>12.3f}s{seconds['report']:>8.3f}s"
+                f"{seconds['render']:>8.3f}s{seconds['total']:>8.3f}s{result['us_per_item']:>9.2f}"
+            )
+
+    if len(results) > 1:
+        growth = results[-1]["us_per_item"] / results[0]["us_per_item"] if results[0]["us_per_item"] else 0.0
+        print(f"Per-item time at {results[-1]['items']:,} items is {growth:.2f}x that at {results[0]['items']:,} (1.00x = linear).")
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps({"results": results}, indent=2) + "\n", encoding="utf-8")
+        print(f"Results written to: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Benchmark the site build pipeline against synthetic corpora of growing size.
+
+For each gallery size the repo is copied into a scratch workspace, its inputs
+are replaced with synthetic ones (see synthetic_corpus): data/gallery.json,
+data/homepage-gallery.json, a throwaway universal.db, news-digests/*.md and
+a creative_benchmarks.json cache. Then each build stage runs there as its
+own process:
+
+    export-published-gallery  rebuild-homepage-gallery  update-news-digest-index
+    sync-a-list-benchmarks    render-a-list             render-cinematic-site (cold, warm)
+    validate-site
+
+Wall time and peak RSS (from os.wait4 where the OS provides it) are recorded
+per stage and written to .cache/benchmarks/site-build-<timestamp>.json. Pass
+--compare with an earlier results file to print per-stage ratios; the exit
+code is 1 when any stage got slower than --threshold (and by at least
+0.1 s).
+
+    python scripts/benchmark-site-build.py --sizes 1000 10000
+    python scripts/benchmark-site-build.py --compare .cache/benchmarks/site-build-20260518-101500.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from gallery_data import write_items
+from synthetic_corpus import (
+    benchmark_rows,
+    export_items,
+    homepage_items,
+    synthetic_rows,
+    write_digests,
+    write_universal_db,
+)
+
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+RESULTS_DIR = PROJECT_DIR / ".cache" / "benchmarks"
+DEFAULT_SIZES = (1000, 10000, 100000)
+DEFAULT_DIGESTS = 365
+WORKSPACE_IGNORE = shutil.ignore_patterns(".git", ".cache", "node_modules", "__pycache__", "*.db", "requests.jsonl")
+LOG_TAIL_BYTES = 2000
+# Slowdowns smaller than this are scheduler noise, whatever the ratio.
+MIN_REGRESSION_SECONDS = 0.1
+
+
+def build_workspace(root: Path, items: int, digests: int, models: int) -> dict[str, Path]:
+    """Copy the repo to root and swap its inputs for a synthetic corpus; returns the external inputs."""
+    shutil.copytree(PROJECT_DIR, root, ignore=WORKSPACE_IGNORE)
+    rows = list(synthetic_rows(items))
+    write_items(root / "data" / "gallery.json", export_items(rows))
+    write_items(root / "data" / "homepage-gallery.json", homepage_items(rows))
+    db_path = root / "universal.db"
+    write_universal_db(db_path, rows)
+
+    digest_dir = root / "news-digests"
+    for existing in digest_dir.glob("*.md"):
+        existing.unlink()
+    write_digests(digest_dir, digests)
+
+    source_path = root / "creative_benchmarks.json"
+    source_path.write_text(json.dumps(benchmark_rows(models), indent=2) + "\n", encoding="utf-8")
+    return {"db": db_path, "benchmark_source": source_path}
+
+
+def pipeline(inputs: dict[str, Path]) -> list[tuple[str, list[str]]]:
+    """(stage name, script arguments) in build order."""
+    return [
+        ("export-published-gallery", ["export-published-gallery.py", "--db", str(inputs["db"]), "--apply"]),
+        ("rebuild-homepage-gallery", ["rebuild-homepage-gallery.py"]),
+        ("update-news-digest-index", ["update-news-digest-index.py"]),
+        ("sync-a-list-benchmarks", ["sync-a-list-benchmarks.py", "--source", str(inputs["benchmark_source"])]),
+        ("render-a-list", ["render-a-list.py"]),
+        ("render-cinematic-site (cold)", ["render-cinematic-site.py"]),
+        ("render-cinematic-site (warm)", ["render-cinematic-site.py"]),
+        ("validate-site", ["validate-site.py"]),
+    ]
+
+
+def run_stage(workspace: Path, arguments: list[str], env: dict[str, str]) -> dict[str, Any]:
+    """Run one script from the workspace's scripts/ and measure it."""
+    command = [sys.executable, str(workspace / "scripts" / arguments[0]), *arguments[1:]]
+    with tempfile.TemporaryFile() as log:
+        started = time.perf_counter()
+        process = subprocess.Popen(command, cwd=workspace, env=env, stdout=log, stderr=subprocess.STDOUT)
+        peak_rss = None
+        if hasattr(os, "wait4"):
+            _, status, usage = os.wait4(process.pid, 0)
+            process.returncode = os.waitstatus_to_exitcode(status)
+            # ru_maxrss is in kilobytes on Linux and bytes on macOS.
+            peak_rss = usage.ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+        else:
+            process.wait()
+        seconds = time.perf_counter() - started
+
+        result: dict[str, Any] = {"seconds": round(seconds, 4), "peak_rss_bytes": peak_rss, "returncode": process.returncode}
+        if process.returncode != 0:
+            log.seek(0)
+            result["output_tail"] = log.read()[-LOG_TAIL_BYTES:].decode("utf-8", errors="replace")
+    return result
+
+
+def run_size(work_root: Path, items: int, digests: int, models: int) -> dict[str, Any]:
+    workspace = work_root / f"site-{items}"
+    started = time.perf_counter()
+    # A child's ru_maxrss starts from the size of the process it was forked
+    # from, so the corpus is generated in a throwaway worker to keep this
+    # process (and the floor of every stage's peak RSS) small.
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        inputs = pool.submit(build_workspace, workspace, items, digests, models).result()
+    setup_seconds = time.perf_counter() - started
+
+    env = dict(os.environ, AXYLUSION_ALIST_SOURCE=str(inputs["benchmark_source"]), PYTHONDONTWRITEBYTECODE="1")
+    stages = []
+    for name, arguments in pipeline(inputs):
+        result = run_stage(workspace, arguments, env)
+        stages.append({"stage": name, **result})
+        rss = f"{result['peak_rss_bytes'] / 2**20:8.1f} MB" if result["peak_rss_bytes"] else "       n/a"
+        status = "" if result["returncode"] == 0 else f"  (exit {result['returncode']})"
+        print(f"{items:>8,}  {name:<30}{result['seconds']:>9.3f}s {rss}{status}")
+    return {"items": items, "digests": digests, "setup_seconds": round(setup_seconds, 4), "stages": stages}
+
+
+def compare_results(current: dict[str, Any], baseline: dict[str, Any], threshold: float) -> list[str]:
+    """Print time ratios against baseline; returns the stages slower than threshold."""
+    previous = {
+        (run["items"], stage["stage"]): stage["seconds"]
+        for run in baseline.get("runs", [])
+        for stage in run.get("stages", [])
+    }
+    regressions = []
+    print()
+    print(f"{'Items':>8}  {'Stage':<30}{'Before':>10}{'After':>10}{'Ratio':>8}")
+    for run in current["runs"]:
+        for stage in run["stages"]:
+            before = previous.get((run["items"], stage["stage"]))
+            if not before:
+                continue
+            ratio = stage["seconds"] / before
+            slower = ratio > threshold and stage["seconds"] - before >= MIN_REGRESSION_SECONDS
+            flag = "  REGRESSION" if slower else ""
+            print(f"{run['items']:>8,}  {stage['stage']:<30}{before:>9.3f}s{stage['seconds']:>9.3f}s{ratio:>7.2f}x{flag}")
+            if flag:
+                regressions.append(f"{stage['stage']} at {run['items']:,} items: {ratio:.2f}x")
+    return regressions
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Time each site build stage against synthetic corpora.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), help="Gallery item counts to build")
+    parser.add_argument("--digests", type=int, default=DEFAULT_DIGESTS, help="Daily news digests to generate")
+    parser.add_argument("--models", type=int, default=8, help="A-List models per benchmark category")
+    parser.add_argument("--output", type=Path, help="Results JSON path (default: .cache/benchmarks/site-build-<timestamp>.json)")
+    parser.add_argument("--compare", type=Path, help="Earlier results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=1.25, help="Slowdown ratio reported as a regression")
+    parser.add_argument("--work-dir", type=Path, help="Build the workspaces here and keep them (default: a temporary directory)")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    started_at = datetime.now(timezone.utc)
+    results: dict[str, Any] = {
+        "generated_at": started_at.isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "runs": [],
+    }
+
+    print(f"{'Items':>8}  {'Stage':<30}{'Time':>10} {'Peak RSS':>10}")
+    if args.work_dir:
+        args.work_dir.mkdir(parents=True, exist_ok=True)
+        for items in sorted(args.sizes):
+            shutil.rmtree(args.work_dir / f"site-{items}", ignore_errors=True)
+            results["runs"].append(run_size(args.work_dir, items, args.digests, args.models))
+    else:
+        with tempfile.TemporaryDirectory(prefix="site-benchmark-") as work_dir:
+            for items in sorted(args.sizes):
+                results["runs"].append(run_size(Path(work_dir), items, args.digests, args.models))
+
+    output = args.output or RESULTS_DIR / f"site-build-{started_at.strftime('%Y%m%d-%H%M%S')}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+    print(f"Results written to: {output}")
+
+    failed = [stage["stage"] for run in results["runs"] for stage in run["stages"] if stage["returncode"] != 0]
+    if failed:
+        print(f"Stages that exited non-zero: {', '.join(sorted(set(failed)))}")
+
+    if args.compare:
+        regressions = compare_results(results, json.loads(args.compare.read_text(encoding="utf-8")), args.threshold)
+        if regressions:
+            print(f"Slower than {args.threshold:.2f}x: " + "; ".join(regressions))
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,265 @@
+"""
+Opt-in stage timing for the build scripts.
+
+A script adds the flag with add_profile_argument(parser), runs its work
+inside `with profiling("<script>", args):` and marks stages anywhere below
+that with `with stage("name"):`. Stages nest, and are reported by path
+("page:gallery.html/render/jsonld") with calls, inclusive and self seconds,
+and the bytes the process read and wrote while they ran. Without --profile,
+stage() costs one global lookup.
+
+    --profile                       timers only
+    --profile cprofile,memory,stacks
+
+  cprofile  also run cProfile: <report>.pstats plus the top functions in the report
+  memory    trace allocations with tracemalloc: per-stage peak and top sites
+  stacks    sample the main thread every few ms into <report>.folded, one
+            "stage;frame;frame count" line per stack, for flamegraph.pl or
+            speedscope
+
+The report goes to .cache/profiles/<script>-<timestamp>.json (or
+--profile-output). Byte counts come from psutil when it is installed,
+otherwise /proc/self/io; elsewhere they are null.
+"""
+
+from __future__ import annotations
+
+import argparse
+import cProfile
+import json
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterator
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+PROFILE_DIR = PROJECT_DIR / ".cache" / "profiles"
+PROFILE_EXTRAS = ("cprofile", "memory", "stacks")
+SAMPLE_INTERVAL_SECONDS = 0.005
+TOP_ENTRIES = 25
+
+_ACTIVE: BuildProfile | None = None
+
+
+def _io_counters() -> tuple[int, int] | None:
+    """(bytes read, bytes written) by this process so far, or None when unavailable."""
+    if psutil is not None:
+        counters = psutil.Process().io_counters()
+        return getattr(counters, "read_chars", counters.read_bytes), getattr(counters, "write_chars", counters.write_bytes)
+    try:
+        fields = dict(line.split(": ", 1) for line in Path("/proc/self/io").read_text().splitlines())
+        return int(fields["rchar"]), int(fields["wchar"])
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+class _Frame:
+    __slots__ = ("path", "started", "io", "child_seconds", "saved_peak")
+
+    def __init__(self, path: str, io: tuple[int, int] | None) -> None:
+        self.path = path
+        self.started = time.perf_counter()
+        self.io = io
+        self.child_seconds = 0.0
+        self.saved_peak = 0
+
+
+class BuildProfile:
+    """Stage timings (and optional cProfile, tracemalloc and stack samples) for one run."""
+
+    def __init__(self, script: str, extras: set[str], output: Path | None = None) -> None:
+        self.script = script
+        self.extras = extras
+        self.started_at = datetime.now(timezone.utc)
+        self.output = output or PROFILE_DIR / f"{script}-{self.started_at.strftime('%Y%m%d-%H%M%S')}.json"
+        self.stages: dict[str, dict[str, Any]] = {}
+        self.frames: list[_Frame] = []
+        self.samples: Counter = Counter()
+        self.memory_peak = 0
+        self._profiler: cProfile.Profile | None = None
+        self._sampler: threading.Thread | None = None
+        self._stop = threading.Event()
+
+    def start(self) -> None:
+        if "memory" in self.extras:
+            tracemalloc.start()
+        if "stacks" in self.extras:
+            self._sampler = threading.Thread(target=self._sample, args=(threading.main_thread().ident,), daemon=True)
+            self._sampler.start()
+        if "cprofile" in self.extras:
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        self._started = time.perf_counter()
+        self._io = _io_counters()
+
+    def enter(self, name: str) -> None:
+        parent = self.frames[-1] if self.frames else None
+        if "memory" in self.extras:
+            # Each stage's peak is measured from its own reset; the parent
+            # keeps the highest peak seen before the reset.
+            peak = tracemalloc.get_traced_memory()[1]
+            self.memory_peak = max(self.memory_peak, peak)
+            if parent is not None:
+                parent.saved_peak = max(parent.saved_peak, peak)
+            tracemalloc.reset_peak()
+        self.frames.append(_Frame(f"{parent.path}/{name}" if parent else name, _io_counters()))
+
+    def exit(self) -> None:
+        frame = self.frames.pop()
+        seconds = time.perf_counter() - frame.started
+        if self.frames:
+            self.frames[-1].child_seconds += seconds
+
+        record = self.stages.setdefault(
+            frame.path, {"calls": 0, "seconds": 0.0, "self_seconds": 0.0, "bytes_read": None, "bytes_written": None}
+        )
+        record["calls"] += 1
+        record["seconds"] += seconds
+        record["self_seconds"] += seconds - frame.child_seconds
+        io = _io_counters()
+        if frame.io is not None and io is not None:
+            record["bytes_read"] = (record["bytes_read"] or 0) + io[0] - frame.io[0]
+            record["bytes_written"] = (record["bytes_written"] or 0) + io[1] - frame.io[1]
+        if "memory" in self.extras:
+            peak = max(frame.saved_peak, tracemalloc.get_traced_memory()[1])
+            record["memory_peak_bytes"] = max(record.get("memory_peak_bytes", 0), peak)
+
+    def _sample(self, thread_id: int | None) -> None:
+        while not self._stop.wait(SAMPLE_INTERVAL_SECONDS):
+            frame = sys._current_frames().get(thread_id)
+            names = []
+            while frame is not None:
+                code = frame.f_code
+                names.append(f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})")
+                frame = frame.f_back
+            try:
+                stage_path = self.frames[-1].path
+            except IndexError:
+                stage_path = "(no stage)"
+            self.samples[";".join([*stage_path.split("/"), *reversed(names)])] += 1
+
+    def finish(self) -> dict[str, Any]:
+        """Stop collectors, write the report (and any side files) and return it."""
+        total = time.perf_counter() - self._started
+        io = _io_counters()
+        self.output.parent.mkdir(parents=True, exist_ok=True)
+        report: dict[str, Any] = {
+            "script": self.script,
+            "generated_at": self.started_at.isoformat(),
+            "argv": sys.argv[1:],
+            "total_seconds": round(total, 6),
+            "bytes_read": io[0] - self._io[0] if io and self._io else None,
+            "bytes_written": io[1] - self._io[1] if io and self._io else None,
+            "stages": [
+                {
+                    "stage": path,
+                    **record,
+                    "seconds": round(record["seconds"], 6),
+                    "self_seconds": round(record["self_seconds"], 6),
+                    "share": round(record["seconds"] / total, 4) if total else 0.0,
+                }
+                for path, record in self.stages.items()
+            ],
+        }
+
+        if self._profiler is not None:
+            self._profiler.disable()
+            pstats_path = self.output.with_suffix(".pstats")
+            self._profiler.dump_stats(pstats_path)
+            entries = sorted(pstats.Stats(self._profiler).stats.items(), key=lambda entry: entry[1][2], reverse=True)
+            report["pstats_path"] = str(pstats_path)
+            report["cprofile_top"] = [
+                {"function": f"{name} ({Path(filename).name}:{line})", "calls": calls, "tottime": round(tottime, 6), "cumtime": round(cumtime, 6)}
+                for (filename, line, name), (_, calls, tottime, cumtime, _) in entries[:TOP_ENTRIES]
+            ]
+
+        if "memory" in self.extras:
+            snapshot = tracemalloc.take_snapshot()
+            report["memory_peak_bytes"] = max(self.memory_peak, tracemalloc.get_traced_memory()[1])
+            report["memory_top"] = [
+                {"site": str(stat.traceback[0]), "bytes": stat.size, "blocks": stat.count}
+                for stat in snapshot.statistics("lineno")[:TOP_ENTRIES]
+            ]
+            tracemalloc.stop()
+
+        if self._sampler is not None:
+            self._stop.set()
+            self._sampler.join()
+            stacks_path = self.output.with_suffix(".folded")
+            stacks_path.write_text("".join(f"{stack} {count}\n" for stack, count in sorted(self.samples.items())), encoding="utf-8")
+            report["stacks_path"] = str(stacks_path)
+            report["stack_samples"] = sum(self.samples.values())
+
+        self.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        return report
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """Time the enclosed block as a stage of the active profile, if there is one."""
+    profile = _ACTIVE
+    if profile is None:
+        yield
+        return
+    profile.enter(name)
+    try:
+        yield
+    finally:
+        profile.exit()
+
+
+def add_profile_argument(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="",
+        metavar="EXTRAS",
+        help=f"Write a per-stage timing report; EXTRAS is a comma list of {', '.join(PROFILE_EXTRAS)}",
+    )
+    parser.add_argument("--profile-output", type=Path, help="Where to write the --profile report JSON")
+
+
+def print_summary(report: dict[str, Any], path: Path, limit: int = 15) -> None:
+    print(f"Profile of {report['script']}: {report['total_seconds']:.3f}s total, written to {path}")
+    print(f"  {'Stage':<56}{'Calls':>6}{'Seconds':>10}{'Self':>9}{'Share':>7}")
+    for entry in sorted(report["stages"], key=lambda entry: entry["self_seconds"], reverse=True)[:limit]:
+        print(
+            f"  {entry['stage'][:56]:<56}{entry['calls']:>6}{entry['seconds']:>10.3f}"
+            f"{entry['self_seconds']:>9.3f}{entry['share']:>7.0%}"
+        )
+
+
+@contextmanager
+def profiling(script: str, args: argparse.Namespace) -> Iterator[BuildProfile | None]:
+    """Profile the enclosed run when args.profile is set; a no-op otherwise."""
+    global _ACTIVE
+    extras_arg = getattr(args, "profile", None)
+    if extras_arg is None:
+        yield None
+        return
+
+    extras = {extra.strip() for extra in extras_arg.split(",") if extra.strip()}
+    unknown = extras - set(PROFILE_EXTRAS)
+    if unknown:
+        raise SystemExit(f"Unknown --profile extras: {', '.join(sorted(unknown))} (choose from {', '.join(PROFILE_EXTRAS)})")
+
+    profile = BuildProfile(script, extras, getattr(args, "profile_output", None))
+    _ACTIVE = profile
+    profile.start()
+    try:
+        yield profile
+    finally:
+        _ACTIVE = None
+        print_summary(profile.finish(), profile.output)
@@ -59,7 +59,7 @@
     const grid = $("[data-gallery-grid]");
     if (!grid) return;
 
-    const cards = $$("[data-search]", grid);
+    let cards = $$(".cn-gallery-card", grid);
     const search = $("[data-gallery-search]");
     const typeButtons = $$("[data-gallery-type]");
     const sortButtons = $$("[data-gallery-sort]");
@@ -80,6 +80,147 @@
       randomSeed: 0,
     };
 
+    // Sharded builds inline only the first page of frames; the rest are
+    // appended from gallery/page-NNNN.json as the pager or filters need them.
+    const shards = {
+      url: grid.dataset.galleryShards || "",
+      total: Number(grid.dataset.galleryTotal || 0),
+      index: null,
+      loaded: 0,
+      pending: null,
+      queue: Promise.resolve(),
+    };
+
+    function fullyLoaded() {
+      return !shards.url || (shards.index !== null && shards.loaded >= shards.index.shards.length);
+    }
+
+    function isDefaultView() {
+      return !state.search && state.type === "All" && state.model === "All" && state.sort === "newest";
+    }
+
+    function loadShardIndex() {
+      if (!shards.index) {
+        shards.pending = shards.pending || fetch(shards.url)
+          .then((response) => (response.ok ? response.json() : Promise.reject(new Error(response.statusText))))
+          .then((index) => {
+            shards.index = index;
+            return index;
+          });
+        return shards.pending;
+      }
+      return Promise.resolve(shards.index);
+    }
+
+    async function appendShards(frameCount) {
+      if (!shards.url) return;
+      try {
+        const index = await loadShardIndex();
+        while (shards.loaded < index.shards.length && index.inline + shards.loaded * index.shard_size < frameCount) {
+          const response = await fetch(index.shards[shards.loaded]);
+          if (!response.ok) throw new Error(response.statusText);
+          const page = await response.json();
+          grid.insertAdjacentHTML("beforeend", page.cards);
+          shards.loaded += 1;
+        }
+        cards = $$(".cn-gallery-card", grid);
+      } catch (_error) {
+        shards.url = "";
+      }
+    }
+
+    // Search runs against data/gallery-search.json: sorted tokens with
+    // delta-encoded posting lists of frame indices. Every query word must be a
+    // prefix of some token in the frame. The index is fetched on first search;
+    // without it, cards are matched against their own text.
+    const searchIndex = {
+      url: grid.dataset.gallerySearchIndex || "",
+      data: null,
+      pending: null,
+      matches: null,
+      generation: 0,
+    };
+
+    function loadSearchIndex() {
+      if (!searchIndex.pending) {
+        searchIndex.pending = fetch(searchIndex.url)
+          .then((response) => (response.ok ? response.json() : Promise.reject(new Error(response.statusText))))
+          .then((index) => {
+            index.postings = index.postings.map((deltas) => {
+              let position = 0;
+              return deltas.map((delta) => (position += delta));
+            });
+            searchIndex.data = index;
+            return index;
+          });
+      }
+      return searchIndex.pending;
+    }
+
+    function prefixMatches(index, word) {
+      let low = 0;
+      let high = index.tokens.length;
+      while (low < high) {
+        const mid = (low + high) >> 1;
+        if (index.tokens[mid] < word) low = mid + 1;
+        else high = mid;
+      }
+      const found = new Set();
+      for (let position = low; position < index.tokens.length && index.tokens[position].startsWith(word); position += 1) {
+        index.postings[position].forEach((frame) => found.add(frame));
+      }
+      return found;
+    }
+
+    async function updateSearchMatches() {
+      const generation = (searchIndex.generation += 1);
+      const words = state.search.match(/[\p{L}\p{N}]+/gu) || [];
+      if (!searchIndex.url || !words.length) {
+        searchIndex.matches = null;
+        return;
+      }
+      try {
+        const index = await loadSearchIndex();
+        if (generation !== searchIndex.generation) return;
+        searchIndex.matches = words
+          .map((word) => prefixMatches(index, word))
+          .reduce((result, found) => new Set([...result].filter((frame) => found.has(frame))));
+      } catch (_error) {
+        searchIndex.url = "";
+        searchIndex.matches = null;
+      }
+    }
+
+    function ensureLoaded(frameCount) {
+      // Chain loads so overlapping filter changes never append a shard twice.
+      shards.queue = shards.queue.then(() => appendShards(frameCount));
+      return shards.queue;
+    }
+
+    function refresh() {
+      if (fullyLoaded() || (isDefaultView() && cards.length >= state.visibleLimit)) {
+        render();
+        return;
+      }
+      ensureLoaded(isDefaultView() ? state.visibleLimit : Infinity).then(render);
+    }
+
+    async function openDeepLink() {
+      const match = /^#frame-(.+)$/.exec(window.location.hash);
+      if (!match || document.getElementById(`frame-${match[1]}`) || !shards.url) return;
+      try {
+        const index = await loadShardIndex();
+        const position = index.refs.indexOf(match[1]);
+        if (position === -1) return;
+        state.visibleLimit = Math.max(state.visibleLimit, Math.ceil((position + 1) / 24) * 24);
+        await ensureLoaded(position + 1);
+        render();
+        document.getElementById(`frame-${match[1]}`)?.scrollIntoView();
+      } catch (_error) {
+        // Leave the first page in place if the shard index is unavailable.
+      }
+    }
+
     function sortedCards(list) {
       const copy = [...list];
       if (state.sort === "oldest") {
@@ -97,8 +238,10 @@
     }
 
     function matches(card) {
-      const haystack = card.dataset.search || "";
-      const matchesSearch = !state.search || haystack.includes(state.search);
+      const matchesSearch = !state.search
+        || (searchIndex.matches
+          ? searchIndex.matches.has(Number(card.dataset.index))
+          : card.textContent.toLowerCase().includes(state.search));
       const matchesType = state.type === "All" || card.dataset.type === state.type;
       const matchesModel = state.model === "All" || card.dataset.model === state.model;
       return matchesSearch && matchesType && matchesModel;
@@ -120,7 +263,7 @@
         card.setAttribute("aria-posinset", String(index + 1));
       });
 
-      $$("[data-search] .cn-frame__cap--optional", grid).forEach((caption) => {
+      $$(".cn-gallery-card .cn-frame__cap--optional", grid).forEach((caption) => {
         caption.hidden = !state.captions;
       });
 
@@ -130,8 +273,10 @@
         captionToggle.textContent = state.captions ? "Hide prompt captions" : "Show prompt captions";
       }
 
+      const total = fullyLoaded() || !isDefaultView() ? matching.length : shards.total;
+
       if (moreButton) {
-        moreButton.hidden = matching.length <= state.visibleLimit;
+        moreButton.hidden = total <= state.visibleLimit;
       }
 
       if (empty) {
@@ -141,7 +286,7 @@
       if (count) {
         const visible = Math.min(matching.length, state.visibleLimit);
         const start = matching.length ? "0001" : "0000";
-        count.textContent = `${start} - ${String(visible).padStart(4, "0")} of ${String(matching.length).padStart(4, "0")}`;
+        count.textContent = `${start} - ${String(visible).padStart(4, "0")} of ${String(total).padStart(4, "0")}`;
       }
     }
 
@@ -152,17 +297,22 @@
       state.model = "All";
       state.visibleLimit = 24;
       state.randomSeed = 0;
+      searchIndex.generation += 1;
+      searchIndex.matches = null;
       if (search) search.value = "";
       if (modelSelect) modelSelect.value = "All";
       setPressed(typeButtons, typeButtons.find((button) => button.dataset.galleryType === "All"));
       setPressed(sortButtons, sortButtons.find((button) => button.dataset.gallerySort === "newest"));
-      render();
+      refresh();
     }
 
     search?.addEventListener("input", () => {
       state.search = search.value.trim().toLowerCase();
       state.visibleLimit = 24;
-      render();
+      const generation = searchIndex.generation + 1;
+      updateSearchMatches().then(() => {
+        if (generation === searchIndex.generation) refresh();
+      });
     });
 
     typeButtons.forEach((button) => {
@@ -170,7 +320,7 @@
         state.type = button.dataset.galleryType || "All";
         state.visibleLimit = 24;
         setPressed(typeButtons, button);
-        render();
+        refresh();
       });
     });
 
@@ -180,28 +330,30 @@
         state.visibleLimit = 24;
         if (state.sort === "random") state.randomSeed += 1;
         setPressed(sortButtons, button);
-        render();
+        refresh();
       });
     });
 
     modelSelect?.addEventListener("change", () => {
       state.model = modelSelect.value;
       state.visibleLimit = 24;
-      render();
+      refresh();
     });
 
     captionToggle?.addEventListener("click", () => {
       state.captions = !state.captions;
-      render();
+      refresh();
     });
 
     moreButton?.addEventListener("click", () => {
       state.visibleLimit += 24;
-      render();
+      refresh();
     });
 
     resetButtons.forEach((button) => button.addEventListener("click", reset));
+    window.addEventListener("hashchange", openDeepLink);
     render();
+    openDeepLink();
   }
 
   function setupNews() {
@@ -215,6 +367,9 @@
     const clearButtons = $$("[data-news-clear], [data-news-empty-reset]");
     const empty = $("[data-news-empty]");
     const latestDate = rows.length ? new Date(`${rows[0].dataset.digestDate}T00:00:00`) : null;
+    const results = $("[data-news-results]");
+    const resultsList = $("[data-news-results-list]");
+    const resultsTitle = $("[data-news-results-title]");
 
     const state = {
       search: "",
@@ -251,11 +406,125 @@
       clearButtons.forEach((button) => button.classList.toggle("cn-hidden", !hasFilters));
     }
 
+    // Full-archive search runs against data/news-search/: index.json holds the
+    // BM25 constants and maps each term prefix to a terms-*.json shard of
+    // sorted terms with delta-encoded [doc, tf, length] postings; docs-*.json
+    // shards hold the result rows. Only the shards a query touches are
+    // fetched, and each is fetched once. Every query word must prefix a term
+    // in the story; matching stories are ranked by their summed BM25 score.
+    const archive = {
+      url: list.dataset.newsSearchIndex || "",
+      meta: null,
+      files: new Map(),
+      generation: 0,
+    };
+    const ARCHIVE_RESULTS = 20;
+
+    function fetchArchive(file) {
+      const url = file ? archive.url.slice(0, archive.url.lastIndexOf("/") + 1) + file : archive.url;
+      if (!archive.files.has(url)) {
+        archive.files.set(
+          url,
+          fetch(url).then((response) => (response.ok ? response.json() : Promise.reject(new Error(response.statusText))))
+        );
+      }
+      return archive.files.get(url);
+    }
+
+    async function scoreWord(meta, word) {
+      const prefixes = word.length >= meta.prefix
+        ? [word.slice(0, meta.prefix)]
+        : Object.keys(meta.shards).filter((prefix) => prefix.startsWith(word));
+      const scores = new Map();
+      for (const prefix of prefixes) {
+        if (!meta.shards[prefix]) continue;
+        const shard = await fetchArchive(meta.shards[prefix]);
+        let low = 0;
+        let high = shard.terms.length;
+        while (low < high) {
+          const mid = (low + high) >> 1;
+          if (shard.terms[mid] < word) low = mid + 1;
+          else high = mid;
+        }
+        for (let position = low; position < shard.terms.length && shard.terms[position].startsWith(word); position += 1) {
+          const postings = shard.postings[position];
+          const frequency = postings.length / 3;
+          const idf = Math.log(1 + (meta.count - frequency + 0.5) / (frequency + 0.5));
+          let doc = 0;
+          for (let offset = 0; offset < postings.length; offset += 3) {
+            doc += postings[offset];
+            const tf = postings[offset + 1];
+            const norm = 1 - meta.b + (meta.b * postings[offset + 2]) / (meta.avgdl || 1);
+            const score = (idf * tf * (meta.k1 + 1)) / (tf + meta.k1 * norm);
+            scores.set(doc, (scores.get(doc) || 0) + score);
+          }
+        }
+      }
+      return scores;
+    }
+
+    function showArchiveResults(rowsFound, total) {
+      resultsList.replaceChildren(
+        ...rowsFound.map(([title, href, date, page, topic, source, firstSeen]) => {
+          const item = document.createElement("li");
+          const link = document.createElement("a");
+          link.href = href;
+          link.target = "_blank";
+          link.rel = "noopener noreferrer";
+          link.textContent = title;
+          const chip = document.createElement("span");
+          chip.className = "cn-digest__topic";
+          chip.textContent = topic;
+          const digest = document.createElement("a");
+          digest.className = "cn-digest__source";
+          digest.href = page;
+          digest.textContent = firstSeen ? `${firstSeen} - ${date} / ${source}` : `${date} / ${source}`;
+          item.append(link, chip, digest);
+          return item;
+        })
+      );
+      if (resultsTitle) {
+        resultsTitle.textContent = total > rowsFound.length
+          ? `Top ${rowsFound.length} of ${total} matching stories`
+          : `${total} matching ${total === 1 ? "story" : "stories"}`;
+      }
+      results.classList.toggle("cn-hidden", total === 0);
+    }
+
+    async function searchArchive() {
+      if (!archive.url || !results || !resultsList) return;
+      const generation = (archive.generation += 1);
+      const words = (state.search.match(/[\p{L}\p{N}]+/gu) || []).filter((word) => word.length > 1);
+      if (!words.length) {
+        results.classList.add("cn-hidden");
+        return;
+      }
+      try {
+        const meta = await fetchArchive("");
+        const perWord = await Promise.all(words.map((word) => scoreWord(meta, word)));
+        if (generation !== archive.generation) return;
+        const ranked = [...perWord[0].keys()]
+          .filter((doc) => perWord.every((scores) => scores.has(doc)))
+          .map((doc) => [doc, perWord.reduce((sum, scores) => sum + scores.get(doc), 0)])
+          .sort((left, right) => right[1] - left[1]);
+        const top = ranked.slice(0, ARCHIVE_RESULTS).map(([doc]) => doc);
+        const shards = await Promise.all(
+          top.map((doc) => fetchArchive(meta.doc_shards[Math.floor(doc / meta.doc_shard_size)]))
+        );
+        if (generation !== archive.generation) return;
+        showArchiveResults(top.map((doc, index) => shards[index].docs[doc - shards[index].start]), ranked.length);
+      } catch (_error) {
+        archive.url = "";
+        results.classList.add("cn-hidden");
+      }
+    }
+
     function reset() {
       state.search = "";
       state.range = "all";
       state.topic = "All";
       if (search) search.value = "";
+      searchArchive();
       setPressed(rangeButtons, rangeButtons.find((button) => button.dataset.newsRange === "all"));
       setPressed(topicButtons, topicButtons.find((button) => button.dataset.newsTopic === "All"));
       render();
@@ -264,6 +533,7 @@
     search?.addEventListener("input", () => {
       state.search = search.value.trim().toLowerCase();
       render();
+      searchArchive();
     });
 
     rangeButtons.forEach((button) => {
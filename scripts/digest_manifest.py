@@ -0,0 +1,72 @@
+"""
+The news-digests/index.json manifest: every digest file name, newest first.
+
+Digests are named YYYY-MM-DD-digest.md or digest-YYYY-MM-DD.md; anything else
+in the directory is ignored. update-news-digest-index.py writes the manifest
+and validate-site.py checks it, both through build_manifest, so the two can
+never disagree about order. insert_digest and remove_digest keep an existing
+list sorted without rescanning the directory.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from pathlib import Path
+
+
+DIGEST_PATTERN = re.compile(
+    r"(?:(\d{4})-(\d{2})-(\d{2})-digest|digest-(\d{4})-(\d{2})-(\d{2}))\.md$"
+)
+
+
+def digest_sort_key(name: str) -> tuple[int, str]:
+    match = DIGEST_PATTERN.match(name)
+    if not match:
+        return (0, name)
+
+    year = int(match.group(1) or match.group(4))
+    month = int(match.group(2) or match.group(5))
+    day = int(match.group(3) or match.group(6))
+    return (year * 10000 + month * 100 + day, name)
+
+
+def build_manifest(directory: Path) -> dict[str, list[str]]:
+    """Scan directory for digests and return the manifest payload."""
+    names = [path.name for path in directory.glob("*.md") if DIGEST_PATTERN.match(path.name)]
+    return {"files": sorted(names, key=digest_sort_key, reverse=True)}
+
+
+def render_manifest(manifest: dict[str, list[str]]) -> str:
+    return json.dumps(manifest, indent=2, ensure_ascii=False) + "\n"
+
+
+def _position(files: list[str], name: str) -> int:
+    """Index of the first entry in the newest-first files list that sorts at or below name."""
+    key = digest_sort_key(name)
+    low, high = 0, len(files)
+    while low < high:
+        middle = (low + high) // 2
+        if digest_sort_key(files[middle]) > key:
+            low = middle + 1
+        else:
+            high = middle
+    return low
+
+
+def insert_digest(files: list[str], name: str) -> bool:
+    """Insert name at its sorted position; returns False when it is already listed."""
+    index = _position(files, name)
+    if index < len(files) and files[index] == name:
+        return False
+    files.insert(index, name)
+    return True
+
+
+def remove_digest(files: list[str], name: str) -> bool:
+    """Remove name from files; returns False when it was not listed."""
+    index = _position(files, name)
+    if index < len(files) and files[index] == name:
+        del files[index]
+        return True
+    return False
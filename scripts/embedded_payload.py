@@ -0,0 +1,97 @@
+"""
+Splice the embedded gallery payload in gallery.js.
+
+gallery.js carries a copy of data/gallery.json for file:// access:
+
+    // @embedded-payload-start
+    const embeddedData = {...};
+    // @embedded-payload-end
+
+The sentinel comment lines let a rewrite find the block with two bytes.find()
+calls and swap it without decoding the rest of the file. Files written before
+the sentinels existed are located once by parsing the object literal with
+json.JSONDecoder.raw_decode (so braces inside prompt strings are harmless) and
+gain the sentinels on that write. Writes go through site_io.write_chunks:
+atomic, and skipped when the bytes would not change.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from gallery_data import iter_payload_chunks
+from site_io import write_chunks
+
+
+START_SENTINEL = b"// @embedded-payload-start\n"
+END_SENTINEL = b"// @embedded-payload-end\n"
+_DECODER = json.JSONDecoder()
+
+
+def _statement_chunks(variable: str, items: Iterable[dict[str, Any]]) -> Iterator[bytes]:
+    yield START_SENTINEL
+    yield f"const {variable} = ".encode("utf-8")
+    # The payload ends with a newline; hold each chunk back one step so the
+    # last one can be trimmed before the closing semicolon.
+    previous = None
+    for chunk in iter_payload_chunks(items, ensure_ascii=False):
+        if previous is not None:
+            yield previous.encode("utf-8")
+        previous = chunk
+    yield (previous or "").rstrip("\n").encode("utf-8") + b";\n"
+    yield END_SENTINEL
+
+
+def locate_block(data: bytes, variable: str = "embeddedData") -> tuple[int, int]:
+    """Return the byte span [start, end) of the embedded block in data.
+
+    The span covers the sentinel lines when present; otherwise it covers the
+    `const <variable> = {...};` statement and its trailing newline. Raises
+    ValueError when no block can be found.
+    """
+    start = data.find(START_SENTINEL)
+    if start != -1:
+        end = data.find(END_SENTINEL, start)
+        if end == -1:
+            raise ValueError("embedded payload start sentinel has no matching end sentinel")
+        return start, end + len(END_SENTINEL)
+
+    marker = f"const {variable} = ".encode("utf-8")
+    start = data.find(marker)
+    if start == -1:
+        raise ValueError(f"could not find the {variable} block")
+    literal_start = start + len(marker)
+    text = data[literal_start:].decode("utf-8")
+    try:
+        _, literal_end = _DECODER.raw_decode(text)
+    except json.JSONDecodeError as exc:
+        raise ValueError(f"{variable} is not a JSON object literal: {exc}") from exc
+    end = literal_start + len(text[:literal_end].encode("utf-8"))
+    for terminator in (b";", b"\n"):
+        if data[end:end + 1] == terminator:
+            end += 1
+    return start, end
+
+
+def splice_embedded_payload(
+    path: Path,
+    items: Iterable[dict[str, Any]],
+    variable: str = "embeddedData",
+    apply: bool = True,
+) -> bool:
+    """Replace the embedded {"items": [...]} block in path; returns True when it changed.
+
+    With apply=False nothing is written and the return value reports whether
+    a write would have changed the file.
+    """
+    data = path.read_bytes()
+    start, end = locate_block(data, variable)
+
+    def chunks() -> Iterator[bytes]:
+        yield data[:start]
+        yield from _statement_chunks(variable, items)
+        yield data[end:]
+
+    return write_chunks(path, chunks(), apply=apply)
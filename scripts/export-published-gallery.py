@@ -5,18 +5,38 @@ Rebuild the Axy Lusion website gallery export from the published Midjourney arch
 The current upstream inventory lives in universal.db. The current site export still
 contains richer display metadata for created dates, model labels, and tags, so this
 script merges rather than blindly overwrites.
+
+With --incremental, only gallery_items rows changed since the last applied sync
+(by updated_at, plus any new rowids) and items whose gallery_tags changed are read
+and patched into the existing export. The high-water mark and a per-item tag hash
+are kept in .cache/published-gallery-sync.json. The script falls back to a full
+sync when there is no usable mark, or when the patched export's size disagrees
+with the published row count (a hard delete).
+
+The database is opened read-only (mode=ro) and rows are streamed from a single
+items-to-tags join, so an export never blocks the processes writing to it. Pass
+--checkpoint to run PRAGMA wal_checkpoint(FULL) on a separate connection first.
 """
 
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import re
 import sqlite3
 from collections import Counter
 from datetime import datetime, timezone
+from itertools import groupby
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
+
+from build_profile import add_profile_argument, profiling, stage
+from embedded_payload import splice_embedded_payload
+from gallery_data import iter_items, render_items, write_items
+from hashed_payload import render_payload, write_hashed_payload
+from payload_projection import field_size_report, print_size_report, project_items
+from site_io import write_text
 
 
 PROJECT_DIR = Path(__file__).resolve().parent.parent
@@ -24,69 +44,296 @@ DEFAULT_DB_PATH = Path(r"W:\Agent Workspace\System\Data\universal.db")
 GALLERY_JSON_PATH = PROJECT_DIR / "data" / "gallery.json"
 GALLERY_JS_PATH = PROJECT_DIR / "gallery.js"
 REPORT_PATH = PROJECT_DIR / "data" / "published-gallery-sync-report.json"
-
-
-def load_existing_export(path: Path) -> list[dict[str, Any]]:
-    payload = json.loads(path.read_text(encoding="utf-8"))
-    if isinstance(payload, dict):
-        return list(payload.get("items", []))
-    return list(payload)
-
-
-def run_checkpoint(connection: sqlite3.Connection) -> list[Any] | None:
+SYNC_STATE_PATH = PROJECT_DIR / ".cache" / "published-gallery-sync.json"
+SYNC_STATE_VERSION = 3
+ITEM_FIELDS = (
+    "id",
+    "name",
+    "type",
+    "source",
+    "model",
+    "url",
+    "cdn_url",
+    "thumbnail_url",
+    "prompt",
+    "parameters",
+    "dimensions",
+    "status",
+    "created",
+    "created_at",
+    "updated_at",
+    "deleted_at",
+)
+PUBLISHED_FILTER = "i.source = 'midjourney' AND i.status = 'published' AND i.deleted_at IS NULL"
+# Stay well under SQLite's bound-parameter limit.
+ID_CHUNK_SIZE = 500
+PLACEHOLDER_CREATED = "2026-02-10"
+
+
+def load_existing_export(path: Path) -> Iterator[dict[str, Any]]:
+    """Stream the current export; the merges read it once, in order."""
+    return iter_items(path)
+
+
+def run_checkpoint(db_path: Path) -> list[Any] | None:
+    """PRAGMA wal_checkpoint(FULL) on a short-lived read-write connection of its own."""
+    try:
+        connection = sqlite3.connect(db_path)
+    except sqlite3.DatabaseError:
+        return None
     try:
         row = connection.execute("PRAGMA wal_checkpoint(FULL)").fetchone()
         return list(row) if row is not None else None
     except sqlite3.DatabaseError:
         return None
+    finally:
+        connection.close()
 
 
-def load_db_items(db_path: Path, checkpoint: bool) -> tuple[list[dict[str, Any]], dict[str, list[str]], list[Any] | None]:
-    connection = sqlite3.connect(db_path)
+def open_db(db_path: Path) -> sqlite3.Connection:
+    # Read-only, so the export never takes a write lock, and autocommit, so
+    # main() can hold one explicit read transaction and every query
+    # (including the sync marks) sees the same snapshot.
+    connection = sqlite3.connect(f"{db_path.resolve().as_uri()}?mode=ro", uri=True, isolation_level=None)
     connection.row_factory = sqlite3.Row
-    checkpoint_result = run_checkpoint(connection) if checkpoint else None
+    return connection
+
+
+def iter_db_items(
+    connection: sqlite3.Connection, where: str = PUBLISHED_FILTER, params: Iterable[Any] = ()
+) -> Iterator[tuple[dict[str, Any], list[str]]]:
+    """Yield (item, tags) for the matching gallery_items rows in created_at order.
+
+    One LEFT JOIN against gallery_tags returns a row per (item, tag), so the
+    cursor is grouped by item id as it streams; only the current item's rows
+    are held at a time.
+    """
+    columns = ", ".join(f"i.{field}" for field in ITEM_FIELDS)
+    cursor = connection.execute(
+        f"""
+        SELECT {columns}, t.tag AS tag
+        FROM gallery_items AS i
+        LEFT JOIN gallery_tags AS t ON t.item_id = i.id
+        WHERE {where}
+        ORDER BY i.created_at ASC, i.id ASC, t.tag ASC
+        """,
+        tuple(params),
+    )
+    for _, rows in groupby(cursor, key=lambda row: row["id"]):
+        first = next(rows)
+        tags = [first["tag"]] if first["tag"] is not None else []
+        tags.extend(row["tag"] for row in rows if row["tag"] is not None)
+        yield {field: first[field] for field in ITEM_FIELDS}, tags
+
+
+class ExportStats:
+    """Membership, drift and top-N figures for the report, tallied one item at a time.
+
+    The merge feeds every DB row it reads to add_db_row and every item it
+    emits to add_export_item, so the report never rescans the item lists.
+    """
+
+    def __init__(self) -> None:
+        self.db: Counter = Counter()
+        self.export: Counter = Counter()
+        self.models: Counter = Counter()
+        self.created: Counter = Counter()
+        self.tags: Counter = Counter()
+        self.existing = 0
+        self.json_only = 0
+        self.db_only = 0
+
+    def add_db_row(self, item: dict[str, Any], tags: list[str]) -> None:
+        self.db["rows"] += 1
+        self.db["missing_model"] += not str(item.get("model") or "").strip()
+        self.db["nonempty_created"] += bool(str(item.get("created") or "").strip())
+        self.db["missing_parameters"] += not str(item.get("parameters") or "").strip()
+        self.db["tagged"] += bool(tags)
+
+    def add_export_item(self, item: dict[str, Any]) -> None:
+        created = item.get("created")
+        tags = item.get("tags") or []
+        self.export["items"] += 1
+        self.export["nonempty_created"] += bool(str(created or "").strip())
+        self.export["placeholder_created"] += created == PLACEHOLDER_CREATED
+        self.export["missing_parameters"] += not str(item.get("parameters") or "").strip()
+        self.export["tagged"] += bool(tags)
+        self.models[item.get("model") or "__EMPTY__"] += 1
+        self.created[created or "__EMPTY__"] += 1
+        self.tags.update(tags)
+
+
+def read_sync_marks(connection: sqlite3.Connection) -> dict[str, Any]:
+    """High-water marks for gallery_items plus read_tag_hashes for gallery_tags."""
+    items = connection.execute(
+        "SELECT max(updated_at), max(rowid) FROM gallery_items WHERE source = 'midjourney'"
+    ).fetchone()
+    published = connection.execute(f"SELECT count(*) FROM gallery_items AS i WHERE {PUBLISHED_FILTER}").fetchone()
+    boundary = connection.execute(
+        "SELECT id FROM gallery_items WHERE source = 'midjourney' AND updated_at = ? ORDER BY id",
+        (items[0],),
+    ).fetchall()
+    return {
+        "high_water": items[0],
+        "boundary_ids": [row["id"] for row in boundary],
+        "max_rowid": items[1],
+        "tag_hashes": read_tag_hashes(connection),
+        "published": published[0],
+    }
+
+
+def read_tag_hashes(connection: sqlite3.Connection) -> dict[str, str]:
+    """A short content hash of each item's gallery_tags rows, keyed by item id.
+
+    gallery_tags has no updated_at, so an added, removed or renamed tag is
+    found by comparing these against the last applied sync's; only the items
+    whose hash moved are re-read. SQLite concatenates each item's tags in
+    one grouped pass, so Python hashes once per item, not once per row.
+    """
+    cursor = connection.execute("SELECT item_id, group_concat(tag, char(0)) FROM gallery_tags GROUP BY item_id")
+    return {
+        item_id: hashlib.blake2b("\0".join(sorted(tags.split("\0"))).encode("utf-8"), digest_size=8).hexdigest()
+        for item_id, tags in cursor
+    }
+
+
+def changed_tag_items(state: dict[str, Any], marks: dict[str, Any]) -> set[str]:
+    """Ids whose tags differ between the recorded sync and now, dropped tag sets included."""
+    before = state.get("tag_hashes") or {}
+    after = marks["tag_hashes"]
+    return {item_id for item_id in before.keys() | after.keys() if before.get(item_id) != after.get(item_id)}
+
+
+def load_sync_state(path: Path, db_path: Path) -> dict[str, Any] | None:
+    try:
+        state = json.loads(path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+    if not isinstance(state, dict) or state.get("version") != SYNC_STATE_VERSION or state.get("db") != str(db_path):
+        return None
+    return state
+
 
-    item_rows = connection.execute(
+def save_sync_state(path: Path, db_path: Path, marks: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    write_text(path, json.dumps({"version": SYNC_STATE_VERSION, "db": str(db_path), **marks}, indent=2) + "\n")
+
+
+def load_changed_items(
+    connection: sqlite3.Connection, state: dict[str, Any], tag_ids: Iterable[str] = ()
+) -> list[tuple[dict[str, Any], list[str]]]:
+    """(item, tags) for rows touched since the recorded marks, whatever their status.
+
+    Rows stamped exactly at the old high-water mark are compared against the
+    ids recorded there, so a row written in that same instant after the last
+    run is still picked up while the ones already synced are skipped.
+    tag_ids (see changed_tag_items) are re-read as well, whether or not
+    their gallery_items row moved.
+    """
+    high_water = state.get("high_water") or ""
+    synced_at_mark = set(state.get("boundary_ids") or [])
+    candidates = connection.execute(
         """
-        SELECT
-            id,
-            name,
-            type,
-            source,
-            model,
-            url,
-            cdn_url,
-            thumbnail_url,
-            prompt,
-            parameters,
-            dimensions,
-            status,
-            created,
-            created_at,
-            updated_at,
-            deleted_at
+        SELECT id, updated_at
         FROM gallery_items
         WHERE source = 'midjourney'
-          AND status = 'published'
-          AND deleted_at IS NULL
-        ORDER BY created_at ASC, id ASC
-        """
+          AND (updated_at >= ? OR rowid > ?)
+        """,
+        (high_water, state.get("max_rowid") or 0),
     ).fetchall()
+    ids = {row["id"] for row in candidates if not (row["updated_at"] == high_water and row["id"] in synced_at_mark)}
+    ids = sorted(ids.union(tag_ids))
 
-    tag_rows = connection.execute(
-        """
-        SELECT item_id, tag
-        FROM gallery_tags
-        ORDER BY item_id ASC, tag ASC
-        """
-    ).fetchall()
-    connection.close()
+    changed: list[tuple[dict[str, Any], list[str]]] = []
+    for start in range(0, len(ids), ID_CHUNK_SIZE):
+        chunk = ids[start:start + ID_CHUNK_SIZE]
+        placeholders = ", ".join("?" for _ in chunk)
+        changed.extend(iter_db_items(connection, f"i.source = 'midjourney' AND i.id IN ({placeholders})", chunk))
+
+    changed.sort(key=lambda entry: (entry[0]["created_at"] or "", entry[0]["id"]))
+    return changed
 
-    tags_by_item: dict[str, list[str]] = {}
-    for row in tag_rows:
-        tags_by_item.setdefault(row["item_id"], []).append(row["tag"])
 
-    return [dict(row) for row in item_rows], tags_by_item, checkpoint_result
+def is_published(row: dict[str, Any]) -> bool:
+    return row.get("source") == "midjourney" and row.get("status") == "published" and row.get("deleted_at") is None
+
+
+def patch_export(
+    existing_items: Iterable[dict[str, Any]],
+    changed_rows: list[tuple[dict[str, Any], list[str]]],
+    stats: ExportStats,
+) -> list[dict[str, Any]]:
+    """Apply changed (item, tags) rows to the export, keeping its order.
+
+    Updated items are merged in place, unpublished or soft-deleted ones are
+    dropped, and newly published ones are appended in created_at order, the
+    same order a full sync produces. Changed rows and every resulting item
+    are tallied into stats.
+    """
+    changed: dict[str, tuple[dict[str, Any], list[str]]] = {}
+    for row, tags in changed_rows:
+        stats.add_db_row(row, tags)
+        changed[row["id"]] = (row, tags)
+
+    patched: list[dict[str, Any]] = []
+    for item in existing_items:
+        stats.existing += 1
+        entry = changed.pop(item["id"], None)
+        if entry is not None and not is_published(entry[0]):
+            stats.json_only += 1
+            continue
+        if entry is not None:
+            item = merge_item(entry[0], item, entry[1])
+        stats.add_export_item(item)
+        patched.append(item)
+    for row, tags in changed_rows:
+        if row["id"] in changed and is_published(row):
+            item = merge_item(row, {}, tags)
+            stats.db_only += 1
+            stats.add_export_item(item)
+            patched.append(item)
+    return patched
+
+
+def merge_export(
+    existing_items: Iterable[dict[str, Any]],
+    db_rows: Iterable[tuple[dict[str, Any], list[str]]],
+    stats: ExportStats,
+) -> list[dict[str, Any]]:
+    """Merge streamed (item, tags) rows into the export order used by a full sync.
+
+    Items already in the export keep their position; new ones follow in the
+    order the rows arrive (created_at). One pass over the rows indexes them
+    by id, and one pass over the streamed export merges them in order,
+    tallies the emitted items and counts the ones the DB no longer
+    publishes, so the whole merge is O(n) and the old export is never held
+    in memory next to the new one.
+    """
+    rows: dict[str, tuple[dict[str, Any], list[str]]] = {}
+    for row, tags in db_rows:
+        stats.add_db_row(row, tags)
+        rows[row["id"]] = (row, tags)
+
+    merged: list[dict[str, Any]] = []
+    seen: set[str] = set()
+    for existing in existing_items:
+        stats.existing += 1
+        entry = rows.get(existing["id"])
+        if entry is None:
+            stats.json_only += 1
+            continue
+        seen.add(existing["id"])
+        item = merge_item(entry[0], existing, entry[1])
+        stats.add_export_item(item)
+        merged.append(item)
+    for item_id, (row, tags) in rows.items():
+        if item_id in seen:
+            continue
+        item = merge_item(row, {}, tags)
+        stats.db_only += 1
+        stats.add_export_item(item)
+        merged.append(item)
+    return merged
 
 
 def unique_strings(values: list[Any]) -> list[str]:
@@ -175,95 +422,51 @@ def merge_item(db_item: dict[str, Any], existing_item: dict[str, Any], db_tags:
     return merged
 
 
-def render_gallery_json(items: list[dict[str, Any]]) -> str:
-    return json.dumps({"items": items}, indent=2, ensure_ascii=False) + "\n"
-
-
-def update_gallery_js(items: list[dict[str, Any]], path: Path, apply_changes: bool) -> bool:
-    content = path.read_text(encoding="utf-8")
-    start_marker = "const embeddedData = {"
-    start_index = content.find(start_marker)
-    if start_index == -1:
-        raise RuntimeError("Could not find embeddedData block in gallery.js")
-
-    brace_index = start_index + len(start_marker) - 1
-    brace_count = 0
-    end_index = brace_index
-    for index in range(brace_index, len(content)):
-        if content[index] == "{":
-            brace_count += 1
-        elif content[index] == "}":
-            brace_count -= 1
-            if brace_count == 0:
-                end_index = index + 1
-                break
-
-    if end_index < len(content) and content[end_index] == ";":
-        end_index += 1
-
-    replacement = f"const embeddedData = {json.dumps({'items': items}, indent=2, ensure_ascii=False)};"
-    new_content = content[:start_index] + replacement + content[end_index:]
-
-    changed = new_content != content
-    if apply_changes and changed:
-        path.write_text(new_content, encoding="utf-8")
-    return changed
-
-
-def write_if_changed(path: Path, content: str, apply_changes: bool) -> bool:
-    existing = path.read_text(encoding="utf-8")
-    changed = existing != content
-    if apply_changes and changed:
-        path.write_text(content, encoding="utf-8")
-    return changed
-
-
 def build_report(
     db_path: Path,
     checkpoint_result: list[Any] | None,
-    existing_items: list[dict[str, Any]],
-    db_items: list[dict[str, Any]],
-    merged_items: list[dict[str, Any]],
-    tags_by_item: dict[str, list[str]],
+    existing_count: int,
+    stats: ExportStats,
     json_changed: bool,
     js_changed: bool,
+    payload_changed: bool,
     apply_changes: bool,
+    sync: dict[str, Any],
+    db_published: int,
 ) -> dict[str, Any]:
-    existing_by_id = {item["id"]: item for item in existing_items}
-    db_by_id = {item["id"]: item for item in db_items}
-
-    json_only = sorted(set(existing_by_id) - set(db_by_id))
-    db_only = sorted(set(db_by_id) - set(existing_by_id))
-    merged_tag_counter = Counter(tag for item in merged_items for tag in (item.get("tags") or []))
-
+    # The merged export holds exactly the published rows, so membership is
+    # measured against it; after an incremental sync the db_* drift figures
+    # only cover the rows that were read.
     return {
         "generated_at": datetime.now(timezone.utc).isoformat(),
         "db_path": str(db_path),
         "checkpoint_result": checkpoint_result,
         "apply_changes": apply_changes,
+        "sync": sync,
         "membership": {
-            "existing_export_items": len(existing_items),
-            "db_items": len(db_items),
-            "merged_items": len(merged_items),
-            "json_only": len(json_only),
-            "db_only": len(db_only),
+            "existing_export_items": existing_count,
+            "db_items": db_published,
+            "merged_items": stats.export["items"],
+            "json_only": stats.json_only,
+            "db_only": stats.db_only,
         },
         "drift": {
-            "db_missing_model": sum(1 for item in db_items if not str(item.get("model") or "").strip()),
-            "db_nonempty_created": sum(1 for item in db_items if str(item.get("created") or "").strip()),
-            "db_missing_parameters": sum(1 for item in db_items if not str(item.get("parameters") or "").strip()),
-            "db_tagged_items": len(tags_by_item),
-            "export_nonempty_created": sum(1 for item in merged_items if str(item.get("created") or "").strip()),
-            "export_placeholder_created_2026_02_10": sum(1 for item in merged_items if item.get("created") == "2026-02-10"),
-            "export_missing_parameters": sum(1 for item in merged_items if not str(item.get("parameters") or "").strip()),
-            "export_tagged_items": sum(1 for item in merged_items if item.get("tags")),
+            "db_missing_model": stats.db["missing_model"],
+            "db_nonempty_created": stats.db["nonempty_created"],
+            "db_missing_parameters": stats.db["missing_parameters"],
+            "db_tagged_items": stats.db["tagged"],
+            "export_nonempty_created": stats.export["nonempty_created"],
+            "export_placeholder_created_2026_02_10": stats.export["placeholder_created"],
+            "export_missing_parameters": stats.export["missing_parameters"],
+            "export_tagged_items": stats.export["tagged"],
         },
-        "top_models": Counter((item.get("model") or "__EMPTY__") for item in merged_items).most_common(8),
-        "top_created": Counter((item.get("created") or "__EMPTY__") for item in merged_items).most_common(8),
-        "top_tags": merged_tag_counter.most_common(12),
+        "top_models": stats.models.most_common(8),
+        "top_created": stats.created.most_common(8),
+        "top_tags": stats.tags.most_common(12),
         "file_actions": {
             "gallery_json_would_change": json_changed,
             "gallery_js_would_change": js_changed,
+            "hashed_payload_would_change": payload_changed,
         },
     }
 
@@ -271,51 +474,95 @@ def build_report(
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Rebuild the published Midjourney gallery export for Axy Lusion.")
     parser.add_argument("--db", type=Path, default=DEFAULT_DB_PATH, help="Path to universal.db")
-    parser.add_argument("--apply", action="store_true", help="Write gallery.json and gallery.js")
-    parser.add_argument("--skip-checkpoint", action="store_true", help="Skip PRAGMA wal_checkpoint(FULL)")
+    parser.add_argument("--apply", action="store_true", help="Write gallery.json, gallery.js and the hashed payload")
+    parser.add_argument("--precompress", action="store_true", help="Also write .gz/.br copies of the hashed payload")
+    parser.add_argument("--size-report", action="store_true", help="Print bytes per field in gallery.json vs the browser payload")
+    parser.add_argument(
+        "--checkpoint",
+        action="store_true",
+        help="Run PRAGMA wal_checkpoint(FULL) on a separate read-write connection before reading",
+    )
+    parser.add_argument(
+        "--skip-checkpoint",
+        action="store_true",
+        help="Accepted for older callers; skipping the checkpoint is now the default",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only read rows changed since the last applied sync and patch them into the export",
+    )
+    parser.add_argument("--state-path", type=Path, default=SYNC_STATE_PATH, help="Where the incremental high-water mark is kept")
     parser.add_argument("--report-path", type=Path, default=REPORT_PATH, help="Where to write the sync report JSON")
+    add_profile_argument(parser)
     return parser.parse_args()
 
 
-def main() -> int:
-    args = parse_args()
-
-    existing_items = load_existing_export(GALLERY_JSON_PATH)
-    db_items, tags_by_item, checkpoint_result = load_db_items(args.db, checkpoint=not args.skip_checkpoint)
-
-    existing_by_id = {item["id"]: item for item in existing_items}
-    ordered_ids = [item["id"] for item in existing_items if item["id"] in {row["id"] for row in db_items}]
-    ordered_ids.extend(row["id"] for row in db_items if row["id"] not in existing_by_id)
+def run(args: argparse.Namespace) -> int:
+    checkpoint_result = None
+    if args.checkpoint and not args.skip_checkpoint:
+        with stage("checkpoint"):
+            checkpoint_result = run_checkpoint(args.db)
+    connection = open_db(args.db)
+
+    connection.execute("BEGIN")
+    with stage("sync-marks"):
+        marks = read_sync_marks(connection)
+    state = load_sync_state(args.state_path, args.db) if args.incremental else None
+    sync = {"mode": "full", "reason": "requested" if not args.incremental else "no usable sync state"}
+
+    merged_items: list[dict[str, Any]] | None = None
+    if state is not None:
+        stats = ExportStats()
+        tag_ids = changed_tag_items(state, marks)
+        with stage("incremental-merge"):
+            changed_rows = load_changed_items(connection, state, tag_ids)
+            merged_items = patch_export(load_existing_export(GALLERY_JSON_PATH), changed_rows, stats)
+        if len(merged_items) == marks["published"]:
+            sync = {"mode": "incremental", "rows_read": stats.db["rows"], "removed": stats.json_only, "tags_changed": len(tag_ids)}
+        else:
+            sync["reason"] = f"patched export has {len(merged_items)} items, DB publishes {marks['published']}"
+            merged_items = None
+
+    if merged_items is None:
+        stats = ExportStats()
+        with stage("merge"):
+            merged_items = merge_export(load_existing_export(GALLERY_JSON_PATH), iter_db_items(connection), stats)
+        sync["rows_read"] = stats.db["rows"]
+
+    connection.execute("COMMIT")
+    connection.close()
 
-    db_by_id = {item["id"]: item for item in db_items}
-    merged_items = [
-        merge_item(db_by_id[item_id], existing_by_id.get(item_id, {}), tags_by_item.get(item_id, []))
-        for item_id in ordered_ids
-    ]
-
-    gallery_json_changed = write_if_changed(
-        GALLERY_JSON_PATH,
-        render_gallery_json(merged_items),
-        apply_changes=args.apply,
-    )
-    gallery_js_changed = update_gallery_js(merged_items, GALLERY_JS_PATH, apply_changes=args.apply)
+    with stage("write-gallery-json"):
+        gallery_json_changed = write_items(GALLERY_JSON_PATH, merged_items, apply=args.apply)
+    # gallery.js no longer embeds the items; browsers load the hashed payload.
+    with stage("write-gallery-js"):
+        gallery_js_changed = splice_embedded_payload(GALLERY_JS_PATH, [], apply=args.apply)
+    with stage("write-hashed-payload"):
+        payload_changed = write_hashed_payload(merged_items, precompress=args.precompress, apply=args.apply)
+    if args.apply:
+        # Only an applied sync moves the mark; dry runs must not skip rows.
+        save_sync_state(args.state_path, args.db, marks)
 
     report = build_report(
         db_path=args.db,
         checkpoint_result=checkpoint_result,
-        existing_items=existing_items,
-        db_items=db_items,
-        merged_items=merged_items,
-        tags_by_item=tags_by_item,
+        existing_count=stats.existing,
+        stats=stats,
         json_changed=gallery_json_changed,
         js_changed=gallery_js_changed,
+        payload_changed=payload_changed,
         apply_changes=args.apply,
+        sync=sync,
+        db_published=marks["published"],
     )
     args.report_path.write_text(json.dumps(report, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
 
     print("Published gallery sync summary")
     print("=" * 40)
     print(f"DB path: {args.db}")
+    print(f"Sync mode: {sync['mode']}" + (f" ({sync['reason']})" if "reason" in sync else ""))
+    print(f"DB rows read: {sync['rows_read']}")
     print(f"Items in DB: {report['membership']['db_items']}")
     print(f"Items in export: {report['membership']['merged_items']}")
     print(f"DB tagged items: {report['drift']['db_tagged_items']}")
@@ -323,10 +570,25 @@ def main() -> int:
     print(f"Export placeholder date count (2026-02-10): {report['drift']['export_placeholder_created_2026_02_10']}")
     print(f"gallery.json would change: {report['file_actions']['gallery_json_would_change']}")
     print(f"gallery.js would change: {report['file_actions']['gallery_js_would_change']}")
+    print(f"Hashed payload would change: {report['file_actions']['hashed_payload_would_change']}")
     print(f"Report written to: {args.report_path}")
 
+    if args.size_report:
+        print()
+        print_size_report(
+            field_size_report(merged_items, project_items(merged_items, "gallery")),
+            total_before=len(render_items(merged_items).encode("utf-8")),
+            total_after=len(render_payload(merged_items)),
+        )
+
     return 0
 
 
+def main() -> int:
+    args = parse_args()
+    with profiling("export-published-gallery", args):
+        return run(args)
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
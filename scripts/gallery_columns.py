@@ -0,0 +1,276 @@
+"""
+Columnar sidecar for data/gallery.json.
+
+Most consumers only need a handful of short fields (id, ref, created, media
+URLs, model labels) but parsing gallery.json builds the full object graph,
+prompts and tags included. This module writes those fields into a compact
+binary sidecar (.cache/gallery.columns) and reads it back through mmap:
+
+  - text columns are a uint32 offset array plus one UTF-8 blob
+  - low-cardinality columns (model, source, type) are a string table plus a
+    uint16/uint32 code array
+
+Nothing is decoded until a value is asked for, so loading the id column is a
+stat, an mmap and a slice per row. The sidecar records the size, mtime and
+sha256 of the gallery.json it was built from; open_columns() rebuilds it from
+the JSON whenever that no longer matches. When only the mtime moved (a touch
+or a checkout) and the hash still matches, the recorded mtime is updated so
+later opens take the stat-only path again.
+
+Missing or non-string values are stored as empty strings. Rows only expose
+the stored columns: asking a row for any other field raises KeyError, even
+through .get(), because the value may well exist in gallery.json.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import struct
+import sys
+from array import array
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import Any, Iterator
+
+from gallery_data import iter_items
+from site_io import file_sha256, write_chunks
+
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+GALLERY_PATH = PROJECT_DIR / "data" / "gallery.json"
+COLUMNS_PATH = PROJECT_DIR / ".cache" / "gallery.columns"
+MAGIC = b"AXYCOLS1"
+FORMAT_VERSION = 2
+TEXT_COLUMNS = ("id", "ref", "created", "name", "cdn_url", "url", "image", "src")
+DICT_COLUMNS = ("model", "source", "type")
+
+
+def _text(value: Any) -> str:
+    return value if isinstance(value, str) else ""
+
+
+def _source_stamp(source: Path) -> dict[str, Any]:
+    stat = source.stat()
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def _header_chunk(header: dict[str, Any]) -> bytes:
+    """MAGIC, the header length and the JSON header, padded so the segments start 8-byte aligned."""
+    encoded = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    encoded += b" " * (-(len(MAGIC) + 4 + len(encoded)) % 8)
+    return MAGIC + struct.pack("<I", len(encoded)) + encoded
+
+
+def build_columns(source: Path = GALLERY_PATH, target: Path = COLUMNS_PATH) -> None:
+    """Write the columnar sidecar for source, streaming items from the JSON."""
+    offsets = {name: array("I", [0]) for name in TEXT_COLUMNS}
+    blobs = {name: bytearray() for name in TEXT_COLUMNS}
+    tables: dict[str, dict[str, int]] = {name: {} for name in DICT_COLUMNS}
+    codes: dict[str, list[int]] = {name: [] for name in DICT_COLUMNS}
+    rows = 0
+
+    for item in iter_items(source):
+        rows += 1
+        for name in TEXT_COLUMNS:
+            blobs[name] += _text(item.get(name)).encode("utf-8")
+            offsets[name].append(len(blobs[name]))
+        for name in DICT_COLUMNS:
+            table = tables[name]
+            codes[name].append(table.setdefault(_text(item.get(name)), len(table)))
+
+    segments: list[bytes] = []
+    columns: dict[str, Any] = {}
+    position = 0
+
+    def add_segment(data: bytes) -> list[int]:
+        nonlocal position
+        padded = data + b"\0" * (-len(data) % 8)
+        segments.append(padded)
+        span = [position, len(data)]
+        position += len(padded)
+        return span
+
+    for name in TEXT_COLUMNS:
+        columns[name] = {"kind": "text", "offsets": add_segment(offsets[name].tobytes()), "data": add_segment(bytes(blobs[name]))}
+    for name in DICT_COLUMNS:
+        typecode = "H" if len(tables[name]) <= 0xFFFF else "I"
+        columns[name] = {"kind": "dict", "table": list(tables[name]), "typecode": typecode, "codes": add_segment(array(typecode, codes[name]).tobytes())}
+
+    header = {
+        "version": FORMAT_VERSION,
+        "byteorder": sys.byteorder,
+        "rows": rows,
+        "source": {**_source_stamp(source), "sha256": file_sha256(source)},
+        "columns": columns,
+    }
+
+    def chunks() -> Iterator[bytes]:
+        yield _header_chunk(header)
+        yield from segments
+
+    write_chunks(target, chunks())
+
+
+def restamp_columns(target: Path, stamp: dict[str, Any]) -> None:
+    """Record a new size and mtime for the sidecar's source without touching its columns."""
+    data = target.read_bytes()
+    (header_length,) = struct.unpack_from("<I", data, len(MAGIC))
+    start = len(MAGIC) + 4
+    header = json.loads(data[start:start + header_length])
+    header["source"].update(stamp)
+    write_chunks(target, [_header_chunk(header), data[start + header_length:]])
+
+
+class TextColumn(Sequence):
+    def __init__(self, offsets: memoryview, data: memoryview) -> None:
+        self._offsets = offsets
+        self._data = data
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        return bytes(self._data[self._offsets[index]:self._offsets[index + 1]]).decode("utf-8")
+
+
+class DictColumn(Sequence):
+    def __init__(self, codes: memoryview, table: list[str]) -> None:
+        self._codes = codes
+        self.table = table
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.table[code] for code in self._codes[index]]
+        return self.table[self._codes[index]]
+
+
+class RowView(Mapping):
+    """Read-only, lazily decoded view of one gallery row."""
+
+    def __init__(self, store: "GalleryColumns", index: int) -> None:
+        self._store = store
+        self._index = index
+
+    def __getitem__(self, key: str) -> str:
+        if key not in self._store.names:
+            raise KeyError(key)
+        return self._store.column(key)[self._index]
+
+    def get(self, key: str, default: Any = None) -> str:
+        # Unlike Mapping.get, a field with no column is an error rather than
+        # a quiet default: the item may have a value there in gallery.json.
+        return self[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._store.names)
+
+    def __len__(self) -> int:
+        return len(self._store.names)
+
+    def __repr__(self) -> str:
+        return f"RowView({dict(self)!r})"
+
+
+class GalleryColumns:
+    def __init__(self, path: Path) -> None:
+        with path.open("rb") as handle:
+            self._mmap = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._mmap)
+        if bytes(view[:len(MAGIC)]) != MAGIC:
+            raise ValueError(f"{path} is not a gallery columns file")
+        (header_length,) = struct.unpack_from("<I", view, len(MAGIC))
+        start = len(MAGIC) + 4
+        self.header = json.loads(bytes(view[start:start + header_length]))
+        self._base = start + header_length
+        self._view = view
+        self._views: list[memoryview] = []
+        self._columns: dict[str, Sequence[str]] = {}
+        self.names = tuple(self.header["columns"])
+        # Set by matches() when the source only matched by hash: its new size and mtime.
+        self.restamp: dict[str, Any] | None = None
+
+    def _segment(self, span: list[int]) -> memoryview:
+        offset, length = span
+        segment = self._view[self._base + offset:self._base + offset + length]
+        self._views.append(segment)
+        return segment
+
+    def _cast(self, segment: memoryview, typecode: str) -> memoryview:
+        cast = segment.cast(typecode)
+        self._views.append(cast)
+        return cast
+
+    def __len__(self) -> int:
+        return self.header["rows"]
+
+    def column(self, name: str) -> Sequence[str]:
+        if name not in self._columns:
+            spec = self.header["columns"][name]
+            if spec["kind"] == "text":
+                offsets = self._cast(self._segment(spec["offsets"]), "I")
+                self._columns[name] = TextColumn(offsets, self._segment(spec["data"]))
+            else:
+                codes = self._cast(self._segment(spec["codes"]), spec["typecode"])
+                self._columns[name] = DictColumn(codes, spec["table"])
+        return self._columns[name]
+
+    def rows(self) -> Iterator[RowView]:
+        return (RowView(self, index) for index in range(len(self)))
+
+    def matches(self, source: Path) -> bool:
+        recorded = self.header.get("source", {})
+        if self.header.get("version") != FORMAT_VERSION or self.header.get("byteorder") != sys.byteorder:
+            return False
+        try:
+            stamp = _source_stamp(source)
+        except FileNotFoundError:
+            return False
+        if stamp["size"] != recorded.get("size"):
+            return False
+        if stamp["mtime_ns"] == recorded.get("mtime_ns"):
+            return True
+        if file_sha256(source) != recorded.get("sha256"):
+            return False
+        self.restamp = stamp
+        return True
+
+    def close(self) -> None:
+        self._columns.clear()
+        for view in reversed(self._views):
+            view.release()
+        self._views.clear()
+        self._view.release()
+        self._mmap.close()
+
+
+def open_columns(source: Path = GALLERY_PATH, target: Path = COLUMNS_PATH) -> GalleryColumns:
+    """Open the sidecar for source, rebuilding it first when missing or stale.
+
+    Raises ValueError (or json.JSONDecodeError) when a rebuild is needed and
+    source is not a valid gallery payload.
+    """
+    if target.exists():
+        try:
+            columns = GalleryColumns(target)
+        except (OSError, ValueError):
+            columns = None
+        if columns is not None:
+            if columns.matches(source):
+                if columns.restamp is None:
+                    return columns
+                # Closed first: Windows cannot replace a file that is still mapped.
+                columns.close()
+                restamp_columns(target, columns.restamp)
+                return GalleryColumns(target)
+            columns.close()
+    build_columns(source, target)
+    return GalleryColumns(target)
+
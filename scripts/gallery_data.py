@@ -0,0 +1,175 @@
+"""
+Shared read/write access to the gallery payloads (data/gallery.json and
+data/homepage-gallery.json).
+
+Items are parsed one at a time instead of loading the whole document with
+json.loads, and written back one item at a time, so memory use stays flat as
+the archive grows. ijson is used for parsing when it is installed
+(pip install ijson); otherwise a pure-Python incremental reader built on
+json.JSONDecoder.raw_decode is used.
+
+Both payload shapes used in this repo are accepted: {"items": [...]} and a
+bare [...] array. Written payloads are always {"items": [...]} and are
+byte-identical to json.dumps(payload, indent=2, ensure_ascii=True) plus a
+trailing newline, so every script that rewrites a payload agrees on its bytes.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Iterable, Iterator, TextIO
+
+from site_io import write_chunks
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+READ_CHUNK_SIZE = 1 << 16
+WHITESPACE = " \t\r\n"
+_DECODER = json.JSONDecoder()
+
+
+class _StreamReader:
+    """Buffered cursor over a text stream that decodes one JSON value at a time."""
+
+    def __init__(self, handle: TextIO) -> None:
+        self.handle = handle
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        if self.eof:
+            return False
+        chunk = self.handle.read(READ_CHUNK_SIZE)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise json.JSONDecodeError(f"Expecting {char!r}", self.buffer, self.pos)
+        self.pos += 1
+
+    def decode(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self.fill():
+                    raise
+                continue
+            # A number at the end of the buffer may continue in the next chunk.
+            if end == len(self.buffer) and self.fill():
+                continue
+            self.pos = end
+            return value
+
+
+def _iter_array(reader: _StreamReader) -> Iterator[Any]:
+    reader.expect("[")
+    if reader.peek() == "]":
+        reader.pos += 1
+        return
+    while True:
+        yield reader.decode()
+        separator = reader.peek()
+        reader.pos += 1
+        if separator == "]":
+            return
+        if separator != ",":
+            raise json.JSONDecodeError("Expecting ',' delimiter", reader.buffer, reader.pos - 1)
+
+
+def _iter_stream(handle: TextIO, path: Path) -> Iterator[dict[str, Any]]:
+    reader = _StreamReader(handle)
+    first = reader.peek()
+    if first == "[":
+        yield from _iter_array(reader)
+        return
+    reader.expect("{")
+    if reader.peek() == "}":
+        return
+    while True:
+        key = reader.decode()
+        reader.expect(":")
+        if key == "items":
+            if reader.peek() != "[":
+                raise ValueError(f"{path} does not contain a list of items")
+            yield from _iter_array(reader)
+        else:
+            reader.decode()
+        separator = reader.peek()
+        reader.pos += 1
+        if separator == "}":
+            return
+        if separator != ",":
+            raise json.JSONDecodeError("Expecting ',' delimiter", reader.buffer, reader.pos - 1)
+
+
+def _iter_ijson(path: Path) -> Iterator[dict[str, Any]]:
+    with path.open("rb") as handle:
+        head = handle.read(64).lstrip()
+        handle.seek(0)
+        prefix = "item" if head.startswith(b"[") else "items.item"
+        try:
+            yield from ijson.items(handle, prefix, use_float=True)
+        except ijson.JSONError as exc:
+            raise ValueError(f"{path}: {exc}") from exc
+
+
+def iter_items(path: Path) -> Iterator[dict[str, Any]]:
+    """Yield the gallery items stored in path one at a time."""
+    if ijson is not None:
+        yield from _iter_ijson(path)
+        return
+    with path.open("r", encoding="utf-8") as handle:
+        yield from _iter_stream(handle, path)
+
+
+def load_items(path: Path) -> list[dict[str, Any]]:
+    """Return every item in path; raises ValueError for malformed payloads."""
+    return list(iter_items(path))
+
+
+def iter_payload_chunks(items: Iterable[dict[str, Any]], ensure_ascii: bool = True) -> Iterator[str]:
+    """Yield the {"items": [...]} payload text one item at a time."""
+    yield '{\n  "items": ['
+    first = True
+    for item in items:
+        body = json.dumps(item, indent=2, ensure_ascii=ensure_ascii).replace("\n", "\n    ")
+        yield ("\n    " if first else ",\n    ") + body
+        first = False
+    yield "]\n}\n" if first else "\n  ]\n}\n"
+
+
+def render_items(items: Iterable[dict[str, Any]], ensure_ascii: bool = True) -> str:
+    return "".join(iter_payload_chunks(items, ensure_ascii=ensure_ascii))
+
+
+def write_items(path: Path, items: Iterable[dict[str, Any]], ensure_ascii: bool = True, apply: bool = True) -> bool:
+    """Stream items to path as {"items": [...]}; returns True when the file content changed.
+
+    The file is replaced atomically and left untouched when nothing changed.
+    With apply=False nothing is written and the return value reports whether
+    a write would have changed the file.
+    """
+    return write_chunks(path, iter_payload_chunks(items, ensure_ascii=ensure_ascii), apply=apply)
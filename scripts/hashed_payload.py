@@ -0,0 +1,92 @@
+"""
+Content-hashed copies of the gallery payload for browsers.
+
+The gallery data is published as data/hashed/<name>.<hash>.json, the
+projected row payload for that page (see payload_projection), whose filename
+changes whenever its bytes do, so it can be served with an immutable cache
+rule (see _headers). The small data/gallery-manifest.json names the current
+file and is revalidated on every visit; gallery.js reads it first.
+
+With precompress=True, .gz (and .br when the brotli package is installed)
+siblings are written for hosts that serve precompressed files. Superseded
+hashed files are removed once the manifest points at the new one.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Iterable
+
+from payload_projection import project_items, render_projected
+from site_io import write_chunks, write_text
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+HASHED_DIR = PROJECT_DIR / "data" / "hashed"
+MANIFEST_PATH = PROJECT_DIR / "data" / "gallery-manifest.json"
+HASH_LENGTH = 16
+
+
+def render_payload(items: Iterable[dict[str, Any]], name: str = "gallery") -> bytes:
+    return render_projected(project_items(items, name))
+
+
+def load_manifest(path: Path = MANIFEST_PATH) -> dict[str, Any]:
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+
+def write_hashed_payload(
+    items: Iterable[dict[str, Any]],
+    name: str = "gallery",
+    precompress: bool = False,
+    apply: bool = True,
+) -> bool:
+    """Publish items as data/hashed/<name>.<hash>.json and update the manifest.
+
+    Returns True when any file was (or, with apply=False, would be) written
+    or removed. items is read once, so it can be a stream such as
+    gallery_data.iter_items.
+    """
+    projected = project_items(items, name)
+    payload = render_projected(projected)
+    digest = hashlib.sha256(payload).hexdigest()
+    path = HASHED_DIR / f"{name}.{digest[:HASH_LENGTH]}.json"
+
+    outputs = {path: payload}
+    if precompress:
+        outputs[path.with_name(path.name + ".gz")] = gzip.compress(payload, compresslevel=9, mtime=0)
+        if brotli is not None:
+            outputs[path.with_name(path.name + ".br")] = brotli.compress(payload, quality=11)
+
+    manifest = load_manifest()
+    manifest[name] = {
+        "path": path.relative_to(PROJECT_DIR).as_posix(),
+        "sha256": digest,
+        "bytes": len(payload),
+        "items": len(projected["rows"]),
+        "encodings": {output.suffix[1:]: len(data) for output, data in outputs.items() if output != path},
+    }
+
+    changed = False
+    for output, data in outputs.items():
+        changed |= write_chunks(output, [data], apply=apply)
+    changed |= write_text(MANIFEST_PATH, json.dumps(manifest, indent=2, sort_keys=True) + "\n", apply=apply)
+
+    stale = [existing for existing in HASHED_DIR.glob(f"{name}.*.json*") if existing not in outputs]
+    changed |= bool(stale)
+    if apply:
+        for existing in stale:
+            existing.unlink()
+    return changed
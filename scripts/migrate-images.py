@@ -13,10 +13,12 @@ Usage:
     1. Download images from Midjourney (manually or via this script)
     2. Match downloaded files to gallery.json entries
     3. Stage into repo-local hosting or upload to Cloudflare R2
-    4. Update gallery.json and gallery.js with new URLs
+    4. Update gallery.json and the hashed browser payload with new URLs
 
 Prerequisites:
     pip install boto3 requests
+    pip install Pillow             (for the derivatives command; AVIF needs
+                                    Pillow 11.3+ or pillow-avif-plugin)
 
 Environment variables (for R2 upload):
     R2_ACCOUNT_ID        - Cloudflare account ID
@@ -24,17 +26,50 @@ Environment variables (for R2 upload):
     R2_SECRET_ACCESS_KEY - R2 API token secret key
     R2_BUCKET_NAME       - R2 bucket name (e.g., "axylusion-images")
     R2_PUBLIC_URL        - Public URL for the bucket (e.g., "https://images.axylusion.com")
+    R2_ENDPOINT_URL      - Optional S3 endpoint override (e.g. a local MinIO or
+                           moto_server instance); R2_ACCOUNT_ID is then optional
+    R2_UPLOAD_WORKERS    - Concurrent uploads (default 8)
+
+Uploads are journaled in .cache/r2-upload-journal.jsonl (object key + sha256),
+so an interrupted upload can simply be rerun: files whose content was already
+uploaded under the same key are skipped.
+
+Downloaded files are hashed once and remembered in .cache/image-hashes.json by
+(path, size, mtime); rescans only re-read files that changed. Files with the
+same content are uploaded or copied once and the other gallery items point at
+that copy.
+
+Download directories are indexed in .cache/download-index.json by directory
+mtime, so repeat scans only list directories whose contents changed. Every
+file for a job is kept (grid variants like _0/_1, upscales), and the variant
+matching the gallery item's index is used, falling back to the largest file.
+
+The derivatives command writes resized WebP/AVIF copies of repo-hosted images
+to images/gallery/derived/ and records them on each item as "derivatives"
+(src, format, width, height, bytes); the cinematic renderer turns those into
+srcset/sizes markup.
+
+gallery.json is streamed rather than loaded: matching keeps only the matched
+items, and the new URLs and derivative records are patched in while the file
+is streamed back out, so memory does not grow with the size of the gallery.
 """
 
 import json
 import os
+import random
 import re
 import sys
-import hashlib
 import shutil
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
 from pathlib import Path
 from urllib.parse import urlparse
 
+from embedded_payload import splice_embedded_payload
+from gallery_data import iter_items, write_items
+from hashed_payload import MANIFEST_PATH, write_hashed_payload
+from site_io import file_sha256, write_text
+
 
 # Paths
 SCRIPT_DIR = Path(__file__).parent
@@ -43,14 +78,71 @@ GALLERY_JSON = PROJECT_DIR / "data" / "gallery.json"
 GALLERY_JS = PROJECT_DIR / "gallery.js"
 DOWNLOAD_DIR = PROJECT_DIR / "scripts" / "downloaded-images"
 LOCAL_MEDIA_DIR = PROJECT_DIR / "images" / "gallery"
-
-
-def load_gallery():
-    """Load gallery.json and return items."""
-    with open(GALLERY_JSON, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    items = data if isinstance(data, list) else data.get("items", [])
-    return items
+UPLOAD_JOURNAL = PROJECT_DIR / ".cache" / "r2-upload-journal.jsonl"
+HASH_CACHE = PROJECT_DIR / ".cache" / "image-hashes.json"
+HASH_CACHE_VERSION = 1
+DOWNLOAD_INDEX = PROJECT_DIR / ".cache" / "download-index.json"
+DOWNLOAD_INDEX_VERSION = 1
+SCAN_WORKERS = 8
+IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".webp"}
+JOB_ID_PATTERN = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}")
+VARIANT_INDEX_PATTERN = re.compile(r"^[_-]?(\d+)")
+ITEM_INDEX_PATTERN = re.compile(r"[?&]index=(\d+)|/(\d+)_\d+\.\w+$")
+DERIVATIVE_DIR = LOCAL_MEDIA_DIR / "derived"
+DERIVATIVE_WIDTHS = (320, 640, 1024)
+DERIVATIVE_QUALITY = {"avif": 50, "webp": 78}
+UPLOAD_WORKERS = 8
+UPLOAD_ATTEMPTS = 4
+UPLOAD_BACKOFF_SECONDS = 1.0
+CONTENT_TYPES = {
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".webp": "image/webp",
+}
+
+
+class HashCache:
+    """sha256 of files on disk, remembered by (path, size, mtime_ns)."""
+
+    def __init__(self, path):
+        self.path = path
+        self.files = {}
+        self.dirty = False
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        if isinstance(data, dict) and data.get("version") == HASH_CACHE_VERSION:
+            self.files = data.get("files", {})
+
+    def sha256(self, file_path):
+        file_path = Path(file_path).resolve()
+        stat = file_path.stat()
+        key = str(file_path)
+        cached = self.files.get(key)
+        if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+            return cached[2]
+        digest = file_sha256(file_path)
+        self.files[key] = [stat.st_size, stat.st_mtime_ns, digest]
+        self.dirty = True
+        return digest
+
+    def save(self):
+        if not self.dirty:
+            return
+        self.files = {key: value for key, value in self.files.items() if Path(key).exists()}
+        write_text(self.path, json.dumps({"version": HASH_CACHE_VERSION, "files": self.files}, indent=1, sort_keys=True) + "\n")
+        self.dirty = False
+
+
+def find_duplicate_content(image_map, hashes):
+    """Return {sha256: [job_id, ...]} for downloads sharing bytes across job IDs."""
+    by_hash = {}
+    for job_id, paths in image_map.items():
+        for file_path in paths:
+            by_hash.setdefault(hashes.sha256(file_path), set()).add(job_id)
+    return {digest: sorted(job_ids) for digest, job_ids in by_hash.items() if len(job_ids) > 1}
 
 
 def extract_job_id(cdn_url):
@@ -59,62 +151,223 @@ def extract_job_id(cdn_url):
     e.g., https://cdn.midjourney.com/4147cb5f-c531-47fd-b8a2-ab4ec1a424e9/0_0.png
     returns: 4147cb5f-c531-47fd-b8a2-ab4ec1a424e9
     """
-    match = re.search(
-        r"([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})", cdn_url
-    )
-    return match.group(1) if match else None
+    match = JOB_ID_PATTERN.search(cdn_url)
+    return match.group(0) if match else None
 
 
-def scan_downloaded_images(download_dir):
-    """Scan a directory of downloaded images and extract job IDs from filenames.
+def load_download_index(root):
+    """Return the cached {relative_dir: record} listing for one download root."""
+    try:
+        data = json.loads(DOWNLOAD_INDEX.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != DOWNLOAD_INDEX_VERSION:
+        return {}
+    return data.get("roots", {}).get(str(root), {})
+
+
+def save_download_index(root, dirs):
+    try:
+        data = json.loads(DOWNLOAD_INDEX.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        data = {}
+    if not isinstance(data, dict) or data.get("version") != DOWNLOAD_INDEX_VERSION:
+        data = {"version": DOWNLOAD_INDEX_VERSION, "roots": {}}
+    data.setdefault("roots", {})[str(root)] = dirs
+    write_text(DOWNLOAD_INDEX, json.dumps(data, indent=1, sort_keys=True) + "\n")
+
+
+def scan_directory(root, relative, cached):
+    """List one directory, reusing the cached record when its mtime is unchanged.
+
+    A directory's mtime moves whenever an entry is added, removed or renamed
+    in it, which is all the index records. Returns (relative, record, listed).
+    """
+    path = os.path.join(root, relative) if relative else root
+    mtime_ns = os.stat(path).st_mtime_ns
+    if cached and cached.get("mtime_ns") == mtime_ns:
+        return relative, cached, False
+
+    files = []
+    subdirs = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.name)
+                continue
+            # Cheap extension check first; most archive clutter never hits the regex.
+            if os.path.splitext(entry.name)[1].lower() not in IMAGE_EXTENSIONS:
+                continue
+            job_id = extract_job_id(entry.name)
+            if job_id:
+                files.append([entry.name, job_id])
+    return relative, {"mtime_ns": mtime_ns, "files": sorted(files), "subdirs": sorted(subdirs)}, True
+
+
+def scan_downloaded_images(download_dir, workers=SCAN_WORKERS):
+    """Scan a directory tree of downloaded images, grouping files by job ID.
 
     Midjourney downloads typically have the job ID in the filename.
     Supports formats like:
         - 4147cb5f-c531-47fd-b8a2-ab4ec1a424e9.png
-        - koltregaskes_cinematic_portrait_4147cb5f-c531-47fd-b8a2-ab4ec1a424e9.png
+        - koltregaskes_cinematic_portrait_4147cb5f-c531-47fd-b8a2-ab4ec1a424e9_0.png
         - Any file containing a UUID
+
+    Returns {job_id: [path, ...]} with every variant found for the job.
+    Directories are listed in parallel with os.scandir.
     """
     download_path = Path(download_dir)
     if not download_path.exists():
         print(f"Download directory not found: {download_dir}")
         return {}
 
-    image_map = {}  # job_id -> file_path
-    extensions = {".png", ".jpg", ".jpeg", ".webp"}
+    root = str(download_path.resolve())
+    cached_dirs = load_download_index(root)
+    dirs = {}
+    listed = 0
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = {pool.submit(scan_directory, root, "", cached_dirs.get(""))}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    relative, record, was_listed = future.result()
+                except OSError as e:
+                    print(f"  Skipping unreadable directory: {e}")
+                    continue
+                dirs[relative] = record
+                listed += was_listed
+                for name in record["subdirs"]:
+                    child = f"{relative}/{name}" if relative else name
+                    pending.add(pool.submit(scan_directory, root, child, cached_dirs.get(child)))
+
+    if dirs != cached_dirs:
+        save_download_index(root, dirs)
+    print(f"Scanned {len(dirs)} directories ({listed} listed, {len(dirs) - listed} unchanged)")
+
+    image_map = {}  # job_id -> [file_path, ...]
+    for relative, record in sorted(dirs.items()):
+        directory = download_path / relative if relative else download_path
+        for name, job_id in record["files"]:
+            image_map.setdefault(job_id, []).append(directory / name)
+    return image_map
 
-    for file_path in download_path.rglob("*"):
-        if file_path.suffix.lower() not in extensions:
-            continue
 
-        job_id = extract_job_id(file_path.name)
-        if job_id:
-            image_map[job_id] = file_path
+def item_variant_index(item):
+    """Return the grid index an item refers to (?index=N or /N_0.png), if any."""
+    for value in (item.get("url", ""), item.get("cdn_url", "")):
+        match = ITEM_INDEX_PATTERN.search(str(value or ""))
+        if match:
+            return int(match.group(1) or match.group(2))
+    return None
 
-    return image_map
+
+def pick_variant(paths, job_id, index=None):
+    """Choose the file for an item: the variant matching its index, else the largest."""
+
+    def rank(file_path):
+        suffix = file_path.stem.split(job_id, 1)[-1]
+        match = VARIANT_INDEX_PATTERN.match(suffix)
+        matches_index = index is not None and match is not None and int(match.group(1)) == index
+        return (not matches_index, -file_path.stat().st_size, str(file_path))
+
+    return min(paths, key=rank)
 
 
-def match_images(gallery_items, image_map):
-    """Match gallery items to downloaded images by job ID."""
+def match_images(gallery_items, image_map, hashes=None):
+    """Match gallery items to downloaded images by job ID.
+
+    Each matched entry carries the item, its position in gallery_items, the
+    chosen file and all of the job's variants; with a HashCache it also
+    carries the chosen file's sha256. Unmatched items are reduced to their id
+    and name, so gallery_items can be a stream.
+    """
     matched = []
     unmatched = []
 
-    for item in gallery_items:
+    for index, item in enumerate(gallery_items):
         job_id = item.get("id") or extract_job_id(item.get("cdn_url", ""))
         if job_id and job_id in image_map:
-            matched.append({"item": item, "file": image_map[job_id], "job_id": job_id})
+            variants = image_map[job_id]
+            entry = {
+                "item": item,
+                "index": index,
+                "file": pick_variant(variants, job_id, item_variant_index(item)),
+                "job_id": job_id,
+                "variants": variants,
+            }
+            if hashes is not None:
+                entry["sha256"] = hashes.sha256(entry["file"])
+            matched.append(entry)
         else:
-            unmatched.append(item)
+            unmatched.append({"id": item.get("id", ""), "name": item.get("name", "")})
 
     return matched, unmatched
 
 
+def load_upload_journal(path):
+    """Return {object_key: sha256} for uploads recorded in the journal.
+
+    The journal is append-only JSON lines; later lines win, and a truncated
+    last line (from an interrupted run) is ignored.
+    """
+    journal = {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if isinstance(record, dict) and record.get("key") and record.get("sha256"):
+                    journal[record["key"]] = record["sha256"]
+    except FileNotFoundError:
+        pass
+    return journal
+
+
+def r2_upload_workers():
+    try:
+        return max(1, int(os.environ.get("R2_UPLOAD_WORKERS", UPLOAD_WORKERS)))
+    except ValueError:
+        return UPLOAD_WORKERS
+
+
+def upload_with_retry(s3, file_path, bucket_name, object_key, sha256):
+    """Upload one file, retrying with exponential backoff; returns attempts used."""
+    ext = file_path.suffix.lower()
+    for attempt in range(1, UPLOAD_ATTEMPTS + 1):
+        try:
+            s3.upload_file(
+                str(file_path),
+                bucket_name,
+                object_key,
+                ExtraArgs={
+                    "ContentType": CONTENT_TYPES.get(ext, "image/png"),
+                    "CacheControl": "public, max-age=31536000",  # 1 year cache
+                    "Metadata": {"sha256": sha256},
+                },
+            )
+            return attempt
+        except Exception:
+            if attempt == UPLOAD_ATTEMPTS:
+                raise
+            delay = UPLOAD_BACKOFF_SECONDS * 2 ** (attempt - 1)
+            time.sleep(delay + random.uniform(0, delay / 2))
+
+
 def upload_to_r2(matched_items):
     """Upload matched images to Cloudflare R2.
 
-    Requires boto3 and R2 environment variables.
+    Requires boto3 and R2 environment variables. Uploads run on a bounded
+    thread pool sharing one client; completed uploads are appended to the
+    journal as they finish, and files already journaled with the same sha256
+    are skipped. Returns False when nothing could be uploaded.
     """
     try:
         import boto3
+        from botocore.config import Config
     except ImportError:
         print("ERROR: boto3 not installed. Run: pip install boto3")
         return False
@@ -124,133 +377,301 @@ def upload_to_r2(matched_items):
     secret_key = os.environ.get("R2_SECRET_ACCESS_KEY")
     bucket_name = os.environ.get("R2_BUCKET_NAME", "axylusion-images")
     public_url = os.environ.get("R2_PUBLIC_URL", "")
+    endpoint_url = os.environ.get("R2_ENDPOINT_URL", "")
 
-    if not all([account_id, access_key, secret_key]):
+    if not all([account_id or endpoint_url, access_key, secret_key]):
         print("ERROR: R2 environment variables not set.")
         print("Required: R2_ACCOUNT_ID, R2_ACCESS_KEY_ID, R2_SECRET_ACCESS_KEY")
         return False
 
-    # Create R2 client
+    workers = r2_upload_workers()
+
+    # One client shared by every worker thread; boto3 clients are thread-safe
+    # and the pool is sized so each worker gets its own connection.
     s3 = boto3.client(
         "s3",
-        endpoint_url=f"https://{account_id}.r2.cloudflarestorage.com",
+        endpoint_url=endpoint_url or f"https://{account_id}.r2.cloudflarestorage.com",
         aws_access_key_id=access_key,
         aws_secret_access_key=secret_key,
         region_name="auto",
+        config=Config(max_pool_connections=workers),
     )
 
-    uploaded = 0
-    for entry in matched_items:
-        file_path = entry["file"]
-        job_id = entry["job_id"]
-        ext = file_path.suffix.lower()
+    journal = load_upload_journal(UPLOAD_JOURNAL)
+    # Content already in the bucket, whichever key it was uploaded under.
+    uploaded_keys = {}
+    for object_key, sha256 in journal.items():
+        uploaded_keys.setdefault(sha256, object_key)
 
+    pending = []
+    duplicates = []
+    skipped = 0
+    queued = set()
+    for entry in matched_items:
         # Use job_id as the R2 object key for clean URLs
-        object_key = f"gallery/{job_id}{ext}"
-
-        # Content type mapping
-        content_types = {
-            ".png": "image/png",
-            ".jpg": "image/jpeg",
-            ".jpeg": "image/jpeg",
-            ".webp": "image/webp",
+        object_key = f"gallery/{entry['job_id']}{entry['file'].suffix.lower()}"
+        sha256 = entry.get("sha256") or file_sha256(entry["file"])
+        if journal.get(object_key) == sha256:
+            skipped += 1
+            if public_url:
+                entry["item"]["cdn_url"] = f"{public_url}/{object_key}"
+        elif sha256 in uploaded_keys or sha256 in queued:
+            duplicates.append((entry, sha256))
+        else:
+            queued.add(sha256)
+            pending.append((entry, object_key, sha256))
+
+    print(
+        f"Uploading {len(pending)} images with {workers} workers "
+        f"({skipped} already uploaded, {len(duplicates)} duplicate content)"
+    )
+
+    uploaded = 0
+    uploaded_bytes = 0
+    retried = 0
+    failed = []
+    started = time.perf_counter()
+
+    UPLOAD_JOURNAL.parent.mkdir(parents=True, exist_ok=True)
+    with open(UPLOAD_JOURNAL, "a", encoding="utf-8") as journal_file, ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(upload_with_retry, s3, entry["file"], bucket_name, object_key, sha256): (entry, object_key, sha256)
+            for entry, object_key, sha256 in pending
         }
+        for future in as_completed(futures):
+            entry, object_key, sha256 = futures[future]
+            try:
+                attempts = future.result()
+            except Exception as e:
+                failed.append(entry["job_id"])
+                print(f"  Failed to upload {entry['job_id']} after {UPLOAD_ATTEMPTS} attempts: {e}")
+                continue
 
-        try:
-            s3.upload_file(
-                str(file_path),
-                bucket_name,
-                object_key,
-                ExtraArgs={
-                    "ContentType": content_types.get(ext, "image/png"),
-                    "CacheControl": "public, max-age=31536000",  # 1 year cache
-                },
-            )
+            size = entry["file"].stat().st_size
+            journal_file.write(json.dumps({"key": object_key, "sha256": sha256, "size": size}) + "\n")
+            journal_file.flush()
+
+            uploaded_keys.setdefault(sha256, object_key)
 
             # Update the item's CDN URL
             if public_url:
                 entry["item"]["cdn_url"] = f"{public_url}/{object_key}"
 
             uploaded += 1
+            uploaded_bytes += size
+            retried += attempts > 1
             if uploaded % 50 == 0:
-                print(f"  Uploaded {uploaded}/{len(matched_items)}...")
+                print(f"  Uploaded {uploaded}/{len(pending)}...")
 
-        except Exception as e:
-            print(f"  Failed to upload {job_id}: {e}")
+    # Items whose bytes are already in the bucket share that object.
+    deduplicated = 0
+    for entry, sha256 in duplicates:
+        object_key = uploaded_keys.get(sha256)
+        if object_key is None:
+            continue
+        deduplicated += 1
+        if public_url:
+            entry["item"]["cdn_url"] = f"{public_url}/{object_key}"
+
+    elapsed = max(time.perf_counter() - started, 1e-9)
+    print(f"Uploaded {uploaded}/{len(pending)} images to R2 in {elapsed:.1f}s")
+    print(
+        f"  {uploaded / elapsed:.1f} files/s, {uploaded_bytes / elapsed / 1_000_000:.2f} MB/s, "
+        f"{retried} retried, {len(failed)} failed, {skipped} skipped, {deduplicated} deduplicated"
+    )
+    if failed:
+        print("  Rerun 'upload' to retry the failed images; completed uploads are skipped.")
+    return uploaded + skipped + deduplicated > 0
 
-    print(f"Uploaded {uploaded}/{len(matched_items)} images to R2")
-    return True
 
+def copy_to_local_hosting(matched_items, hashes):
+    """Copy matched images into the repo for static self-hosting.
 
-def copy_to_local_hosting(matched_items):
-    """Copy matched images into the repo for static self-hosting."""
+    Files already present with the same content are not copied again, and an
+    image whose bytes are already hosted under another job ID reuses that file.
+    """
     LOCAL_MEDIA_DIR.mkdir(parents=True, exist_ok=True)
 
+    hosted = {}
+    for hosted_path in sorted(LOCAL_MEDIA_DIR.iterdir()):
+        if hosted_path.is_file():
+            hosted.setdefault(hashes.sha256(hosted_path), hosted_path)
+
     copied = 0
+    unchanged = 0
+    deduplicated = 0
     for entry in matched_items:
         file_path = entry["file"]
         job_id = entry["job_id"]
         ext = file_path.suffix.lower() or ".png"
         target_path = LOCAL_MEDIA_DIR / f"{job_id}{ext}"
+        sha256 = entry.get("sha256") or hashes.sha256(file_path)
+
+        existing = hosted.get(sha256)
+        if target_path.exists() and hashes.sha256(target_path) == sha256:
+            unchanged += 1
+        elif existing is not None and not target_path.exists():
+            target_path = existing
+            deduplicated += 1
+        else:
+            shutil.copy2(file_path, target_path)
+            hosted.setdefault(sha256, target_path)
+            copied += 1
 
-        shutil.copy2(file_path, target_path)
-        entry["item"]["cdn_url"] = f"images/gallery/{job_id}{ext}"
-        copied += 1
+        entry["item"]["cdn_url"] = f"images/gallery/{target_path.name}"
 
-    print(f"Copied {copied}/{len(matched_items)} images into {LOCAL_MEDIA_DIR}")
+    print(
+        f"Copied {copied}/{len(matched_items)} images into {LOCAL_MEDIA_DIR} "
+        f"({unchanged} already present, {deduplicated} duplicate content)"
+    )
     return True
 
 
-def update_gallery_json(items):
-    """Save updated items back to gallery.json."""
-    gallery = {"items": items}
-    with open(GALLERY_JSON, "w", encoding="utf-8") as f:
-        json.dump(gallery, f, indent=2, ensure_ascii=False)
-    print(f"Updated {GALLERY_JSON}")
+def derivative_formats():
+    """Return the derivative formats this Pillow build can encode, best first."""
+    from PIL import Image
 
+    try:
+        import pillow_avif  # noqa: F401  (registers the AVIF plugin on older Pillow)
+    except ImportError:
+        pass
+    Image.init()
+    return [fmt for fmt in ("avif", "webp") if fmt.upper() in Image.SAVE]
+
+
+def render_derivatives(source_path, stem, widths, formats):
+    """Write resized copies of one image; runs in a worker process.
+
+    Outputs newer than the source are kept as they are, so reruns only pay for
+    an Image.open header read. Widths larger than the source are clamped to it.
+    """
+    from PIL import Image, ImageOps
+
+    if "avif" in formats:
+        try:
+            import pillow_avif  # noqa: F401  (workers need the plugin registered too)
+        except ImportError:
+            pass
+
+    source_path = Path(source_path)
+    source_mtime = source_path.stat().st_mtime_ns
+    records = []
+    with Image.open(source_path) as image:
+        source_width, source_height = image.size
+        for width in sorted({min(width, source_width) for width in widths}):
+            height = max(1, round(source_height * width / source_width))
+            resized = None
+            for fmt in formats:
+                target = DERIVATIVE_DIR / f"{stem}-{width}.{fmt}"
+                if not target.exists() or target.stat().st_mtime_ns < source_mtime:
+                    if resized is None:
+                        frame = ImageOps.exif_transpose(image)
+                        if frame.mode not in ("RGB", "RGBA"):
+                            frame = frame.convert("RGBA" if "A" in frame.getbands() else "RGB")
+                        resized = frame.resize((width, height), Image.LANCZOS)
+                    temp = target.with_name(f".{target.name}.tmp")
+                    resized.save(temp, format=fmt.upper(), quality=DERIVATIVE_QUALITY[fmt])
+                    os.replace(temp, target)
+                records.append(
+                    {
+                        "src": target.relative_to(PROJECT_DIR).as_posix(),
+                        "format": fmt,
+                        "width": width,
+                        "height": height,
+                        "bytes": target.stat().st_size,
+                    }
+                )
+    return records
+
+
+def generate_derivatives(items, workers=None):
+    """Write derivatives for every item hosted under images/gallery/.
+
+    Each distinct source file is processed once in a process pool, even when
+    several items point at it. Returns {cdn_url: derivative records} for the
+    files processed; iter_patched_gallery attaches them to the items.
+    """
+    formats = derivative_formats()
+    if not formats:
+        print("ERROR: this Pillow build cannot write WebP or AVIF.")
+        return {}
+
+    sources = set()
+    for item in items:
+        url = str(item.get("cdn_url") or "")
+        if url.startswith("images/gallery/") and url not in sources and (PROJECT_DIR / url).is_file():
+            sources.add(url)
+    if not sources:
+        print("No repo-hosted gallery images found; run 'stage-local' first.")
+        return {}
+
+    DERIVATIVE_DIR.mkdir(parents=True, exist_ok=True)
+    print(f"Generating {', '.join(formats)} at {', '.join(map(str, DERIVATIVE_WIDTHS))}px for {len(sources)} images")
+
+    derivatives = {}
+    failed = 0
+    total_bytes = 0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(render_derivatives, str(PROJECT_DIR / url), Path(url).stem, DERIVATIVE_WIDTHS, formats): url
+            for url in sources
+        }
+        for future in as_completed(futures):
+            url = futures[future]
+            try:
+                records = future.result()
+            except Exception as e:
+                failed += 1
+                print(f"  Failed to process {url}: {e}")
+                continue
+            derivatives[url] = records
+            total_bytes += sum(record["bytes"] for record in records)
+            if len(derivatives) % 50 == 0:
+                print(f"  Processed {len(derivatives)}/{len(sources)}...")
+
+    print(f"Processed {len(derivatives)}/{len(sources)} images ({failed} failed), {total_bytes / 1_000_000:.1f} MB of derivatives")
+    return derivatives
+
+
+def iter_patched_gallery(matched=(), derivatives=None):
+    """Stream gallery.json with matched items' new CDN URLs and derivative records applied.
+
+    matched entries are found by their position in gallery.json (see
+    match_images) and derivatives by cdn_url (see generate_derivatives).
+    """
+    cdn_urls = {entry["index"]: entry["item"]["cdn_url"] for entry in matched}
+    for index, item in enumerate(iter_items(GALLERY_JSON)):
+        if index in cdn_urls:
+            item["cdn_url"] = cdn_urls[index]
+        records = (derivatives or {}).get(str(item.get("cdn_url") or ""))
+        if records is not None:
+            item["derivatives"] = records
+        yield item
 
-def update_gallery_js(items):
-    """Update the embedded data in gallery.js."""
-    gallery_data = json.dumps({"items": items}, indent=2, ensure_ascii=False)
-
-    with open(GALLERY_JS, "r", encoding="utf-8") as f:
-        content = f.read()
-
-    # Find the embedded data block
-    # Pattern: const embeddedData = {...};
-    # Then everything up to the next top-level code
-    pattern = r"const embeddedData = \{.*?\n\};"
-    replacement = f"const embeddedData = {gallery_data};"
-
-    # Use a simpler approach: find start and end markers
-    start_marker = "const embeddedData = {"
-    start_idx = content.find(start_marker)
-    if start_idx == -1:
-        print("WARNING: Could not find embeddedData in gallery.js")
-        return
 
-    # Find the matching closing brace by counting braces
-    brace_count = 0
-    end_idx = start_idx + len(start_marker) - 1  # Position of opening {
-    for i in range(end_idx, len(content)):
-        if content[i] == "{":
-            brace_count += 1
-        elif content[i] == "}":
-            brace_count -= 1
-            if brace_count == 0:
-                end_idx = i + 1
-                break
+def update_gallery_json(items):
+    """Stream updated items back to gallery.json.
 
-    # Find the semicolon after the closing brace
-    if end_idx < len(content) and content[end_idx] == ";":
-        end_idx += 1
+    write_items replaces the file only after items is exhausted, so items can
+    be a stream of gallery.json itself.
+    """
+    write_items(GALLERY_JSON, items)
+    print(f"Updated {GALLERY_JSON}")
 
-    new_content = content[:start_idx] + replacement + content[end_idx:]
 
-    with open(GALLERY_JS, "w", encoding="utf-8") as f:
-        f.write(new_content)
+def update_gallery_js(items):
+    """Publish items as the hashed payload gallery.js loads.
+
+    gallery.js keeps an empty embeddedData block; the items live in
+    data/hashed/gallery.<hash>.json, named by data/gallery-manifest.json.
+    """
+    try:
+        splice_embedded_payload(GALLERY_JS, [])
+    except ValueError as e:
+        print(f"WARNING: Could not update embeddedData in gallery.js: {e}")
 
-    print(f"Updated {GALLERY_JS}")
+    if write_hashed_payload(items):
+        print(f"Updated {MANIFEST_PATH}")
 
 
 def cmd_scan(args):
@@ -261,16 +682,25 @@ def cmd_scan(args):
     print("SCANNING DOWNLOADED IMAGES")
     print("=" * 60)
 
-    items = load_gallery()
-    print(f"Gallery items: {len(items)}")
-
     image_map = scan_downloaded_images(download_dir)
-    print(f"Downloaded images found: {len(image_map)}")
+    variant_count = sum(len(paths) for paths in image_map.values())
+    print(f"Downloaded images found: {variant_count} files for {len(image_map)} jobs")
+    print(f"Jobs with multiple variants: {sum(1 for paths in image_map.values() if len(paths) > 1)}")
+
+    hashes = HashCache(HASH_CACHE)
+    duplicates = find_duplicate_content(image_map, hashes)
+    hashes.save()
 
-    matched, unmatched = match_images(items, image_map)
+    matched, unmatched = match_images(iter_items(GALLERY_JSON), image_map)
+    print(f"Gallery items: {len(matched) + len(unmatched)}")
     print(f"Matched: {len(matched)}")
     print(f"Unmatched (need downloading): {len(unmatched)}")
 
+    if duplicates:
+        print(f"\nDuplicate downloads (same content under different job IDs): {len(duplicates)}")
+        for digest, job_ids in list(duplicates.items())[:10]:
+            print(f"  {digest[:12]}: {', '.join(job_id[:8] for job_id in job_ids)}")
+
     if unmatched:
         print(f"\nFirst 10 unmatched items:")
         for item in unmatched[:10]:
@@ -288,10 +718,11 @@ def cmd_upload(args):
     print("UPLOADING IMAGES TO CLOUDFLARE R2")
     print("=" * 60)
 
-    items = load_gallery()
     image_map = scan_downloaded_images(download_dir)
 
-    matched, unmatched = match_images(items, image_map)
+    hashes = HashCache(HASH_CACHE)
+    matched, unmatched = match_images(iter_items(GALLERY_JSON), image_map, hashes)
+    hashes.save()
     print(f"Matched: {len(matched)} | Unmatched: {len(unmatched)}")
 
     if not matched:
@@ -299,10 +730,10 @@ def cmd_upload(args):
         return
 
     if upload_to_r2(matched):
-        # Update both gallery.json and gallery.js
-        update_gallery_json(items)
-        update_gallery_js(items)
-        print("\nDone! CDN URLs updated in gallery.json and gallery.js")
+        # Update gallery.json and the hashed payload gallery.js loads
+        update_gallery_json(iter_patched_gallery(matched))
+        update_gallery_js(iter_items(GALLERY_JSON))
+        print("\nDone! CDN URLs updated in gallery.json and the hashed gallery payload")
     else:
         print("\nUpload failed. Gallery files not updated.")
 
@@ -315,47 +746,70 @@ def cmd_stage_local(args):
     print("STAGING IMAGES INTO REPO-LOCAL HOSTING")
     print("=" * 60)
 
-    items = load_gallery()
     image_map = scan_downloaded_images(download_dir)
 
-    matched, unmatched = match_images(items, image_map)
+    hashes = HashCache(HASH_CACHE)
+    matched, unmatched = match_images(iter_items(GALLERY_JSON), image_map, hashes)
     print(f"Matched: {len(matched)} | Unmatched: {len(unmatched)}")
 
     if not matched:
+        hashes.save()
         print("No matched images to stage locally.")
         return
 
-    copy_to_local_hosting(matched)
-    update_gallery_json(items)
-    update_gallery_js(items)
+    copy_to_local_hosting(matched, hashes)
+    hashes.save()
+    update_gallery_json(iter_patched_gallery(matched))
+    update_gallery_js(iter_items(GALLERY_JSON))
     print("\nDone! Gallery now points matched items at repo-local hosted media.")
 
 
+def cmd_derivatives(args):
+    """Generate responsive WebP/AVIF derivatives for repo-hosted images."""
+    print("=" * 60)
+    print("GENERATING RESPONSIVE IMAGE DERIVATIVES")
+    print("=" * 60)
+
+    try:
+        import PIL  # noqa: F401
+    except ImportError:
+        print("ERROR: Pillow not installed. Run: pip install Pillow")
+        return
+
+    workers = int(args[0]) if args else None
+    derivatives = generate_derivatives(iter_items(GALLERY_JSON), workers)
+    if derivatives:
+        update_gallery_json(iter_patched_gallery(derivatives=derivatives))
+        update_gallery_js(iter_items(GALLERY_JSON))
+        print("\nDone! Re-run scripts/render-cinematic-site.py to emit srcset markup.")
+
+
 def cmd_export_urls(args):
     """Export all Midjourney URLs for manual download."""
-    items = load_gallery()
     output_file = args[0] if args else str(SCRIPT_DIR / "download-urls.txt")
 
+    exported = 0
     with open(output_file, "w") as f:
-        for item in items:
+        for item in iter_items(GALLERY_JSON):
             job_id = item.get("id", "")
             url = f"https://www.midjourney.com/jobs/{job_id}"
             f.write(f"{url}\n")
+            exported += 1
 
-    print(f"Exported {len(items)} URLs to {output_file}")
+    print(f"Exported {exported} URLs to {output_file}")
     print("Visit each URL on midjourney.com to download the image.")
 
 
 def cmd_status(args):
     """Show current status of CDN URLs."""
-    items = load_gallery()
-
+    total = 0
     midjourney_cdn = 0
     local_static = 0
     r2_cdn = 0
     other = 0
 
-    for item in items:
+    for item in iter_items(GALLERY_JSON):
+        total += 1
         url = item.get("cdn_url", "")
         if "cdn.midjourney.com" in url:
             midjourney_cdn += 1
@@ -369,7 +823,7 @@ def cmd_status(args):
     print("=" * 60)
     print("IMAGE HOSTING STATUS")
     print("=" * 60)
-    print(f"Total items:          {len(items)}")
+    print(f"Total items:          {total}")
     print(f"Midjourney CDN (403): {midjourney_cdn}")
     print(f"Repo-local static:    {local_static}")
     print(f"Cloudflare R2:        {r2_cdn}")
@@ -386,6 +840,7 @@ if __name__ == "__main__":
         "scan": cmd_scan,
         "upload": cmd_upload,
         "stage-local": cmd_stage_local,
+        "derivatives": cmd_derivatives,
         "export-urls": cmd_export_urls,
         "status": cmd_status,
     }
@@ -400,6 +855,7 @@ if __name__ == "__main__":
         print("  scan <download-dir>       - Scan downloaded images and match to gallery")
         print("  stage-local <download-dir> - Copy matched images into images/gallery and update URLs")
         print("  upload <download-dir>     - Upload matched images to R2 and update gallery")
+        print("  derivatives [workers]     - Write WebP/AVIF widths for repo-hosted images")
         print()
         print("Workflow:")
         print("  1. Run 'status' to see how many images need migrating")
@@ -408,6 +864,7 @@ if __name__ == "__main__":
         print("  4. Run 'scan <dir>' to match downloads to gallery entries")
         print("  5. Run 'stage-local <dir>' for repo-local hosting, or set R2 environment variables")
         print("  6. Run 'upload <dir>' only if you want Cloudflare R2 instead of local hosting")
+        print("  7. Run 'derivatives' after 'stage-local' to add responsive thumbnails")
         sys.exit(0)
 
     cmd = sys.argv[1]
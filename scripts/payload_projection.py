@@ -0,0 +1,123 @@
+"""
+Field-projected, dictionary-encoded client payloads built from gallery items.
+
+Each browser consumer declares the fields it reads in PAYLOAD_SCHEMAS; every
+other field (parameters, dimensions, tones, ...) stays in data/gallery.json
+only. A projected payload is row-oriented with compact separators:
+
+    {"schema": 1,
+     "fields": ["id", "name", ...],
+     "dicts": {"model": ["Midjourney v7", ...], "tags": ["portrait", ...]},
+     "templates": {"cdn_url": ["https://cdn.midjourney.com/{id}/0_0.png"]},
+     "rows": [["4147cb5f-...", "Fantasy Heroine", 0, ...], ...]}
+
+Fields listed in "dicts" hold indexes into that table (a list of indexes for
+list fields such as tags). URL fields that embed the item id are stored as an
+index into "templates", where "{id}" stands for the row's id, e.g.
+"https://cdn.midjourney.com/{id}/0_0.png"; URLs without the id stay literal
+strings. Missing values are null, and trailing nulls are trimmed from each
+row, so rarely-set fields placed last cost nothing. gallery.js expands rows
+back into item objects.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Iterable
+
+
+PAYLOAD_FORMAT = 1
+
+# Fields each page reads from the payload, most-often-set first.
+PAYLOAD_SCHEMAS: dict[str, tuple[str, ...]] = {
+    # gallery.js: grid cards, filters, search haystack and the detail modal.
+    "gallery": ("id", "name", "type", "model", "created", "cdn_url", "prompt", "tags", "url", "thumbnail_url"),
+}
+
+# Low-cardinality fields worth replacing with indexes into a string table.
+DICTIONARY_FIELDS = ("model", "source", "type", "tags")
+# Fields whose values usually repeat the item id inside a fixed URL pattern.
+TEMPLATE_FIELDS = ("url", "cdn_url", "thumbnail_url")
+ID_PLACEHOLDER = "{id}"
+
+
+def _json_size(value: Any) -> int:
+    return len(json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+
+def project_items(items: Iterable[dict[str, Any]], schema: str, dictionary: bool = True) -> dict[str, Any]:
+    """Return the compact row payload for items under the named schema."""
+    fields = PAYLOAD_SCHEMAS[schema]
+    if fields[0] != "id":
+        raise ValueError(f"payload schema {schema!r} must start with id")
+    encoded = [field for field in fields if dictionary and field in DICTIONARY_FIELDS]
+    tables: dict[str, dict[str, int]] = {field: {} for field in encoded}
+    templates: dict[str, dict[str, int]] = {field: {} for field in fields if dictionary and field in TEMPLATE_FIELDS}
+
+    rows = []
+    for item in items:
+        row = []
+        item_id = str(item.get("id") or "")
+        for field in fields:
+            value = item.get(field)
+            table = tables.get(field)
+            template_table = templates.get(field)
+            if template_table is not None and isinstance(value, str) and item_id and item_id in value:
+                value = template_table.setdefault(value.replace(item_id, ID_PLACEHOLDER), len(template_table))
+            elif table is not None and value is not None:
+                if isinstance(value, list):
+                    value = [table.setdefault(str(entry), len(table)) for entry in value]
+                else:
+                    value = table.setdefault(str(value), len(table))
+            row.append(value)
+        while row and row[-1] is None:
+            row.pop()
+        rows.append(row)
+
+    return {
+        "schema": PAYLOAD_FORMAT,
+        "fields": list(fields),
+        "dicts": {field: list(table) for field, table in tables.items()},
+        "templates": {field: list(table) for field, table in templates.items() if table},
+        "rows": rows,
+    }
+
+
+def render_projected(payload: dict[str, Any]) -> bytes:
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def field_size_report(items: list[dict[str, Any]], payload: dict[str, Any]) -> list[tuple[str, int, int]]:
+    """Bytes per field as (field, in gallery.json, in the projected payload).
+
+    The gallery.json figure counts the key and the indent=2 value; the
+    projected figure counts the row value plus the field's dictionary or
+    template table. Dropped fields report 0 projected bytes.
+    """
+    original: dict[str, int] = {}
+    for item in items:
+        for field, value in item.items():
+            original[field] = original.get(field, 0) + len(f'"{field}": '.encode("utf-8")) + len(
+                json.dumps(value, indent=2, ensure_ascii=True).encode("utf-8")
+            )
+
+    projected = {field: _json_size(table) for field, table in payload["dicts"].items()}
+    for field, table in payload.get("templates", {}).items():
+        projected[field] = projected.get(field, 0) + _json_size(table)
+    for row in payload["rows"]:
+        for field, value in zip(payload["fields"], row):
+            projected[field] = projected.get(field, 0) + _json_size(value) + 1
+
+    return sorted(
+        ((field, original.get(field, 0), projected.get(field, 0)) for field in original.keys() | projected.keys()),
+        key=lambda entry: entry[1],
+        reverse=True,
+    )
+
+
+def print_size_report(report: list[tuple[str, int, int]], total_before: int, total_after: int) -> None:
+    print(f"{'Field':<16}{'gallery.json':>14}{'payload':>12}")
+    for field, before, after in report:
+        print(f"{field:<16}{before:>14,}{after:>12,}")
+    saved = 1 - total_after / total_before if total_before else 0.0
+    print(f"{'Total':<16}{total_before:>14,}{total_after:>12,}  ({saved:.0%} smaller)")
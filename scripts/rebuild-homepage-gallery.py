@@ -11,10 +11,13 @@ so future repoints do not depend on parsing Midjourney URLs.
 from __future__ import annotations
 
 import argparse
-import json
 import re
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Mapping
+
+from build_profile import add_profile_argument, profiling, stage
+from gallery_columns import open_columns
+from gallery_data import load_items, write_items
 
 
 PROJECT_DIR = Path(__file__).resolve().parent.parent
@@ -31,28 +34,17 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--gallery", type=Path, default=GALLERY_PATH, help="Path to data/gallery.json")
     parser.add_argument("--homepage", type=Path, default=HOMEPAGE_PATH, help="Path to data/homepage-gallery.json")
     parser.add_argument("--check", action="store_true", help="Exit non-zero when the homepage payload is out of date")
+    add_profile_argument(parser)
     return parser.parse_args()
 
 
-def load_items(path: Path) -> list[dict[str, Any]]:
-    payload = json.loads(path.read_text(encoding="utf-8"))
-    if isinstance(payload, dict):
-        items = payload.get("items", [])
-    else:
-        items = payload
-
-    if not isinstance(items, list):
-        raise ValueError(f"{path} does not contain a list of items")
-    return items
-
-
 def extract_job_id(value: str) -> str:
     match = UUID_PATTERN.search(value)
     return match.group(1).lower() if match else ""
 
 
-def build_gallery_lookup(items: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
-    lookup: dict[str, dict[str, Any]] = {}
+def build_gallery_lookup(items: Iterable[Mapping[str, Any]]) -> dict[str, Mapping[str, Any]]:
+    lookup: dict[str, Mapping[str, Any]] = {}
     for item in items:
         item_id = str(item.get("id") or "").strip().lower()
         if item_id:
@@ -67,7 +59,7 @@ def build_gallery_lookup(items: list[dict[str, Any]]) -> dict[str, dict[str, Any
     return lookup
 
 
-def rebuild_items(homepage_items: list[dict[str, Any]], gallery_lookup: dict[str, dict[str, Any]]) -> tuple[list[dict[str, Any]], list[str]]:
+def rebuild_items(homepage_items: list[dict[str, Any]], gallery_lookup: dict[str, Mapping[str, Any]]) -> tuple[list[dict[str, Any]], list[str]]:
     rebuilt: list[dict[str, Any]] = []
     missing: list[str] = []
 
@@ -93,15 +85,14 @@ def rebuild_items(homepage_items: list[dict[str, Any]], gallery_lookup: dict[str
     return rebuilt, missing
 
 
-def render_payload(items: list[dict[str, Any]]) -> str:
-    return json.dumps({"items": items}, indent=2, ensure_ascii=False) + "\n"
-
-
-def main() -> int:
-    args = parse_args()
-    gallery_items = load_items(args.gallery)
-    homepage_items = load_items(args.homepage)
-    rebuilt_items, missing = rebuild_items(homepage_items, build_gallery_lookup(gallery_items))
+def run(args: argparse.Namespace) -> int:
+    with stage("load"):
+        homepage_items = load_items(args.homepage)
+        # Only id/name/cdn_url/created/type are read from the gallery, so the
+        # columnar sidecar is enough; it is rebuilt from the JSON when stale.
+        gallery_rows = open_columns(args.gallery).rows()
+    with stage("rebuild"):
+        rebuilt_items, missing = rebuild_items(homepage_items, build_gallery_lookup(gallery_rows))
 
     if missing:
         print("Homepage gallery items could not be matched back to data/gallery.json:")
@@ -109,21 +100,28 @@ def main() -> int:
             print(f"- {name}")
         return 1
 
-    rendered = render_payload(rebuilt_items)
-    existing = args.homepage.read_text(encoding="utf-8")
-
     if args.check:
-        if existing != rendered:
+        if write_items(args.homepage, rebuilt_items, apply=False):
             print(f"Homepage gallery payload is out of date: {args.homepage}")
             return 1
         print(f"Homepage gallery payload is current: {args.homepage}")
         return 0
 
-    args.homepage.write_text(rendered, encoding="utf-8")
-    print(f"Updated {args.homepage}")
+    with stage("write"):
+        changed = write_items(args.homepage, rebuilt_items)
+    if changed:
+        print(f"Updated {args.homepage}")
+    else:
+        print(f"Homepage gallery payload already current: {args.homepage}")
     print(f"Homepage items rebuilt: {len(rebuilt_items)}")
     return 0
 
 
+def main() -> int:
+    args = parse_args()
+    with profiling("rebuild-homepage-gallery", args):
+        return run(args)
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
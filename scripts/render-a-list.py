@@ -14,6 +14,9 @@ from html import escape
 from pathlib import Path
 from typing import Any
 
+from build_profile import add_profile_argument, profiling, stage
+from site_io import write_text
+
 
 PROJECT_DIR = Path(__file__).resolve().parent.parent
 SNAPSHOT_PATH = PROJECT_DIR / "data" / "a-list-benchmarks.json"
@@ -93,6 +96,7 @@ def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--snapshot", type=Path, default=SNAPSHOT_PATH)
     parser.add_argument("--check", action="store_true", help="Exit non-zero if rendered A-List pages are out of date")
+    add_profile_argument(parser)
     return parser.parse_args()
 
 
@@ -531,40 +535,65 @@ def render_detail_page(category: dict[str, Any]) -> str:
 
 
 def build_outputs(snapshot: dict[str, Any]) -> dict[Path, str]:
-    outputs: dict[Path, str] = {OVERVIEW_PATH: render_cinematic_overview(snapshot)}
+    with stage(f"render:{OVERVIEW_PATH.name}"):
+        outputs: dict[Path, str] = {OVERVIEW_PATH: render_cinematic_overview(snapshot)}
     for category in snapshot.get("categories", []):
-        outputs[DETAILS_DIR / detail_filename(category["slug"])] = render_detail_page(category)
+        path = DETAILS_DIR / detail_filename(category["slug"])
+        with stage(f"render:a-list/{path.name}"):
+            outputs[path] = render_detail_page(category)
     return outputs
 
 
-def main() -> int:
-    args = parse_args()
-    snapshot = json.loads(args.snapshot.read_text(encoding="utf-8"))
-    outputs = build_outputs(snapshot)
+def output_differences(snapshot: dict[str, Any]) -> dict[Path, str]:
+    """Map each out-of-date rendered page to where it first differs from a fresh render."""
+    differences: dict[Path, str] = {}
+    for output_path, rendered in build_outputs(snapshot).items():
+        if not output_path.exists():
+            differences[output_path] = "missing"
+            continue
+        existing = output_path.read_text(encoding="utf-8")
+        if existing == rendered:
+            continue
+        existing_lines = existing.splitlines()
+        rendered_lines = rendered.splitlines()
+        line = next(
+            (index for index, (old, new) in enumerate(zip(existing_lines, rendered_lines), start=1) if old != new),
+            min(len(existing_lines), len(rendered_lines)) + 1,
+        )
+        differences[output_path] = f"differs from line {line}"
+    return differences
 
-    if args.check:
-        outdated_paths: list[Path] = []
-        for output_path, rendered in outputs.items():
-            if not output_path.exists() or output_path.read_text(encoding="utf-8") != rendered:
-                outdated_paths.append(output_path)
 
-        if outdated_paths:
+def run(args: argparse.Namespace) -> int:
+    with stage("load"):
+        snapshot = json.loads(args.snapshot.read_text(encoding="utf-8"))
+
+    if args.check:
+        differences = output_differences(snapshot)
+        if differences:
             print("Rendered A-List pages are out of date:")
-            for path in outdated_paths:
-                print(f"- {path}")
+            for path, detail in differences.items():
+                print(f"- {path} ({detail})")
             return 1
 
-        print(f"Rendered A-List pages are current: {len(outputs)} files checked")
+        print(f"Rendered A-List pages are current: {len(snapshot.get('categories', [])) + 1} files checked")
         return 0
 
-    DETAILS_DIR.mkdir(parents=True, exist_ok=True)
-    for output_path, rendered in outputs.items():
-        output_path.write_text(rendered, encoding="utf-8")
+    outputs = build_outputs(snapshot)
+    with stage("write"):
+        for output_path, rendered in outputs.items():
+            write_text(output_path, rendered)
 
     print(f"Rendered A-List overview: {OVERVIEW_PATH}")
     print(f"Rendered A-List detail pages: {len(snapshot.get('categories', []))}")
     return 0
 
 
+def main() -> int:
+    args = parse_args()
+    with profiling("render-a-list", args):
+        return run(args)
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
@@ -4,20 +4,87 @@
 The public site is still static HTML. This script is a local authoring helper:
 it reads the existing JSON/markdown payloads, adds the cinematic frame metadata
 needed by the design, then writes the in-scope public pages.
+
+Each run records the content hashes of every input a page was rendered from in
+.cache/render-cinematic-site.json. Pages whose inputs (and on-disk output) are
+unchanged since the last run are skipped, so a single new digest only
+re-renders news.html. Pass --force to ignore the recorded state, and
+--profile for a per-stage timing report (see build_profile).
+
+Every output goes through site_io.OutputSet: a page or payload whose bytes
+match the file on disk is not rewritten, so its mtime stays put. --check
+renders without writing anything and lists the files that would change,
+with their byte deltas, exiting 1 when there are any.
 """
 
 from __future__ import annotations
 
+import argparse
 import hashlib
 import json
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
 from html import escape
 from pathlib import Path
+from typing import Callable, Iterable, Iterator
 from urllib.parse import urlparse
 
+from build_profile import add_profile_argument, profiling, stage
+from digest_manifest import DIGEST_PATTERN
+from gallery_data import iter_items, iter_payload_chunks, load_items
+from site_io import OutputSet, write_text
+
 
 ROOT = Path(__file__).resolve().parent.parent
+RENDERER_PATH = Path(__file__).resolve()
+# The renderer and the sibling modules its output passes through; editing any
+# of them makes every output stale.
+CODE_INPUTS = [
+    RENDERER_PATH,
+    RENDERER_PATH.parent / "digest_manifest.py",
+    RENDERER_PATH.parent / "gallery_data.py",
+    RENDERER_PATH.parent / "site_io.py",
+]
+GALLERY_PATH = ROOT / "data" / "gallery.json"
+HOMEPAGE_PATH = ROOT / "data" / "homepage-gallery.json"
+ALIST_PATH = ROOT / "data" / "a-list-benchmarks.json"
+DIGEST_INDEX_PATH = ROOT / "news-digests" / "index.json"
+BUILD_STATE_PATH = ROOT / ".cache" / "render-cinematic-site.json"
+BUILD_STATE_VERSION = 1
+NEWS_DIGEST_LIMIT = 32
+GALLERY_SHARD_DIR = ROOT / "gallery"
+GALLERY_SHARD_INDEX = GALLERY_SHARD_DIR / "index.json"
+GALLERY_INLINE_FRAMES = 24
+GALLERY_SHARD_SIZE = 96
+GALLERY_SEARCH_INDEX = ROOT / "data" / "gallery-search.json"
+SEARCH_TOKEN_CACHE_PATH = ROOT / ".cache" / "gallery-search-tokens.json"
+SEARCH_INDEX_VERSION = 1
+SEARCH_TOKEN_PATTERN = re.compile(r"[^\W_]+")
+DIGEST_CACHE_PATH = ROOT / ".cache" / "news-digests.json"
+# Bump when parse_digest extracts anything differently.
+DIGEST_PARSER_VERSION = 4
+STORY_FIELDS = ("title", "href", "topic", "source", "summary", "tags")
+NEWS_ARCHIVE_DIR = ROOT / "news"
+NEWS_ARCHIVE_PAGE_SIZE = 32
+# Fewer stale archive pages than this render in-process; a pool costs more to start.
+NEWS_POOL_MIN_PAGES = 16
+NEWS_SEARCH_DIR = ROOT / "data" / "news-search"
+NEWS_SEARCH_INDEX = NEWS_SEARCH_DIR / "index.json"
+NEWS_SEARCH_TOKEN_CACHE_PATH = ROOT / ".cache" / "news-search-tokens.json"
+NEWS_SEARCH_VERSION = 3
+# Query parameters that only track where a click came from; they never tell two stories apart.
+TRACKING_PARAMS = {"ref", "rank", "source", "s", "t", "fbclid", "gclid", "mc_cid", "mc_eid"}
+NEWS_SEARCH_PREFIX_LENGTH = 1
+NEWS_SEARCH_DOC_SHARD_SIZE = 256
+BM25_K1 = 1.2
+BM25_B = 0.75
+# Rendered frame widths, matching the .cn-grid breakpoints in cinematic.css.
+FRAME_IMAGE_SIZES = {
+    "plate": "(max-width: 640px) 100vw, (max-width: 920px) 50vw, (max-width: 1180px) 33vw, 25vw",
+    "full": "(max-width: 920px) 100vw, 66vw",
+}
 DOMAIN = "https://axylusion.com"
 SCHEMA_NONCE = "axylusion-cinematic-schema"
 TONES = [
@@ -61,15 +128,80 @@ def read_json(path: Path):
 
 
 def write_json(path: Path, payload) -> None:
-    path.write_text(json.dumps(payload, indent=2, ensure_ascii=True) + "\n", encoding="utf-8")
+    write_text(path, json.dumps(payload, indent=2, ensure_ascii=True) + "\n")
 
 
 def clean_page(html: str) -> str:
     return re.sub(r"[ \t]+(?=\r?\n)", "", html).rstrip() + "\n"
 
 
-def write_page(path: Path, html: str) -> None:
-    path.write_text(clean_page(html), encoding="utf-8")
+def write_page(outputs: OutputSet, path: Path, html: str) -> bool:
+    return outputs.write_text(path, clean_page(html))
+
+
+def rel_path(path: Path) -> str:
+    return path.resolve().relative_to(ROOT).as_posix()
+
+
+class BuildGraph:
+    """Content hashes of the inputs each output was last built from."""
+
+    def __init__(self, path: Path, force: bool = False) -> None:
+        self.path = path
+        self.nodes: dict[str, dict] = {}
+        self._hashes: dict[Path, str] = {}
+        self._names: dict[Path, str] = {}
+        if force or not path.exists():
+            return
+        try:
+            state = read_json(path)
+        except (OSError, ValueError):
+            return
+        if isinstance(state, dict) and state.get("version") == BUILD_STATE_VERSION:
+            self.nodes = state.get("nodes", {})
+
+    def digest(self, path: Path) -> str:
+        if path not in self._hashes:
+            try:
+                self._hashes[path] = hashlib.sha256(path.read_bytes()).hexdigest()
+            except FileNotFoundError:
+                self._hashes[path] = ""
+        return self._hashes[path]
+
+    def name(self, path: Path) -> str:
+        # Archive pages share their digests as inputs, so names are resolved once per run.
+        if path not in self._names:
+            self._names[path] = rel_path(path)
+        return self._names[path]
+
+    def fingerprint(self, inputs: list[Path]) -> dict[str, str]:
+        return {self.name(path): self.digest(path) for path in inputs}
+
+    def is_current(self, output: Path, inputs: list[Path], params: dict | None = None, extras: list[Path] | None = None) -> bool:
+        node = self.nodes.get(self.name(output))
+        if not node or not self.digest(output):
+            return False
+        return (
+            node.get("output") == self.digest(output)
+            and node.get("inputs") == self.fingerprint(inputs)
+            and node.get("params", {}) == (params or {})
+            and node.get("extras", {}) == self.fingerprint(extras or [])
+        )
+
+    def record(self, output: Path, inputs: list[Path], params: dict | None = None, extras: list[Path] | None = None) -> None:
+        # Inputs are only read during a run; the output and its extras may just have been rewritten.
+        for path in [output, *(extras or [])]:
+            self._hashes.pop(path, None)
+        node = {"inputs": self.fingerprint(inputs), "output": self.digest(output)}
+        if params:
+            node["params"] = params
+        if extras:
+            node["extras"] = self.fingerprint(extras)
+        self.nodes[self.name(output)] = node
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        write_json(self.path, {"version": BUILD_STATE_VERSION, "nodes": dict(sorted(self.nodes.items()))})
 
 
 def slugify(value: str) -> str:
@@ -125,16 +257,24 @@ def page_url(path: str = "") -> str:
     return f"{DOMAIN}/{path}".rstrip("/") + ("" if path else "/")
 
 
+def root_prefix(current: str) -> str:
+    """The relative path from a page at current (e.g. "news/2026-05.html") back to the site root."""
+    return "../" * current.count("/")
+
+
 def local_link(current: str, target: str) -> str:
-    if current.startswith("a-list/") and not target.startswith(("http", "#", "mailto:")):
-        return f"../{target}"
-    return target
+    if target.startswith(("http", "#", "mailto:")):
+        return target
+    return f"{root_prefix(current)}{target}"
+
+
+def frame_id(item: dict, index: int) -> str:
+    return str(item.get("id") or "").strip() or slugify(str(item.get("name") or f"frame-{index + 1}"))
 
 
 def normalize_item(item: dict, index: int, prompt_lookup: dict[str, str] | None = None) -> dict:
-    item_id = str(item.get("id") or "").strip()
-    if not item_id:
-        item_id = slugify(str(item.get("name") or f"frame-{index + 1}"))
+    item_id = frame_id(item, index)
+    if not str(item.get("id") or "").strip():
         item["id"] = item_id
     item.setdefault("ref", frame_ref(index))
     item.setdefault("tones", tone_for(item_id))
@@ -145,33 +285,55 @@ def normalize_item(item: dict, index: int, prompt_lookup: dict[str, str] | None
     return item
 
 
-def load_and_migrate_gallery() -> tuple[list[dict], list[dict]]:
-    gallery_path = ROOT / "data" / "gallery.json"
-    home_path = ROOT / "data" / "homepage-gallery.json"
-    gallery_payload = read_json(gallery_path)
-    gallery_items = gallery_payload.get("items", [])
-    for index, item in enumerate(gallery_items):
+def migrated_gallery(items: Iterable[dict], home_items: list[dict], frames: dict[str, dict]) -> Iterator[dict]:
+    """Yield items with frame metadata filled in, keeping the ones home_items shows in frames."""
+    wanted = {frame_id(item, index) for index, item in enumerate(home_items)}
+    for index, item in enumerate(items):
         normalize_item(item, index)
+        item_id = frame_id(item, index)
+        if item_id in wanted:
+            frames[item_id] = item
+        yield item
 
-    prompt_lookup = {str(item.get("id")): prompt_for(item) for item in gallery_items}
-    ref_lookup = {str(item.get("id")): item.get("ref") for item in gallery_items}
-    tone_lookup = {str(item.get("id")): item.get("tones") for item in gallery_items}
 
-    home_payload = read_json(home_path)
-    home_items = home_payload.get("items", [])
+def migrate_home(home_items: list[dict], frames: dict[str, dict]) -> None:
+    """Fill in homepage frames, taking prompt, ref and tones from the gallery frames they show."""
+    prompt_lookup = {item_id: prompt_for(item) for item_id, item in frames.items()}
     for index, item in enumerate(home_items):
         normalize_item(item, index, prompt_lookup)
-        item_id = str(item.get("id"))
-        if item_id in ref_lookup:
-            item["ref"] = ref_lookup[item_id]
-        if item_id in tone_lookup:
-            item["tones"] = tone_lookup[item_id]
-
-    write_json(gallery_path, gallery_payload)
-    write_json(home_path, home_payload)
+        frame = frames.get(frame_id(item, index))
+        if frame is not None:
+            item["ref"] = frame.get("ref")
+            item["tones"] = frame.get("tones")
+
+
+def load_and_migrate_gallery() -> tuple[list[dict], list[dict]]:
+    """Load both gallery payloads with frame metadata filled in.
+
+    The pages sort, slice and index the whole gallery, so this holds it in
+    memory; migrate_gallery rewrites the payloads without doing so.
+    """
+    frames: dict[str, dict] = {}
+    with stage("read"):
+        home_items = load_items(HOMEPAGE_PATH)
+        gallery_items = list(migrated_gallery(iter_items(GALLERY_PATH), home_items, frames))
+    migrate_home(home_items, frames)
     return gallery_items, home_items
 
 
+def migrate_gallery(outputs: OutputSet) -> None:
+    """Write both payloads back through outputs with frame metadata filled in (only where their bytes change).
+
+    gallery.json is streamed item by item from the old file into the new
+    one, so migrating holds only the homepage's frames in memory.
+    """
+    frames: dict[str, dict] = {}
+    home_items = load_items(HOMEPAGE_PATH)
+    outputs.write_chunks(GALLERY_PATH, iter_payload_chunks(migrated_gallery(iter_items(GALLERY_PATH), home_items, frames)))
+    migrate_home(home_items, frames)
+    outputs.write_chunks(HOMEPAGE_PATH, iter_payload_chunks(home_items))
+
+
 def social_links(large: bool = False) -> str:
     socials = [
         ("X", "https://x.com/Axylusion", "X / @Axylusion"),
@@ -216,7 +378,7 @@ def header(active: str, current_path: str = "") -> str:
 
 
 def footer(current_path: str = "") -> str:
-    prefix = "../" if current_path.startswith("a-list/") else ""
+    prefix = root_prefix(current_path)
     main_links = [
         ("Gallery", "gallery.html"),
         ("Videos", "videos.html"),
@@ -279,12 +441,40 @@ def untitled_note(compact: bool = False) -> str:
       </div>"""
 
 
+def frame_image(item: dict, alt: str, sizes: str) -> str:
+    """<img> for a frame, or a <picture> with srcset when derivatives exist.
+
+    Derivatives come from `migrate-images.py derivatives`. The widest WebP is
+    the fallback src and sets the intrinsic width/height; other formats (AVIF)
+    become <source> elements ahead of it.
+    """
+    by_format: dict[str, list[dict]] = {}
+    for derivative in item.get("derivatives") or []:
+        by_format.setdefault(str(derivative.get("format")), []).append(derivative)
+    fallback = sorted(by_format.pop("webp", []), key=lambda derivative: int(derivative["width"]))
+    if not fallback:
+        src = escape(str(item.get("src") or ""))
+        return f'<img class="cn-frame__img" src="{src}" alt="{alt}" loading="lazy" decoding="async">' if src else ""
+
+    def srcset(derivatives: list[dict]) -> str:
+        return escape(", ".join(f"{derivative['src']} {int(derivative['width'])}w" for derivative in derivatives))
+
+    largest = fallback[-1]
+    sources = "".join(
+        f'<source type="image/{escape(fmt)}" srcset="{srcset(sorted(derivatives, key=lambda derivative: int(derivative["width"])))}" sizes="{escape(sizes)}">'
+        for fmt, derivatives in sorted(by_format.items())
+    )
+    return (
+        f'<picture>{sources}<img class="cn-frame__img" src="{escape(str(largest["src"]))}" srcset="{srcset(fallback)}" sizes="{escape(sizes)}" '
+        f'width="{int(largest["width"])}" height="{int(largest["height"])}" alt="{alt}" loading="lazy" decoding="async"></picture>'
+    )
+
+
 def frame(item: dict, index: int, ratio: str = "3/4", mode: str = "plate", caption: bool = False, extra: str = "") -> str:
     ref = escape(str(item.get("ref") or frame_ref(index)))
     date = escape(fmt_date(str(item.get("created") or "")))
     prompt = escape(prompt_for(item))
-    src = escape(str(item.get("src") or ""))
-    img = f'<img class="cn-frame__img" src="{src}" alt="Frame {ref}, {date}" loading="lazy" decoding="async">' if src else ""
+    img = frame_image(item, f"Frame {ref}, {date}", FRAME_IMAGE_SIZES.get(mode, FRAME_IMAGE_SIZES["full"]))
     cap = (
         f'<figcaption class="cn-frame__cap"><span class="cn-frame__cap-label">Prompt</span><span class="cn-frame__cap-text">{prompt}</span></figcaption>'
         if caption
@@ -325,9 +515,11 @@ def base_schema() -> list[dict]:
 
 
 def page_shell(path: str, title: str, description: str, active: str, body: str, schema: list[dict] | None = None) -> str:
-    prefix = "../" if path.startswith("a-list/") else ""
+    prefix = root_prefix(path)
     graph = {"@context": "https://schema.org", "@graph": base_schema() + (schema or [])}
     canonical = page_url(path)
+    with stage("jsonld"):
+        schema_json = json.dumps(graph, ensure_ascii=True)
     return f"""<!doctype html>
 <html lang="en-GB">
 <head>
@@ -350,7 +542,7 @@ def page_shell(path: str, title: str, description: str, active: str, body: str,
   <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
   <link href="https://fonts.googleapis.com/css2?family=Outfit:wght@300;400;500;600;700;800&family=Plus+Jakarta+Sans:wght@400;500;600;700&family=JetBrains+Mono:wght@400;500;600&display=swap" rel="stylesheet">
   <link rel="stylesheet" href="{prefix}cinematic.css">
-  <script type="application/ld+json" nonce="{SCHEMA_NONCE}">{json.dumps(graph, ensure_ascii=True)}</script>
+  <script type="application/ld+json" nonce="{SCHEMA_NONCE}">{schema_json}</script>
 </head>
 <body>
   <a class="skip-link" href="#main-content">Skip to content</a>
@@ -441,19 +633,129 @@ def render_home(gallery_items: list[dict], home_items: list[dict]) -> str:
     )
 
 
-def render_gallery(gallery_items: list[dict]) -> str:
-    cards = []
-    for index, item in enumerate(gallery_items):
-        prompt = prompt_for(item)
-        model = str(item.get("model") or item.get("source") or "Unknown")
-        type_label = str(item.get("type") or "image").title()
-        haystack = " ".join([prompt, str(item.get("id")), str(item.get("ref")), fmt_date(str(item.get("created")))]).lower()
-        cards.append(
-            f"""
-            <article class="cn-gallery-card" id="frame-{escape(str(item.get('ref')).lower())}" data-index="{index}" data-search="{escape(haystack)}" data-type="{escape(type_label)}" data-model="{escape(model)}" data-date="{escape(str(item.get('created') or ''))}">
+def gallery_card(item: dict, index: int) -> str:
+    model = str(item.get("model") or item.get("source") or "Unknown")
+    type_label = str(item.get("type") or "image").title()
+    return f"""
+            <article class="cn-gallery-card" id="frame-{escape(str(item.get('ref')).lower())}" data-index="{index}" data-type="{escape(type_label)}" data-model="{escape(model)}" data-date="{escape(str(item.get('created') or ''))}">
               {frame(item, index, caption=False)}
             </article>"""
-        )
+
+
+def search_haystack(item: dict) -> str:
+    created = str(item.get("created") or "")
+    model = str(item.get("model") or item.get("source") or "")
+    return " ".join([prompt_for(item), str(item.get("id")), str(item.get("ref")), fmt_date(created), created, model])
+
+
+def search_tokens(text: str) -> list[str]:
+    return sorted(set(SEARCH_TOKEN_PATTERN.findall(text.lower())))
+
+
+def build_search_index(gallery_items: list[dict], cache_path: Path = SEARCH_TOKEN_CACHE_PATH, apply: bool = True) -> str:
+    """Inverted index over each frame's prompt, id, ref, dates and model.
+
+    Tokens are sorted so the browser can binary-search them and walk every
+    token sharing a typed prefix. Each posting list holds the matching frame
+    indices (data-index) as ascending deltas. Tokens per frame are cached by
+    a hash of the frame's searchable text, so a rebuild only re-tokenizes
+    frames whose text changed. With apply=False the cache is only read.
+    """
+    try:
+        cache = read_json(cache_path)
+    except (OSError, ValueError):
+        cache = {}
+    cached = cache.get("items", {}) if cache.get("version") == SEARCH_INDEX_VERSION else {}
+
+    entries: dict[str, list] = {}
+    postings: dict[str, list[int]] = {}
+    for index, item in enumerate(gallery_items):
+        text = search_haystack(item)
+        key = hashlib.sha1(text.encode("utf-8")).hexdigest()
+        entry = cached.get(str(item.get("id")))
+        if not entry or entry[0] != key:
+            entry = [key, search_tokens(text)]
+        entries[str(item.get("id"))] = entry
+        for token in entry[1]:
+            postings.setdefault(token, []).append(index)
+
+    if apply and entries != cached:
+        write_text(cache_path, json.dumps({"version": SEARCH_INDEX_VERSION, "items": entries}, separators=(",", ":")))
+
+    tokens = sorted(postings)
+    encoded = []
+    for token in tokens:
+        previous = 0
+        deltas = []
+        for index in postings[token]:
+            deltas.append(index - previous)
+            previous = index
+        encoded.append(deltas)
+    return json.dumps(
+        {"version": SEARCH_INDEX_VERSION, "count": len(gallery_items), "tokens": tokens, "postings": encoded},
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+
+
+def gallery_page_order(gallery_items: list[dict]) -> list[int]:
+    """Frame indices in the gallery's default newest-first order."""
+    return sorted(range(len(gallery_items)), key=lambda index: str(gallery_items[index].get("created") or ""), reverse=True)
+
+
+def gallery_shard_path(page: int) -> Path:
+    return GALLERY_SHARD_DIR / f"page-{page:04d}.json"
+
+
+def render_gallery_shards(gallery_items: list[dict]) -> dict[Path, str]:
+    """Split every frame after the inline first page into lazily fetched shards.
+
+    Shard pages are numbered from 2 (page 1 is inline in gallery.html). The
+    index lists frame refs in page order so the pager can resolve a
+    #frame-xxxx deep link to the shard that holds it.
+    """
+    order = gallery_page_order(gallery_items)
+    remainder = order[GALLERY_INLINE_FRAMES:]
+    outputs: dict[Path, str] = {}
+    shards = []
+    for offset in range(0, len(remainder), GALLERY_SHARD_SIZE):
+        page = offset // GALLERY_SHARD_SIZE + 2
+        chunk = remainder[offset:offset + GALLERY_SHARD_SIZE]
+        path = gallery_shard_path(page)
+        payload = {"page": page, "start": GALLERY_INLINE_FRAMES + offset, "count": len(chunk), "cards": "".join(gallery_card(gallery_items[index], index) for index in chunk)}
+        outputs[path] = json.dumps(payload, ensure_ascii=True, separators=(",", ":")) + "\n"
+        shards.append(path.relative_to(ROOT).as_posix())
+    index_payload = {
+        "total": len(order),
+        "inline": GALLERY_INLINE_FRAMES,
+        "shard_size": GALLERY_SHARD_SIZE,
+        "shards": shards,
+        "refs": [str(gallery_items[index].get("ref")).lower() for index in order],
+    }
+    outputs[GALLERY_SHARD_INDEX] = json.dumps(index_payload, ensure_ascii=True, separators=(",", ":")) + "\n"
+    return outputs
+
+
+def gallery_shard_files() -> list[Path]:
+    return sorted([*GALLERY_SHARD_DIR.glob("page-*.json"), *GALLERY_SHARD_DIR.glob("index.json")])
+
+
+def sync_gallery_shards(outputs: OutputSet, gallery_items: list[dict], sharded: bool) -> None:
+    """Write the gallery shards, removing any left over from a larger or unsharded build."""
+    shards = render_gallery_shards(gallery_items) if sharded else {}
+    for path in gallery_shard_files():
+        if path not in shards:
+            outputs.remove(path)
+    for path, content in shards.items():
+        outputs.write_text(path, content)
+
+
+def render_gallery(gallery_items: list[dict], sharded: bool = False) -> str:
+    if sharded:
+        shown = gallery_page_order(gallery_items)[:GALLERY_INLINE_FRAMES]
+    else:
+        shown = list(range(len(gallery_items)))
+    cards = [gallery_card(gallery_items[index], index) for index in shown]
     models = sorted({str(item.get("model") or item.get("source") or "Unknown") for item in gallery_items})
     model_options = "".join(f'<option value="{escape(model)}">{escape(model)}</option>' for model in models)
     artwork = [
@@ -470,7 +772,7 @@ def render_gallery(gallery_items: list[dict]) -> str:
             "url": f"{DOMAIN}/gallery.html#frame-{str(item.get('ref')).lower()}",
             "isPartOf": {"@id": f"{DOMAIN}/gallery.html#gallery"},
         }
-        for item in gallery_items
+        for item in (gallery_items[index] for index in shown)
     ]
     schema = [
         {
@@ -481,6 +783,12 @@ def render_gallery(gallery_items: list[dict]) -> str:
             "image": artwork,
         }
     ]
+    grid_attrs = (
+        f' data-gallery-shards="{escape(GALLERY_SHARD_INDEX.relative_to(ROOT).as_posix())}" data-gallery-total="{len(gallery_items)}"'
+        if sharded
+        else ""
+    )
+    grid_attrs += f' data-gallery-search-index="{escape(GALLERY_SEARCH_INDEX.relative_to(ROOT).as_posix())}"'
     body = f"""
       <section class="cn-pagehead">
         <div class="cn-pagehead__inner"><span class="cn-kicker">Archive / {len(gallery_items):04d} frames</span><h1 class="cn-h1">Gallery</h1><p class="cn-lede">The complete image archive. Search by prompt fragment, frame ref, ID, date, type, or model.</p>{untitled_note()}</div>
@@ -497,16 +805,44 @@ def render_gallery(gallery_items: list[dict]) -> str:
           <button type="button" data-gallery-reset>Reset</button>
         </div>
       </section>
-      <section class="cn-grid" data-gallery-grid aria-live="polite">{''.join(cards)}</section>
+      <section class="cn-grid" data-gallery-grid{grid_attrs} aria-live="polite">{''.join(cards)}</section>
       <div class="cn-news-empty cn-hidden" data-gallery-empty><span class="cn-kicker">No matches</span><p>No frames match the current filters.</p><button class="cn-cta cn-cta--ghost cn-cta--sm" type="button" data-gallery-reset>Reset filters</button></div>
       <div class="cn-pager"><button class="cn-cta cn-cta--ghost" type="button" data-gallery-more>Load 24 more</button><span data-gallery-count>0001 - 0024 of {len(gallery_items):04d}</span></div>"""
     return page_shell("gallery.html", "Gallery | Axy Lusion", "Untitled AI-generated frames by Kol Tregaskes, indexed by frame reference and date.", "Gallery", body, schema)
 
 
 def parse_digest(path: Path) -> dict:
-    text = path.read_text(encoding="utf-8", errors="ignore")
+    return parse_digest_text(path.read_bytes().decode("utf-8", errors="ignore"), path.name)
+
+
+def parse_digest_text(text: str, slug: str) -> dict:
+    """Date and stories of one digest, in any of the layouts the news pipeline has written.
+
+    Current digests give each story a "## [title](url)" block. The older
+    News Scout digests list "- **title** ([Source](url))" items with an
+    indented summary, and the hand-edited January digests link their
+    stories from "- [title](url) - Source - date" lines under "## All
+    Headlines", grouped by "### Category". The date is the "**YYYY-MM-DD**"
+    line when there is one, else the file name's.
+    """
     date_match = re.search(r"\*\*(\d{4}-\d{2}-\d{2})\*\*", text)
-    date = date_match.group(1) if date_match else "1970-01-01"
+    name_match = DIGEST_PATTERN.match(slug)
+    if date_match:
+        date = date_match.group(1)
+    elif name_match:
+        date = "-".join(part for part in name_match.groups() if part)
+    else:
+        date = "1970-01-01"
+    stories = parse_story_blocks(text) or parse_scout_items(text) or parse_headline_lists(text)
+    return {"date": date, "stories": stories, "slug": slug}
+
+
+def elided_link(href: str) -> bool:
+    # Hand-written digests sometimes shorten a link to "https://site/2026/01/26/...".
+    return href.rstrip("/").endswith("...")
+
+
+def parse_story_blocks(text: str) -> list[dict]:
     stories = []
     for match in re.finditer(r"^## \[(?P<title>[^\]]+)\]\((?P<href>[^)]+)\)\s*\n(?P<meta>[\s\S]*?)(?=\n---|\Z)", text, re.MULTILINE):
         meta = match.group("meta")
@@ -518,62 +854,590 @@ def parse_digest(path: Path) -> dict:
                 topic = TOPIC_ALIASES[tag]
                 break
         source_match = re.search(r"\*([^*]+)\*", meta)
+        summary = " ".join(line[1:].strip() for line in meta.splitlines() if line.startswith(">"))
         stories.append(
             {
                 "title": match.group("title").strip(),
                 "href": match.group("href").strip(),
                 "topic": topic,
                 "source": source_match.group(1).strip() if source_match else "Source",
+                "summary": summary,
+                "tags": raw_tags if tags_match else [],
             }
         )
-    return {"date": date, "stories": stories, "slug": path.name}
+    return stories
+
+
+def parse_scout_items(text: str) -> list[dict]:
+    stories = []
+    pattern = r"^- \*\*(?P<title>.+?)\*\* \(\[(?P<source>[^\]]+)\]\((?P<href>[^)\s]+)\)\)[^\n]*\n(?P<summary>(?:[ \t]+\S[^\n]*\n?)*)"
+    for match in re.finditer(pattern, text, re.MULTILINE):
+        if elided_link(match.group("href")):
+            continue
+        stories.append(
+            {
+                "title": match.group("title").strip(),
+                "href": match.group("href").strip(),
+                "topic": "Tools",
+                "source": match.group("source").strip(),
+                "summary": " ".join(line.strip() for line in match.group("summary").splitlines() if line.strip()),
+                "tags": [],
+            }
+        )
+    return stories
+
+
+def parse_headline_lists(text: str) -> list[dict]:
+    section = re.search(r"^## All Headlines[^\n]*\n(?P<body>[\s\S]*?)(?=^## |\Z)", text, re.MULTILINE)
+    if not section:
+        return []
+    stories = []
+    category = ""
+    for line in section.group("body").splitlines():
+        if line.startswith("### "):
+            category = line[4:].strip()
+            continue
+        match = re.match(r"- \[(?P<title>[^\]]+)\]\((?P<href>[^)\s]+)\) - (?P<source>.+?) - ", line)
+        if not match or elided_link(match.group("href")):
+            continue
+        stories.append(
+            {
+                "title": match.group("title").strip(),
+                "href": match.group("href").strip(),
+                "topic": TOPIC_ALIASES.get(category.lower().replace(" ", "_"), "Tools"),
+                "source": match.group("source").strip(),
+                "summary": "",
+                "tags": [category] if category else [],
+            }
+        )
+    return stories
+
+
+def digest_paths(limit: int | None = NEWS_DIGEST_LIMIT) -> list[Path]:
+    manifest = read_json(DIGEST_INDEX_PATH)
+    return [ROOT / "news-digests" / filename for filename in manifest.get("files", [])[:limit]]
+
 
+def digest_parser_key() -> str:
+    aliases = json.dumps(TOPIC_ALIASES, sort_keys=True)
+    return f"{DIGEST_PARSER_VERSION}:{hashlib.sha1(aliases.encode('utf-8')).hexdigest()}"
 
-def load_digests(limit: int = 32) -> list[dict]:
-    manifest = read_json(ROOT / "news-digests" / "index.json")
+
+def load_digests(limit: int | None = NEWS_DIGEST_LIMIT, cache_path: Path = DIGEST_CACHE_PATH, apply: bool = True) -> list[dict]:
+    """Parsed digests from the manifest, newest first, skipping any without stories.
+
+    Parses are cached per file as [size, mtime_ns, sha1, date, stories],
+    each story a row of STORY_FIELDS values. A file whose size and
+    mtime match is not read at all; one that only changed mtime is read and
+    hashed but not re-parsed. The whole cache is dropped when the parser
+    version or TOPIC_ALIASES change. With apply=False the cache is only read.
+    """
+    try:
+        cache = read_json(cache_path)
+    except (OSError, ValueError):
+        cache = {}
+    parser_key = digest_parser_key()
+    cached = cache.get("files", {}) if cache.get("parser") == parser_key else {}
+
+    # Entries outside the requested slice are kept while the manifest lists them.
+    manifest = digest_paths(None)
+    listed = {path.name for path in manifest}
+    entries = {name: entry for name, entry in cached.items() if name in listed}
     digests = []
-    for filename in manifest.get("files", [])[:limit]:
-        path = ROOT / "news-digests" / filename
-        if path.exists():
-            digest = parse_digest(path)
-            if digest["stories"]:
-                digests.append(digest)
+    for path in manifest[:limit]:
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        entry = cached.get(path.name)
+        if not entry or entry[:2] != [stat.st_size, stat.st_mtime_ns]:
+            data = path.read_bytes()
+            digest_hash = hashlib.sha1(data).hexdigest()
+            if not entry or entry[2] != digest_hash:
+                parsed = parse_digest_text(data.decode("utf-8", errors="ignore"), path.name)
+                stories = [[story[field] for field in STORY_FIELDS] for story in parsed["stories"]]
+                entry = [0, 0, digest_hash, parsed["date"], stories]
+            entry = [stat.st_size, stat.st_mtime_ns, *entry[2:]]
+        entries[path.name] = entry
+        if entry[4]:
+            digests.append(
+                {
+                    "date": entry[3],
+                    "stories": [dict(zip(STORY_FIELDS, story)) for story in entry[4]],
+                    "slug": path.name,
+                }
+            )
+
+    if apply and entries != cached:
+        write_text(cache_path, json.dumps({"parser": parser_key, "files": entries}, ensure_ascii=False, separators=(",", ":")))
     return digests
 
 
-def render_news(gallery_items: list[dict]) -> str:
-    digests = load_digests()
-    latest = digests[0]
-    lead = latest["stories"][0]
-    digest_rows = []
-    for digest in digests:
-        date = parse_date(digest["date"])
-        items = "".join(
-            f'<li data-topic="{escape(story["topic"])}"><a href="{escape(story["href"])}" target="_blank" rel="noopener noreferrer">{escape(story["title"])}</a><span class="cn-digest__topic">{escape(story["topic"])}</span></li>'
-            for story in digest["stories"]
-        )
-        digest_rows.append(
-            f"""
+def digest_page_path(slug: str) -> str:
+    """Site-relative path of the pre-rendered page for a digest markdown file."""
+    return f"news/{Path(slug).stem}.html"
+
+
+def seen_range(story: dict) -> str:
+    """ "Seen 18 May 2026 - 20 May 2026" for a story carried by more than one digest, else ""."""
+    if story["first_seen"] == story["last_seen"]:
+        return ""
+    return f'<span class="cn-digest__seen">Seen {escape(fmt_date(story["first_seen"]))} - {escape(fmt_date(story["last_seen"]))}</span>'
+
+
+def digest_row(digest: dict, current_path: str, stories: list[dict] | None = None) -> str:
+    """One digest in a dated list; with the story index, repeated stories show the range they ran."""
+    date = parse_date(digest["date"])
+    items = "".join(
+        f'<li data-topic="{escape(story["topic"])}"><a href="{escape(story["href"])}" target="_blank" rel="noopener noreferrer">{escape(story["title"])}</a><span class="cn-digest__topic">{escape(story["topic"])}</span>{seen_range(stories[story["story"]]) if stories else ""}</li>'
+        for story in digest["stories"]
+    )
+    return f"""
             <article class="cn-digest" data-digest-date="{escape(digest['date'])}" data-digest-search="{escape(' '.join(story['title'] for story in digest['stories']).lower())}">
               <div class="cn-digest__date"><span class="cn-digest__day">{date.day}</span><span class="cn-digest__mon">{date.strftime('%b')}</span><span class="cn-digest__yr">{date.year}</span></div>
               <ul class="cn-digest__heads">{items}</ul>
-              <a class="cn-cta cn-cta--ghost cn-cta--sm" href="news-digests/{escape(digest['slug'])}">Open</a>
+              <a class="cn-cta cn-cta--ghost cn-cta--sm" href="{escape(local_link(current_path, digest_page_path(digest['slug'])))}">Open</a>
             </article>"""
+
+
+def story_url_key(href: str) -> str:
+    """The story's URL without scheme, www., tracking parameters, fragment or trailing slash."""
+    parts = urlparse(href.strip())
+    query = "&".join(
+        sorted(
+            pair
+            for pair in parts.query.split("&")
+            if pair and not (pair.split("=", 1)[0].lower() in TRACKING_PARAMS or pair.lower().startswith("utm_"))
         )
+    )
+    host = parts.netloc.lower().removeprefix("www.")
+    return f"{host}{parts.path.rstrip('/')}" + (f"?{query}" if query else "")
+
+
+def story_title_key(title: str) -> str:
+    return hashlib.sha1(" ".join(SEARCH_TOKEN_PATTERN.findall(title.lower())).encode("utf-8")).hexdigest()
+
+
+def build_story_index(digests: list[dict]) -> list[dict]:
+    """Fold digests (newest first, as load_digests returns them) into unique stories, oldest first.
+
+    Two stories are the same when their normalized URLs match, or when
+    their title hashes match and the URLs are on different hosts, so a link
+    re-shared with a new rank parameter, or a headline re-run from another
+    site, folds into the first sighting. Same-host pages sharing a title
+    are left apart: feeds sometimes give an image credit
+    ("Credit: VentureBeat made with Midjourney") as the title.
+    A URL one digest links from several different titles is a landing
+    page ("https://www.anthropic.com/news"), not a story, so it only
+    matches together with the same title.
+    Each unique story keeps that first sighting's fields plus first_seen,
+    last_seen and the digest slugs it appeared in, and each story in
+    digests gains "story", its index here. Parsing is already cached per
+    digest (see load_digests), so this is one pass of dict lookups.
+    """
+    stories: list[dict] = []
+    by_url: dict[str, int] = {}
+    by_title: dict[str, list[tuple[str, int]]] = {}
+    landing: set[str] = set()
+    for digest in digests:
+        titles: dict[str, str] = {}
+        for story in digest["stories"]:
+            url = story_url_key(story["href"])
+            title = story_title_key(story["title"])
+            if titles.setdefault(url, title) != title:
+                landing.add(url)
+    for digest in reversed(digests):
+        for story in digest["stories"]:
+            url = story_url_key(story["href"])
+            host = url.split("/", 1)[0]
+            title = story_title_key(story["title"])
+            key = f"{url}#{title}" if url in landing else url
+            index = by_url.get(key)
+            if index is None:
+                index = next((seen for seen_host, seen in by_title.get(title, ()) if seen_host != host), None)
+            if index is None:
+                index = len(stories)
+                stories.append({**story, "first_seen": digest["date"], "last_seen": digest["date"], "digests": [digest["slug"]]})
+            else:
+                entry = stories[index]
+                entry["first_seen"] = min(entry["first_seen"], digest["date"])
+                entry["last_seen"] = max(entry["last_seen"], digest["date"])
+                if entry["digests"][-1] != digest["slug"]:
+                    entry["digests"].append(digest["slug"])
+            by_url.setdefault(key, index)
+            if (host, index) not in by_title.setdefault(title, []):
+                by_title[title].append((host, index))
+            story["story"] = index
+    return stories
+
+
+def render_news(gallery_items: list[dict], digests: list[dict], stories: list[dict]) -> str:
+    """The latest NEWS_DIGEST_LIMIT digests, each story shown once under the newest digest carrying it."""
+    listed = {path.name for path in digest_paths()}
+    digests = [digest for digest in digests if digest["slug"] in listed]
+    latest = digests[0]
+    lead = latest["stories"][0]
+    digest_rows = []
+    shown: set[int] = set()
+    for digest in digests:
+        fresh = [story for story in digest["stories"] if story["story"] not in shown]
+        shown.update(story["story"] for story in fresh)
+        if fresh:
+            digest_rows.append(digest_row({**digest, "stories": fresh}, "news.html", stories))
     art = gallery_items[8] if len(gallery_items) > 8 else gallery_items[0]
     topics = ["All", "Image", "Video", "Audio", "3D", "Tools", "Benchmarks"]
     chips = "".join(f'<button type="button" class="cn-chip{" is-on" if topic == "All" else ""}" data-news-topic="{topic}" aria-pressed="{"true" if topic == "All" else "false"}">{topic}</button>' for topic in topics)
     body = f"""
       <section class="cn-pagehead"><div class="cn-pagehead__inner"><span class="cn-kicker">Dated digest archive / {escape(fmt_date(latest['date']))}</span><h1 class="cn-h1">News</h1><p class="cn-lede">Creative-AI headlines for image, video, audio, tools, 3D, and benchmarks. The lead story is fixed; filters apply to the digest list below.</p></div></section>
-      <section class="cn-news-lead"><div class="cn-news-lead__bg" style="{escape(frame_style(art))}"><div class="cn-frame__grain"></div><div class="cn-frame__vignette"></div></div><div class="cn-news-lead__copy"><span class="cn-kicker">Lead / {escape(fmt_date_long(latest['date']))} / {escape(lead['topic'])}</span><h2 class="cn-h2">{escape(lead['title'])}</h2><p>Most recent indexed creative-AI signal from the Axy Lusion digest archive.</p><div class="cn-cta-row"><a class="cn-cta cn-cta--primary" href="{escape(lead['href'])}" target="_blank" rel="noopener noreferrer">Open source</a><a class="cn-cta cn-cta--ghost" href="news-digests/{escape(latest['slug'])}">Read digest</a></div></div></section>
+      <section class="cn-news-lead"><div class="cn-news-lead__bg" style="{escape(frame_style(art))}"><div class="cn-frame__grain"></div><div class="cn-frame__vignette"></div></div><div class="cn-news-lead__copy"><span class="cn-kicker">Lead / {escape(fmt_date_long(latest['date']))} / {escape(lead['topic'])}</span><h2 class="cn-h2">{escape(lead['title'])}</h2><p>Most recent indexed creative-AI signal from the Axy Lusion digest archive.</p><div class="cn-cta-row"><a class="cn-cta cn-cta--primary" href="{escape(lead['href'])}" target="_blank" rel="noopener noreferrer">Open source</a><a class="cn-cta cn-cta--ghost" href="{escape(digest_page_path(latest['slug']))}">Read digest</a></div></div></section>
       <section class="cn-news-filters" aria-label="News filters">
         <div class="cn-news-filters__row"><label class="cn-search" for="news-search"><span class="cn-search__icon" aria-hidden="true">Search</span><input id="news-search" type="search" placeholder="Search headlines" data-news-search></label><div class="cn-news-filters__range"><button type="button" data-news-range="day" aria-pressed="false">Issue day</button><button type="button" data-news-range="week" aria-pressed="false">7-day window</button><button type="button" class="is-on" data-news-range="all" aria-pressed="true">All</button></div></div>
         <div class="cn-news-filters__chips"><span class="cn-kicker cn-kicker--sm">Topic</span>{chips}<button class="cn-news-filters__clear cn-hidden" type="button" data-news-clear>Clear all</button></div>
       </section>
-      <section class="cn-digests" data-news-list><div class="cn-digests__head"><span class="cn-kicker">Digest list</span><h2 class="cn-h2">By the day</h2>{untitled_note(True)}</div>{''.join(digest_rows)}<div class="cn-news-empty cn-hidden" data-news-empty><span class="cn-kicker">No matches</span><p>No stories match the current filters.</p><button class="cn-cta cn-cta--ghost cn-cta--sm" type="button" data-news-empty-reset>Clear filters</button></div></section>"""
+      <section class="cn-digests cn-news-results cn-hidden" data-news-results aria-live="polite"><div class="cn-digests__head"><span class="cn-kicker">Full archive</span><h2 class="cn-h2" data-news-results-title>Matching stories</h2></div><ul class="cn-digest__heads" data-news-results-list></ul></section>
+      <section class="cn-digests" data-news-list data-news-search-index="{escape(NEWS_SEARCH_INDEX.relative_to(ROOT).as_posix())}"><div class="cn-digests__head"><span class="cn-kicker">Digest list</span><h2 class="cn-h2">By the day</h2>{untitled_note(True)}</div>{''.join(digest_rows)}<div class="cn-news-empty cn-hidden" data-news-empty><span class="cn-kicker">No matches</span><p>No stories match the current filters.</p><button class="cn-cta cn-cta--ghost cn-cta--sm" type="button" data-news-empty-reset>Clear filters</button></div></section>
+      <div class="cn-pager"><a class="cn-cta cn-cta--ghost" href="news/index.html">Browse the full archive</a></div>"""
     return page_shell("news.html", "News | Axy Lusion", "Dated creative-AI digest archive for image, video, audio, tools, 3D, and benchmarks.", "News", body)
 
 
+def archive_pager(current_path: str, links: list[tuple[str, str | None]]) -> str:
+    """A pager row of (label, site-relative target) links; a None target renders as plain text."""
+    parts = [
+        f'<a class="cn-cta cn-cta--ghost cn-cta--sm" href="{escape(local_link(current_path, target))}">{escape(label)}</a>' if target else f"<span>{escape(label)}</span>"
+        for label, target in links
+    ]
+    return f'<nav class="cn-pager" aria-label="News archive">{"".join(parts)}</nav>'
+
+
+def archive_page_path(page: int) -> str:
+    return f"news/page-{page:04d}.html"
+
+
+def month_page_path(month: str) -> str:
+    return f"news/{month}.html"
+
+
+def year_page_path(year: str) -> str:
+    return f"news/{year}.html"
+
+
+def month_label(month: str) -> str:
+    parsed = parse_date(f"{month}-01")
+    return f"{parsed.strftime('%B')} {parsed.year}"
+
+
+def render_digest_page(digest: dict, newer: dict | None, older: dict | None) -> str:
+    """One digest with every story's source, topic and summary, linked to its neighbours by date."""
+    path = digest_page_path(digest["slug"])
+    date = parse_date(digest["date"])
+    month = digest["date"][:7]
+    stories = "".join(
+        f"""
+            <li data-topic="{escape(story['topic'])}"><a href="{escape(story['href'])}" target="_blank" rel="noopener noreferrer">{escape(story['title'])}</a><span class="cn-digest__topic">{escape(story['topic'])}</span><span class="cn-digest__source">{escape(story['source'])}</span>{f'<p class="cn-digest__summary">{escape(story["summary"])}</p>' if story.get('summary') else ''}</li>"""
+        for story in digest["stories"]
+    )
+    pager = archive_pager(
+        path,
+        [
+            (f"Newer / {fmt_date(newer['date'])}", digest_page_path(newer["slug"])) if newer else ("Newest digest", None),
+            (month_label(month), month_page_path(month)),
+            ("Archive", "news/index.html"),
+            (f"Older / {fmt_date(older['date'])}", digest_page_path(older["slug"])) if older else ("Oldest digest", None),
+        ],
+    )
+    count = len(digest["stories"])
+    body = f"""
+      <section class="cn-pagehead"><div class="cn-pagehead__inner"><span class="cn-kicker">News digest / {count} {"story" if count == 1 else "stories"}</span><h1 class="cn-h1">{escape(fmt_date_long(digest['date']))}</h1><p class="cn-lede">Creative-AI headlines indexed on {escape(fmt_date_long(digest['date']))}. <a href="{escape(local_link(path, f"news-digests/{digest['slug']}"))}">Markdown source</a>.</p></div></section>
+      <section class="cn-digests"><article class="cn-digest" data-digest-date="{escape(digest['date'])}"><div class="cn-digest__date"><span class="cn-digest__day">{date.day}</span><span class="cn-digest__mon">{date.strftime('%b')}</span><span class="cn-digest__yr">{date.year}</span></div><ul class="cn-digest__heads">{stories}</ul></article></section>
+      {pager}"""
+    title = f"News digest, {fmt_date_long(digest['date'])}"
+    return page_shell(path, f"{title} | Axy Lusion", f"{count} creative-AI headlines from {fmt_date_long(digest['date'])}.", "News", body)
+
+
+def render_archive_page(page: int, digests: list[dict], has_newer: bool) -> str:
+    """A fixed-size archive page; page 1 holds the oldest digests so existing pages stay put as news arrives."""
+    path = archive_page_path(page)
+    rows = "".join(digest_row(digest, path) for digest in digests)
+    span = f"{fmt_date(digests[-1]['date'])} - {fmt_date(digests[0]['date'])}"
+    pager = archive_pager(
+        path,
+        [
+            ("Newer", archive_page_path(page + 1)) if has_newer else ("Latest: News", "news.html"),
+            (f"Page {page}", None),
+            ("Archive", "news/index.html"),
+            ("Older", archive_page_path(page - 1)) if page > 1 else ("Oldest page", None),
+        ],
+    )
+    body = f"""
+      <section class="cn-pagehead"><div class="cn-pagehead__inner"><span class="cn-kicker">News archive / page {page}</span><h1 class="cn-h1">{escape(span)}</h1><p class="cn-lede">{len(digests)} dated creative-AI digests, newest first.</p></div></section>
+      <section class="cn-digests" data-news-list>{rows}</section>
+      {pager}"""
+    return page_shell(path, f"News archive, page {page} | Axy Lusion", f"Creative-AI news digests from {span}.", "News", body)
+
+
+def render_month_page(month: str, digests: list[dict], newer: str | None, older: str | None) -> str:
+    path = month_page_path(month)
+    rows = "".join(digest_row(digest, path) for digest in digests)
+    pager = archive_pager(
+        path,
+        [
+            (month_label(newer), month_page_path(newer)) if newer else ("Newest month", None),
+            (month[:4], year_page_path(month[:4])),
+            ("Archive", "news/index.html"),
+            (month_label(older), month_page_path(older)) if older else ("Oldest month", None),
+        ],
+    )
+    body = f"""
+      <section class="cn-pagehead"><div class="cn-pagehead__inner"><span class="cn-kicker">News archive / month</span><h1 class="cn-h1">{escape(month_label(month))}</h1><p class="cn-lede">{len(digests)} dated creative-AI digests, newest first.</p></div></section>
+      <section class="cn-digests" data-news-list>{rows}</section>
+      {pager}"""
+    return page_shell(path, f"News, {month_label(month)} | Axy Lusion", f"Creative-AI news digests from {month_label(month)}.", "News", body)
+
+
+def archive_months(path: str, months: dict[str, list[dict]]) -> str:
+    """Month headings linking to their pages, each with a link per digest day."""
+    sections = []
+    for month, digests in months.items():
+        days = "".join(
+            f'<li><a href="{escape(local_link(path, digest_page_path(digest["slug"])))}">{escape(fmt_date(digest["date"]))}</a><span class="cn-digest__topic">{len(digest["stories"])}</span></li>'
+            for digest in digests
+        )
+        sections.append(
+            f"""
+            <article class="cn-digest"><div class="cn-digest__date"><span class="cn-digest__mon">{escape(month_label(month))}</span></div><ul class="cn-digest__heads">{days}</ul><a class="cn-cta cn-cta--ghost cn-cta--sm" href="{escape(local_link(path, month_page_path(month)))}">Open</a></article>"""
+        )
+    return "".join(sections)
+
+
+def render_year_page(year: str, months: dict[str, list[dict]]) -> str:
+    path = year_page_path(year)
+    count = sum(len(digests) for digests in months.values())
+    body = f"""
+      <section class="cn-pagehead"><div class="cn-pagehead__inner"><span class="cn-kicker">News archive / year</span><h1 class="cn-h1">{escape(year)}</h1><p class="cn-lede">{count} dated creative-AI digests across {len(months)} {"month" if len(months) == 1 else "months"}.</p></div></section>
+      <section class="cn-digests">{archive_months(path, months)}</section>
+      {archive_pager(path, [("Latest: News", "news.html"), ("Archive", "news/index.html")])}"""
+    return page_shell(path, f"News, {year} | Axy Lusion", f"Creative-AI news digests from {year}, by month.", "News", body)
+
+
+def render_archive_index(years: dict[str, int], pages: int) -> str:
+    path = "news/index.html"
+    year_links = "".join(
+        f'<li><a href="{escape(local_link(path, year_page_path(year)))}">{escape(year)}</a><span class="cn-digest__topic">{count}</span></li>'
+        for year, count in years.items()
+    )
+    page_links = "".join(
+        f'<li><a href="{escape(local_link(path, archive_page_path(page)))}">Page {page}</a></li>' for page in range(pages, 0, -1)
+    )
+    body = f"""
+      <section class="cn-pagehead"><div class="cn-pagehead__inner"><span class="cn-kicker">News archive</span><h1 class="cn-h1">Every digest</h1><p class="cn-lede">Browse {sum(years.values())} dated creative-AI digests by year and month, or page through them {NEWS_ARCHIVE_PAGE_SIZE} at a time.</p></div></section>
+      <section class="cn-digests"><article class="cn-digest"><div class="cn-digest__date"><span class="cn-digest__mon">By year</span></div><ul class="cn-digest__heads">{year_links}</ul></article><article class="cn-digest"><div class="cn-digest__date"><span class="cn-digest__mon">By page</span></div><ul class="cn-digest__heads">{page_links}</ul></article></section>
+      {archive_pager(path, [("Latest: News", "news.html")])}"""
+    return page_shell(path, "News archive | Axy Lusion", "Every Axy Lusion creative-AI news digest, by year, month and page.", "News", body)
+
+
+def news_archive_plan(digests: list[dict]) -> list[tuple[Path, list[Path], dict, Callable[..., str], tuple]]:
+    """(output, input digests, params, render function, arguments) for every news archive page.
+
+    digests are newest first, as load_digests returns them. Params carry
+    whatever a page shows beyond its own digests' content (neighbour links,
+    whether a newer page exists), so the build graph re-renders exactly the
+    pages a change reaches.
+    """
+    source = {digest["slug"]: ROOT / "news-digests" / digest["slug"] for digest in digests}
+    plan: list[tuple[Path, list[Path], dict, Callable[..., str], tuple]] = []
+
+    for index, digest in enumerate(digests):
+        newer = digests[index - 1] if index else None
+        older = digests[index + 1] if index + 1 < len(digests) else None
+        params = {"newer": newer and [newer["slug"], newer["date"]], "older": older and [older["slug"], older["date"]]}
+        plan.append((ROOT / digest_page_path(digest["slug"]), [source[digest["slug"]]], params, render_digest_page, (digest, newer, older)))
+
+    chronological = digests[::-1]
+    pages = (len(chronological) + NEWS_ARCHIVE_PAGE_SIZE - 1) // NEWS_ARCHIVE_PAGE_SIZE
+    for page in range(1, pages + 1):
+        chunk = chronological[(page - 1) * NEWS_ARCHIVE_PAGE_SIZE:page * NEWS_ARCHIVE_PAGE_SIZE][::-1]
+        params = {"newer": page < pages}
+        plan.append((ROOT / archive_page_path(page), [source[digest["slug"]] for digest in chunk], params, render_archive_page, (page, chunk, page < pages)))
+
+    months: dict[str, list[dict]] = {}
+    for digest in digests:
+        months.setdefault(digest["date"][:7], []).append(digest)
+    month_keys = list(months)
+    years: dict[str, dict[str, list[dict]]] = {}
+    for index, month in enumerate(month_keys):
+        newer = month_keys[index - 1] if index else None
+        older = month_keys[index + 1] if index + 1 < len(month_keys) else None
+        inputs = [source[digest["slug"]] for digest in months[month]]
+        plan.append((ROOT / month_page_path(month), inputs, {"newer": newer, "older": older}, render_month_page, (month, months[month], newer, older)))
+        years.setdefault(month[:4], {})[month] = months[month]
+
+    for year, year_months in years.items():
+        inputs = [source[digest["slug"]] for digests_in_month in year_months.values() for digest in digests_in_month]
+        plan.append((ROOT / year_page_path(year), inputs, {}, render_year_page, (year, year_months)))
+
+    year_counts = {year: sum(len(month) for month in year_months.values()) for year, year_months in years.items()}
+    plan.append((NEWS_ARCHIVE_DIR / "index.html", [], {"years": year_counts, "pages": pages}, render_archive_index, (year_counts, pages)))
+    return plan
+
+
+def story_haystack(story: dict) -> str:
+    return " ".join([story["title"], story.get("summary", ""), story["source"], story["topic"], *story.get("tags", [])])
+
+
+def news_search_shard_name(prefix: str) -> str:
+    return f"terms-{prefix}.json" if re.fullmatch(r"[a-z0-9]+", prefix) else f"terms-u{prefix.encode('utf-8').hex()}.json"
+
+
+def build_news_search(stories: list[dict], cache_path: Path = NEWS_SEARCH_TOKEN_CACHE_PATH, apply: bool = True) -> dict[Path, str]:
+    """BM25 inverted index over the unique stories of build_story_index, as static files keyed by path.
+
+    Documents keep the story index's oldest-first numbering, so a new
+    digest appends documents and leaves existing ids alone. Terms are sharded by their first
+    NEWS_SEARCH_PREFIX_LENGTH characters into terms-<prefix>.json, each
+    {"terms": [...sorted], "postings": [[doc delta, tf, doc length, ...], ...]},
+    so a query fetches one shard per word and a new digest only rewrites
+    the shards its terms fall in. Result rows live in docs-NNNN.json shards
+    of NEWS_SEARCH_DOC_SHARD_SIZE, fetched for the top hits only. index.json
+    carries the BM25 constants, document count and average length, and the
+    prefix to shard map. Term counts per story are cached by a hash of the
+    story's text, so only new or edited stories are tokenized. With
+    apply=False the cache is only read.
+    """
+    try:
+        cache = read_json(cache_path)
+    except (OSError, ValueError):
+        cache = {}
+    cached = cache.get("stories", {}) if cache.get("version") == NEWS_SEARCH_VERSION else {}
+
+    entries: dict[str, list] = {}
+    docs: list[list] = []
+    postings: dict[str, list[int]] = {}
+    total_length = 0
+    for doc, story in enumerate(stories):
+        text = story_haystack(story)
+        key = hashlib.sha1(text.encode("utf-8")).hexdigest()
+        entry = cached.get(key) or entries.get(key)
+        if not entry:
+            counts: dict[str, int] = {}
+            for token in SEARCH_TOKEN_PATTERN.findall(text.lower()):
+                counts[token] = counts.get(token, 0) + 1
+            entry = [sum(counts.values()), counts]
+        entries[key] = entry
+        length, counts = entry
+        row = [story["title"], story["href"], story["last_seen"], digest_page_path(story["digests"][-1]), story["topic"], story["source"]]
+        if story["first_seen"] != story["last_seen"]:
+            row.append(story["first_seen"])
+        docs.append(row)
+        total_length += length
+        for term, count in counts.items():
+            postings.setdefault(term, []).append((doc, count, length))
+
+    if apply and entries != cached:
+        write_text(cache_path, json.dumps({"version": NEWS_SEARCH_VERSION, "stories": entries}, ensure_ascii=False, separators=(",", ":")))
+
+    shards: dict[str, list[str]] = {}
+    for term in sorted(postings):
+        shards.setdefault(term[:NEWS_SEARCH_PREFIX_LENGTH], []).append(term)
+    outputs: dict[Path, str] = {}
+    for prefix, terms in shards.items():
+        encoded = []
+        for term in terms:
+            previous = 0
+            flat: list[int] = []
+            for doc, count, length in postings[term]:
+                flat += [doc - previous, count, length]
+                previous = doc
+            encoded.append(flat)
+        payload = {"terms": terms, "postings": encoded}
+        outputs[NEWS_SEARCH_DIR / news_search_shard_name(prefix)] = json.dumps(payload, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+    doc_shards = []
+    for start in range(0, len(docs), NEWS_SEARCH_DOC_SHARD_SIZE):
+        name = f"docs-{start // NEWS_SEARCH_DOC_SHARD_SIZE:04d}.json"
+        payload = {"start": start, "docs": docs[start:start + NEWS_SEARCH_DOC_SHARD_SIZE]}
+        outputs[NEWS_SEARCH_DIR / name] = json.dumps(payload, ensure_ascii=False, separators=(",", ":")) + "\n"
+        doc_shards.append(name)
+
+    meta = {
+        "version": NEWS_SEARCH_VERSION,
+        "count": len(docs),
+        "avgdl": round(total_length / len(docs), 4) if docs else 0,
+        "k1": BM25_K1,
+        "b": BM25_B,
+        "prefix": NEWS_SEARCH_PREFIX_LENGTH,
+        "shards": {prefix: news_search_shard_name(prefix) for prefix in shards},
+        "doc_shard_size": NEWS_SEARCH_DOC_SHARD_SIZE,
+        "doc_shards": doc_shards,
+    }
+    # The index goes last, so a reader never sees it before the shards it names.
+    outputs[NEWS_SEARCH_INDEX] = json.dumps(meta, ensure_ascii=False, separators=(",", ":")) + "\n"
+    return outputs
+
+
+def news_search_files() -> list[Path]:
+    return sorted(NEWS_SEARCH_DIR.glob("*.json"))
+
+
+def sync_news_search(outputs: OutputSet, graph: BuildGraph, news: Callable[[], tuple[list[dict], list[dict]]]) -> list[str]:
+    """Rebuild the news search index when any digest changed; returns the paths changed."""
+    inputs = [DIGEST_INDEX_PATH, *digest_paths(None), *CODE_INPUTS]
+    with stage("check"):
+        if graph.is_current(NEWS_SEARCH_INDEX, inputs, extras=news_search_files()):
+            return []
+    with stage("build"):
+        files = build_news_search(news()[1], apply=outputs.apply)
+
+    changed = []
+    with stage("write"):
+        for path in news_search_files():
+            if path not in files and outputs.remove(path):
+                changed.append(rel_path(path))
+        for path, content in files.items():
+            if outputs.write_text(path, content):
+                changed.append(rel_path(path))
+    if outputs.apply:
+        graph.record(NEWS_SEARCH_INDEX, inputs, extras=news_search_files())
+    return changed
+
+
+def _render_job(job: tuple) -> str:
+    function, arguments = job
+    return clean_page(function(*arguments))
+
+
+def render_jobs(jobs: list[tuple], workers: int) -> list[str]:
+    """Run (function, arguments) render jobs, across a process pool when there are enough of them."""
+    if workers > 1 and len(jobs) >= NEWS_POOL_MIN_PAGES:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(_render_job, jobs, chunksize=max(1, len(jobs) // (workers * 4))))
+    return [_render_job(job) for job in jobs]
+
+
+def sync_news_archive(outputs: OutputSet, graph: BuildGraph, news: Callable[[], tuple[list[dict], list[dict]]], workers: int) -> list[str]:
+    """Render the stale news archive pages and remove pages no digest maps to; returns the paths changed."""
+    with stage("load"):
+        plan = news_archive_plan(news()[0])
+    with stage("check"):
+        stale = [entry for entry in plan if not graph.is_current(entry[0], [*entry[1], *CODE_INPUTS], entry[2])]
+    with stage("render"):
+        pages = render_jobs([(function, arguments) for _, _, _, function, arguments in stale], workers)
+
+    changed = []
+    with stage("write"):
+        for (output, inputs, params, _, _), html in zip(stale, pages):
+            if outputs.write_text(output, html):
+                changed.append(rel_path(output))
+            if outputs.apply:
+                graph.record(output, [*inputs, *CODE_INPUTS], params)
+        expected = {entry[0] for entry in plan}
+        for path in sorted(NEWS_ARCHIVE_DIR.glob("*.html")):
+            if path not in expected:
+                outputs.remove(path)
+                graph.nodes.pop(rel_path(path), None)
+                changed.append(rel_path(path))
+    return changed
+
+
 def render_blog(gallery_items: list[dict]) -> str:
     cover = gallery_items[3]
     body = f"""
@@ -634,17 +1498,132 @@ def render_alist(snapshot: dict) -> str:
     return page_shell("a-list.html", "The A-List | Axy Lusion", "Creative AI tool rankings from Axy Lusion, blending benchmark signals and editorial judgement.", "A-List", body, schema)
 
 
-def main() -> None:
-    gallery_items, home_items = load_and_migrate_gallery()
-    snapshot = read_json(ROOT / "data" / "a-list-benchmarks.json")
-    write_page(ROOT / "index.html", render_home(gallery_items, home_items))
-    write_page(ROOT / "gallery.html", render_gallery(gallery_items))
-    write_page(ROOT / "news.html", render_news(gallery_items))
-    write_page(ROOT / "blog.html", render_blog(gallery_items))
-    write_page(ROOT / "about.html", render_about(gallery_items))
-    write_page(ROOT / "a-list.html", render_alist(snapshot))
-    print("Rendered cinematic pages and migrated gallery metadata.")
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Render the static Axy Lusion cinematic pages.")
+    parser.add_argument("--force", action="store_true", help="Re-render every page even when its inputs are unchanged")
+    parser.add_argument(
+        "--gallery-shards",
+        action="store_true",
+        help=f"Inline only the first {GALLERY_INLINE_FRAMES} gallery frames and write the rest to gallery/page-NNNN.json shards",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Write nothing; list the files a render would change with byte deltas and exit non-zero if there are any",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=0,
+        help="Worker processes for rendering news archive pages; 0 uses one per CPU, 1 renders serially",
+    )
+    add_profile_argument(parser)
+    return parser.parse_args()
+
+
+def run(args: argparse.Namespace) -> int:
+    if args.jobs < 1:
+        args.jobs = os.cpu_count() or 1
+    graph = BuildGraph(BUILD_STATE_PATH, force=args.force)
+    outputs = OutputSet(apply=not args.check)
+    loaded: dict[str, tuple[list[dict], list[dict]]] = {}
+
+    # Migration rewrites the gallery payloads in place, so it is settled before
+    # any page fingerprints them. Once the payloads are a fixed point of the
+    # migration they are only read, and only if a stale page needs them.
+    migration_inputs = [GALLERY_PATH, HOMEPAGE_PATH, *CODE_INPUTS]
+    migrated = not graph.is_current(GALLERY_PATH, migration_inputs)
+    if migrated:
+        with stage("migrate"):
+            migrate_gallery(outputs)
+            migrated = bool(outputs.changes)
+            if outputs.apply:
+                graph.record(GALLERY_PATH, migration_inputs)
+
+    def gallery() -> tuple[list[dict], list[dict]]:
+        if "gallery" not in loaded:
+            with stage("load"):
+                loaded["gallery"] = load_and_migrate_gallery()
+        return loaded["gallery"]
+
+    def news() -> tuple[list[dict], list[dict]]:
+        """Every digest with stories, newest first, and the story index folded from them."""
+        if "news" not in loaded:
+            with stage("load-news"):
+                digests = load_digests(limit=None, apply=outputs.apply)
+                loaded["news"] = (digests, build_story_index(digests))
+        return loaded["news"]
+
+    def build_gallery() -> str:
+        items = gallery()[0]
+        with stage("shards"):
+            sync_gallery_shards(outputs, items, args.gallery_shards)
+        return render_gallery(items, sharded=args.gallery_shards)
+
+    pages = [
+        (ROOT / "index.html", [GALLERY_PATH, HOMEPAGE_PATH], {}, lambda: render_home(*gallery())),
+        (ROOT / "gallery.html", [GALLERY_PATH], {"sharded": args.gallery_shards}, build_gallery),
+        (GALLERY_SEARCH_INDEX, [GALLERY_PATH], {}, lambda: build_search_index(gallery()[0], apply=outputs.apply)),
+        (ROOT / "news.html", [GALLERY_PATH, DIGEST_INDEX_PATH, *digest_paths(None)], {}, lambda: render_news(gallery()[0], *news())),
+        (ROOT / "blog.html", [GALLERY_PATH], {}, lambda: render_blog(gallery()[0])),
+        (ROOT / "about.html", [GALLERY_PATH], {}, lambda: render_about(gallery()[0])),
+        (ROOT / "a-list.html", [ALIST_PATH], {}, lambda: render_alist(read_json(ALIST_PATH))),
+    ]
+    rendered = []
+    unchanged = []
+    for output, inputs, params, render in pages:
+        with stage(f"page:{rel_path(output)}"):
+            inputs = [*inputs, *CODE_INPUTS]
+            with stage("check"):
+                extras = gallery_shard_files() if output.name == "gallery.html" else []
+                current = graph.is_current(output, inputs, params, extras)
+            if current:
+                continue
+            with stage("render"):
+                html = render()
+            with stage("write"):
+                changed = write_page(outputs, output, html)
+            (rendered if changed else unchanged).append(rel_path(output))
+            if not outputs.apply:
+                continue
+            with stage("record"):
+                extras = gallery_shard_files() if output.name == "gallery.html" else []
+                graph.record(output, inputs, params, extras)
+
+    with stage("news-archive"):
+        archived = sync_news_archive(outputs, graph, news, args.jobs)
+    with stage("news-search"):
+        searched = sync_news_search(outputs, graph, news)
+
+    if args.check:
+        if outputs.changes:
+            outputs.print_changes(ROOT, "Files a cinematic render would change:")
+            return 1
+        print("Cinematic outputs are current; a render would change nothing.")
+        return 0
+
+    with stage("save-state"):
+        graph.save()
+    if migrated:
+        print("Migrated gallery metadata.")
+    if rendered:
+        print(f"Rendered cinematic pages: {', '.join(rendered)}")
+    if unchanged:
+        print(f"Re-rendered but identical on disk, not rewritten: {', '.join(unchanged)}")
+    if archived:
+        print(f"Updated news archive pages: {len(archived)} (under {rel_path(NEWS_ARCHIVE_DIR)}/)")
+    if searched:
+        print(f"Updated news search files: {len(searched)} (under {rel_path(NEWS_SEARCH_DIR)}/)")
+    if not rendered and not unchanged and not archived and not searched:
+        print("Cinematic pages are current; nothing to render.")
+    return 0
+
+
+def main() -> int:
+    args = parse_args()
+    with profiling("render-cinematic-site", args):
+        return run(args)
 
 
 if __name__ == "__main__":
-    main()
+    raise SystemExit(main())
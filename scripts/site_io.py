@@ -0,0 +1,149 @@
+"""
+Small file-writing helpers shared by the Axy Lusion build scripts.
+
+Writes go through a temp file in the target directory followed by os.replace,
+so a crash or Ctrl+C never leaves a half-written payload behind, and a file
+whose bytes would not change is left untouched (mtime included). OutputSet
+routes a script's writes through those helpers and keeps a list of what
+changed, or with apply=False of what would have, for dry runs.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+
+READ_CHUNK_SIZE = 1 << 20
+
+
+def _target_mode(path: Path) -> int:
+    # Temp files are created 0600; give the result the permissions a plain
+    # open() would have, or keep the existing file's.
+    try:
+        return path.stat().st_mode & 0o777
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def file_sha256(path: Path) -> str:
+    """Return the sha256 of a file's bytes, or an empty string when it is missing."""
+    digest = hashlib.sha256()
+    try:
+        with path.open("rb") as handle:
+            for block in iter(lambda: handle.read(READ_CHUNK_SIZE), b""):
+                digest.update(block)
+    except FileNotFoundError:
+        return ""
+    return digest.hexdigest()
+
+
+def _file_size(path: Path) -> Optional[int]:
+    try:
+        return path.stat().st_size
+    except FileNotFoundError:
+        return None
+
+
+def _digest_chunks(chunks: Iterable[Union[str, bytes]]) -> tuple[str, int]:
+    digest = hashlib.sha256()
+    size = 0
+    for chunk in chunks:
+        data = chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+        digest.update(data)
+        size += len(data)
+    return digest.hexdigest(), size
+
+
+def write_chunks(path: Path, chunks: Iterable[Union[str, bytes]], apply: bool = True) -> bool:
+    """Stream chunks to path, returning True when the content differs from disk.
+
+    Text chunks are UTF-8 encoded as-is (no newline translation); bytes are
+    written unchanged. With apply=False nothing is written; the chunks are
+    only hashed so callers can implement --check modes without holding the
+    rendered file in memory.
+    """
+    existing = file_sha256(path)
+    digest = hashlib.sha256()
+
+    if not apply:
+        return _digest_chunks(chunks)[0] != existing
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    handle = tempfile.NamedTemporaryFile("wb", dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False)
+    temp_path = Path(handle.name)
+    try:
+        with handle:
+            for chunk in chunks:
+                data = chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+                digest.update(data)
+                handle.write(data)
+        if digest.hexdigest() == existing:
+            temp_path.unlink()
+            return False
+        os.chmod(temp_path, _target_mode(path))
+        os.replace(temp_path, path)
+        return True
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+def write_text(path: Path, content: str, apply: bool = True) -> bool:
+    """Atomically write content to path if it differs; see write_chunks."""
+    return write_chunks(path, [content], apply=apply)
+
+
+class OutputSet:
+    """Write-if-changed for every output of one run, recording each change.
+
+    changes holds (path, bytes before, bytes after) for every file that was
+    (or, with apply=False, would be) created, rewritten or removed; None
+    stands for an absent file. Unchanged outputs are never touched.
+    """
+
+    def __init__(self, apply: bool = True) -> None:
+        self.apply = apply
+        self.changes: list[tuple[Path, Optional[int], Optional[int]]] = []
+
+    def write_chunks(self, path: Path, chunks: Iterable[Union[str, bytes]]) -> bool:
+        before = _file_size(path)
+        if self.apply:
+            if not write_chunks(path, chunks):
+                return False
+            after = _file_size(path)
+        else:
+            digest, after = _digest_chunks(chunks)
+            if digest == file_sha256(path):
+                return False
+        self.changes.append((path, before, after))
+        return True
+
+    def write_text(self, path: Path, content: str) -> bool:
+        return self.write_chunks(path, [content])
+
+    def remove(self, path: Path) -> bool:
+        before = _file_size(path)
+        if before is None:
+            return False
+        if self.apply:
+            path.unlink()
+        self.changes.append((path, before, None))
+        return True
+
+    def print_changes(self, root: Path, heading: str) -> None:
+        """List each change relative to root with its byte delta."""
+        print(heading)
+        for path, before, after in self.changes:
+            if before is None:
+                detail = f"new, {after:,} bytes"
+            elif after is None:
+                detail = f"removed, {before:,} bytes"
+            else:
+                detail = f"{after - before:+,} bytes"
+            print(f"- {path.resolve().relative_to(root).as_posix()} ({detail})")
@@ -19,6 +19,8 @@ from pathlib import Path
 from typing import Any
 from html import unescape
 
+from build_profile import add_profile_argument, profiling, stage
+
 
 PROJECT_DIR = Path(__file__).resolve().parent.parent
 DEFAULT_SOURCE = Path(os.environ.get("AXYLUSION_ALIST_SOURCE", r"W:\Websites\sites\ai-resource-hub\data\pg-cache\creative_benchmarks.json"))
@@ -259,6 +261,7 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--source", type=Path, default=DEFAULT_SOURCE, help="Path to creative_benchmarks.json")
     parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="Path to write the normalized A-List snapshot")
     parser.add_argument("--check", action="store_true", help="Exit non-zero if the output file is out of date")
+    add_profile_argument(parser)
     return parser.parse_args()
 
 
@@ -547,18 +550,61 @@ def comparable_payload(payload: dict[str, Any]) -> dict[str, Any]:
     return comparable
 
 
-def main() -> int:
-    args = parse_args()
+def snapshot_differences(existing: dict[str, Any], payload: dict[str, Any], limit: int = 20) -> list[str]:
+    """Describe where two snapshots differ as JSON paths, ignoring generated_at."""
+    differences: list[str] = []
+
+    def walk(old: Any, new: Any, path: str) -> None:
+        if len(differences) >= limit:
+            return
+        if isinstance(old, dict) and isinstance(new, dict):
+            for key in sorted(set(old) | set(new), key=str):
+                if key not in old:
+                    differences.append(f"{path}.{key} added")
+                elif key not in new:
+                    differences.append(f"{path}.{key} removed")
+                else:
+                    walk(old[key], new[key], f"{path}.{key}")
+        elif isinstance(old, list) and isinstance(new, list):
+            if len(old) != len(new):
+                differences.append(f"{path} has {len(new)} entries (was {len(old)})")
+            for index, (old_value, new_value) in enumerate(zip(old, new)):
+                walk(old_value, new_value, f"{path}[{index}]")
+        elif old != new:
+            differences.append(f"{path}: {old!r} -> {new!r}")
+
+    walk(comparable_payload(existing), comparable_payload(payload), "$")
+    return differences[:limit]
+
+
+def load_source_rows(source: Path) -> list[dict[str, Any]]:
+    rows = json.loads(source.read_text(encoding="utf-8"))
+    if not isinstance(rows, list):
+        raise ValueError(f"Expected a JSON array at {source}")
+    return rows
+
+
+def check_snapshot(source: Path, existing_payload: dict[str, Any]) -> list[str]:
+    """Return how existing_payload differs from a fresh sync of source (empty when current)."""
+    payload = build_snapshot(normalize_rows(load_source_rows(source)), source)
+    return snapshot_differences(existing_payload, payload)
+
+
+def run(args: argparse.Namespace) -> int:
     if not args.source.exists():
         raise SystemExit(f"Shared benchmark cache not found: {args.source}")
 
-    rows = json.loads(args.source.read_text(encoding="utf-8"))
-    if not isinstance(rows, list):
-        raise SystemExit(f"Expected a JSON array at {args.source}")
-
-    normalized_rows = normalize_rows(rows)
-    payload = build_snapshot(normalized_rows, args.source)
-    rendered = render_snapshot(payload)
+    try:
+        with stage("load"):
+            rows = load_source_rows(args.source)
+    except ValueError as exc:
+        raise SystemExit(str(exc)) from exc
+
+    with stage("normalize"):
+        normalized_rows = normalize_rows(rows)
+    with stage("snapshot"):
+        payload = build_snapshot(normalized_rows, args.source)
+        rendered = render_snapshot(payload)
     existing = args.output.read_text(encoding="utf-8") if args.output.exists() else ""
 
     if args.check:
@@ -566,8 +612,10 @@ def main() -> int:
             print(f"A-List benchmark snapshot is missing: {args.output}")
             return 1
 
-        existing_payload = json.loads(existing)
-        if comparable_payload(existing_payload) != comparable_payload(payload):
+        differences = snapshot_differences(json.loads(existing), payload)
+        if differences:
+            for difference in differences:
+                print(f"- {difference}")
             print(f"A-List benchmark snapshot is out of date: {args.output}")
             return 1
         print(f"A-List benchmark snapshot is current: {args.output}")
@@ -580,12 +628,19 @@ def main() -> int:
             return 0
 
     args.output.parent.mkdir(parents=True, exist_ok=True)
-    args.output.write_text(rendered, encoding="utf-8")
+    with stage("write"):
+        args.output.write_text(rendered, encoding="utf-8")
     print(f"Wrote {args.output}")
     print(f"Categories: {payload['category_count']}")
     print(f"Models: {payload['model_count']}")
     return 0
 
 
+def main() -> int:
+    args = parse_args()
+    with profiling("sync-a-list-benchmarks", args):
+        return run(args)
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
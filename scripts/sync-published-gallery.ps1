@@ -2,7 +2,9 @@ param(
     [string]$Python = "python",
     [string]$DbPath = "W:\Agent Workspace\System\Data\universal.db",
     [switch]$Apply,
-    [switch]$SkipCheckpoint
+    [switch]$Checkpoint,
+    [switch]$SkipCheckpoint,
+    [switch]$Incremental
 )
 
 $ScriptDir = Split-Path -Parent $MyInvocation.MyCommand.Path
@@ -14,9 +16,17 @@ if ($Apply) {
     $Args += "--apply"
 }
 
+if ($Checkpoint) {
+    $Args += "--checkpoint"
+}
+
 if ($SkipCheckpoint) {
     $Args += "--skip-checkpoint"
 }
 
+if ($Incremental) {
+    $Args += "--incremental"
+}
+
 & $Python @Args
 exit $LASTEXITCODE
@@ -0,0 +1,225 @@
+"""
+Synthetic stand-ins for the site's inputs, for benchmarks.
+
+Everything is generated from a seed, so two runs with the same sizes build
+the same corpus and their timings are comparable:
+
+  - synthetic_rows / write_universal_db: gallery_items + gallery_tags rows
+    shaped like the shared universal.db
+  - export_items: a data/gallery.json item list covering most of those rows
+  - homepage_items: a data/homepage-gallery.json selection from them
+  - write_digests: news-digests/digest-YYYY-MM-DD.md files in the format
+    render-cinematic-site.py parses
+  - benchmark_rows: a creative_benchmarks.json row list for
+    sync-a-list-benchmarks.py
+"""
+
+from __future__ import annotations
+
+import random
+import sqlite3
+import uuid
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Iterator
+
+
+TAG_VOCABULARY = 240
+MODELS = ("Midjourney v7", "Midjourney v6.1", "Midjourney v6", "Niji 6", "")
+TYPES = ("image", "image", "image", "video")
+ASPECTS = ("1:1", "2:3", "3:2", "16:9", "9:16", "4:5")
+TONES = (
+    ["#1a3540", "#060606", "#c4851a"],
+    ["#3a1f10", "#060606", "#d4a03a"],
+    ["#2a0d2e", "#060606", "#c4851a"],
+    ["#0d2424", "#060606", "#c4851a"],
+)
+DIGEST_TAGS = ("image_gen", "video_gen", "music_gen", "3d_gen", "creative_tool", "benchmark")
+DIGEST_SOURCES = ("TechCrunch AI", "The Verge", "VentureBeat", "Aligned News (Scoble)")
+BENCHMARK_CATEGORIES = (
+    "image_generation",
+    "image_editing",
+    "video_generation",
+    "music_generation",
+    "voice_tts",
+    "3d_generation",
+    "upscaling",
+)
+BENCHMARK_SOURCES = (("Artificial Analysis", "elo"), ("LM Arena", "elo"), ("Expert Review", "score_100"))
+
+
+def _uuid(rng: random.Random) -> str:
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+
+def _words(rng: random.Random, vocabulary: list[str], low: int, high: int) -> str:
+    return " ".join(rng.choice(vocabulary) for _ in range(rng.randint(low, high)))
+
+
+def synthetic_rows(count: int, seed: int = 1) -> Iterator[tuple[dict[str, Any], list[str]]]:
+    """Yield (gallery_items row, tags) pairs in created_at order."""
+    rng = random.Random(seed)
+    tags = [f"tag-{index:03d}" for index in range(TAG_VOCABULARY)]
+    for index in range(count):
+        item_id = _uuid(rng)
+        day = index * 730 // max(count, 1)
+        created_at = f"{2024 + day // 365}-{day % 365 // 31 + 1:02d}-{day % 31 % 28 + 1:02d}T{index % 24:02d}:{index % 60:02d}:00Z"
+        roll = rng.random()
+        aspect = rng.choice(ASPECTS)
+        version = rng.choice(("7", "6.1", "6"))
+        row = {
+            "id": item_id,
+            "name": f"Synthetic Frame {index}",
+            "type": rng.choice(TYPES),
+            "source": "midjourney",
+            "model": rng.choice(MODELS),
+            "url": f"https://www.midjourney.com/jobs/{item_id}?index=0",
+            "cdn_url": f"https://cdn.midjourney.com/{item_id}/0_0.png",
+            "thumbnail_url": f"https://cdn.midjourney.com/{item_id}/0_0_640_N.webp" if roll < 0.3 else None,
+            "prompt": _words(rng, tags, 8, 40),
+            "parameters": f"--ar {aspect} --v {version}" if roll > 0.1 else "",
+            "dimensions": aspect,
+            "status": "published" if roll > 0.04 else "draft",
+            "created": created_at[:10] if roll > 0.5 else "",
+            "created_at": created_at,
+            "updated_at": created_at,
+            "deleted_at": created_at if 0.04 < roll < 0.05 else None,
+        }
+        yield row, rng.sample(tags, rng.randint(0, 6))
+
+
+def write_universal_db(path: Path, rows: list[tuple[dict[str, Any], list[str]]]) -> None:
+    """Write gallery_items and gallery_tags tables holding rows to a new SQLite file."""
+    connection = sqlite3.connect(path)
+    try:
+        connection.execute("PRAGMA journal_mode=WAL")
+        fields = list(rows[0][0]) if rows else ["id"]
+        connection.execute(f"CREATE TABLE gallery_items ({', '.join(fields)})")
+        connection.execute("CREATE TABLE gallery_tags (item_id TEXT NOT NULL, tag TEXT NOT NULL)")
+        connection.execute("CREATE INDEX idx_gallery_tags_item ON gallery_tags (item_id)")
+        connection.executemany(
+            f"INSERT INTO gallery_items VALUES ({', '.join('?' for _ in fields)})",
+            ([row[field] for field in fields] for row, _ in rows),
+        )
+        connection.executemany(
+            "INSERT INTO gallery_tags VALUES (?, ?)",
+            ((row["id"], tag) for row, tags in rows for tag in tags),
+        )
+        connection.commit()
+    finally:
+        connection.close()
+
+
+def export_items(rows: list[tuple[dict[str, Any], list[str]]], ratio: float = 0.9, seed: int = 1) -> list[dict[str, Any]]:
+    """gallery.json items for about ratio of the rows, newest first, plus a few the DB no longer has."""
+    rng = random.Random(seed + 1)
+    items = []
+    for row, tags in rows:
+        if rng.random() >= ratio:
+            continue
+        items.append(
+            {
+                "id": row["id"],
+                "name": row["name"],
+                "type": row["type"],
+                "source": "midjourney",
+                "model": row["model"] or "Midjourney v7",
+                "url": row["url"],
+                "cdn_url": row["cdn_url"],
+                "prompt": row["prompt"],
+                "parameters": row["parameters"],
+                "dimensions": row["dimensions"],
+                "created": row["created"] or "2026-02-10",
+                "tags": tags[:6],
+            }
+        )
+    items.reverse()
+    items.extend(
+        {"id": _uuid(rng), "name": "Removed Frame", "type": "image", "source": "midjourney", "created": "2024-01-01", "tags": []}
+        for _ in range(max(1, len(items) // 200))
+    )
+    for index, item in enumerate(items, start=1):
+        item["ref"] = f"F{index:04d}"
+        item["tones"] = TONES[index % len(TONES)]
+    return items
+
+
+def homepage_items(rows: list[tuple[dict[str, Any], list[str]]], count: int = 18) -> list[dict[str, Any]]:
+    """data/homepage-gallery.json items: evenly spaced published rows, so they survive an export."""
+    published = [row for row, _ in rows if row["status"] == "published" and row["deleted_at"] is None]
+    step = max(len(published) // max(count, 1), 1)
+    return [
+        {
+            "name": row["name"],
+            "cdn_url": row["cdn_url"],
+            "created": row["created"],
+            "type": row["type"],
+            "id": row["id"],
+            "tones": TONES[index % len(TONES)],
+            "prompt": row["prompt"],
+        }
+        for index, row in enumerate(published[::step][:count])
+    ]
+
+
+def write_digests(directory: Path, count: int, stories: int = 12, end: date = date(2026, 5, 25), seed: int = 1) -> list[Path]:
+    """Write count daily digests ending at end, each with stories entries; returns their paths."""
+    rng = random.Random(seed + 2)
+    vocabulary = [f"word{index}" for index in range(400)]
+    directory.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for offset in range(count):
+        day = end - timedelta(days=offset)
+        lines = [
+            "# Axy Lusion - Creative AI News Digest",
+            f"**{day.isoformat()}** | {stories} stories | Auto-generated from {stories * 40} recent stories",
+            "",
+            "---",
+            "",
+        ]
+        for index in range(stories):
+            title = _words(rng, vocabulary, 5, 12).title()
+            lines += [
+                f"## [{title}](https://example.com/{day.isoformat()}/{index})",
+                f"*{rng.choice(DIGEST_SOURCES)}* | {day.strftime('%d/%m/%Y')} | Score: {rng.random():.2f}",
+                f"Tags: {', '.join(rng.sample(DIGEST_TAGS, 2))}",
+                "",
+                f"> {_words(rng, vocabulary, 20, 60)}.",
+                "",
+                "---",
+                "",
+            ]
+        path = directory / f"digest-{day.isoformat()}.md"
+        path.write_text("\n".join(lines), encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def benchmark_rows(models_per_category: int = 8, seed: int = 1) -> list[dict[str, Any]]:
+    """creative_benchmarks.json rows: one per (category, model, source) score."""
+    rng = random.Random(seed + 3)
+    rows = []
+    for category in BENCHMARK_CATEGORIES:
+        for index in range(models_per_category):
+            model_name = f"Synthetic {category.replace('_', ' ').title()} {index + 1}"
+            for source_name, score_type in BENCHMARK_SOURCES:
+                if rng.random() < 0.25:
+                    continue
+                rows.append(
+                    {
+                        "category": category,
+                        "model_name": model_name,
+                        "model_maker": f"Lab {index % 5 + 1}",
+                        "model_url": f"https://example.com/models/{category}/{index + 1}",
+                        "pricing_note": "",
+                        "considerations": "",
+                        "status_note": "",
+                        "strengths": [],
+                        "updated_at": "2026-05-25T07:00:00.000Z",
+                        "source_name": source_name,
+                        "source_url": f"https://example.com/{source_name.lower().replace(' ', '-')}/{category}",
+                        "raw_score": round(rng.uniform(900, 1300), 1) if score_type == "elo" else round(rng.uniform(50, 100), 1),
+                        "score_type": score_type,
+                    }
+                )
+    return rows
@@ -7,61 +7,170 @@ The site can read digests in both of these formats:
   - digest-YYYY-MM-DD.md
 
 Keeping a manifest avoids expensive 404-heavy date probing on static hosting.
+
+With --watch the script stays running and keeps the manifest current as the
+scheduled news filter drops digests in: new files are inserted at their
+sorted position and deleted ones removed, without rescanning or re-sorting
+the directory. Changes are applied once writes have been quiet for
+--debounce seconds, and --render then runs render-cinematic-site.py, whose
+build state re-renders only the pages those digests reach. File events come
+from watchdog (inotify, FSEvents or ReadDirectoryChangesW) when it is
+installed; otherwise the directory is polled every --interval seconds.
 """
 
 from __future__ import annotations
 
 import argparse
-import json
-import re
+import os
+import queue
+import subprocess
 import sys
+import time
+from datetime import datetime
 from pathlib import Path
 
+from build_profile import add_profile_argument, profiling, stage
+from digest_manifest import DIGEST_PATTERN, build_manifest, insert_digest, remove_digest, render_manifest
+from site_io import write_text
+
+try:
+    from watchdog.observers import Observer
+except ImportError:
+    Observer = None
+
 
 PROJECT_DIR = Path(__file__).resolve().parent.parent
 NEWS_DIGESTS_DIR = PROJECT_DIR / "news-digests"
 INDEX_PATH = NEWS_DIGESTS_DIR / "index.json"
-DIGEST_PATTERN = re.compile(
-    r"(?:(\d{4})-(\d{2})-(\d{2})-digest|digest-(\d{4})-(\d{2})-(\d{2}))\.md$"
-)
-
-
-def digest_sort_key(path: Path) -> tuple[int, str]:
-    match = DIGEST_PATTERN.match(path.name)
-    if not match:
-        return (0, path.name)
-
-    year = int(match.group(1) or match.group(4))
-    month = int(match.group(2) or match.group(5))
-    day = int(match.group(3) or match.group(6))
-    return (year * 10000 + month * 100 + day, path.name)
+RENDER_SCRIPT = PROJECT_DIR / "scripts" / "render-cinematic-site.py"
+# watchdog event types that mean a digest's contents or presence changed.
+# "opened" and "closed_no_write" come from plain reads (the renderer hashes
+# every digest), and queueing them makes --watch --render loop on itself.
+WRITE_EVENTS = frozenset({"created", "deleted", "moved", "modified", "closed"})
+
+
+class EventSource:
+    """Names of digest files touched since the last poll, from watchdog events."""
+
+    def __init__(self, directory: Path) -> None:
+        self.events: queue.SimpleQueue[str] = queue.SimpleQueue()
+        self.observer = Observer()
+        self.observer.schedule(self, str(directory), recursive=False)
+        self.observer.start()
+
+    def dispatch(self, event) -> None:
+        # Called on the observer thread; a rename reports both ends.
+        if event.is_directory or event.event_type not in WRITE_EVENTS:
+            return
+        for path in (event.src_path, getattr(event, "dest_path", "")):
+            name = os.path.basename(os.fsdecode(path)) if path else ""
+            if DIGEST_PATTERN.match(name):
+                self.events.put(name)
+
+    def poll(self, timeout: float) -> set[str]:
+        names: set[str] = set()
+        try:
+            names.add(self.events.get(timeout=timeout))
+            while True:
+                names.add(self.events.get_nowait())
+        except queue.Empty:
+            return names
+
+    def close(self) -> None:
+        self.observer.stop()
+        self.observer.join()
+
+
+class PollingSource:
+    """Names of digest files added, removed or rewritten between directory listings."""
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+        self.snapshot = self.scan()
+
+    def scan(self) -> dict[str, tuple[int, int]]:
+        entries: dict[str, tuple[int, int]] = {}
+        with os.scandir(self.directory) as listing:
+            for entry in listing:
+                if not DIGEST_PATTERN.match(entry.name):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries[entry.name] = (stat.st_size, stat.st_mtime_ns)
+        return entries
+
+    def poll(self, timeout: float) -> set[str]:
+        time.sleep(timeout)
+        current = self.scan()
+        changed = {name for name in current.keys() | self.snapshot.keys() if current.get(name) != self.snapshot.get(name)}
+        self.snapshot = current
+        return changed
+
+    def close(self) -> None:
+        pass
+
+
+def apply_changes(files: list[str], names: set[str]) -> tuple[list[str], list[str]]:
+    """Insert the listed digests that now exist and drop those that do not; returns (added, removed)."""
+    added: list[str] = []
+    removed: list[str] = []
+    for name in sorted(names):
+        if (NEWS_DIGESTS_DIR / name).exists():
+            if insert_digest(files, name):
+                added.append(name)
+        elif remove_digest(files, name):
+            removed.append(name)
+    return added, removed
+
+
+def watch(args: argparse.Namespace) -> int:
+    # One full scan up front; after that only changed names are looked at.
+    files = build_manifest(NEWS_DIGESTS_DIR)["files"]
+    if write_text(INDEX_PATH, render_manifest({"files": files})):
+        print(f"Updated {INDEX_PATH} ({len(files)} digests)")
+
+    source = EventSource(NEWS_DIGESTS_DIR) if Observer is not None else PollingSource(NEWS_DIGESTS_DIR)
+    mode = "filesystem events" if Observer is not None else f"polling every {args.interval:g}s"
+    print(f"Watching {NEWS_DIGESTS_DIR} ({mode}, {args.debounce:g}s debounce). Ctrl+C to stop.")
+
+    pending: set[str] = set()
+    last_change = 0.0
+    try:
+        while True:
+            names = source.poll(args.interval)
+            if names:
+                pending |= names
+                last_change = time.monotonic()
+                continue
+            if not pending or time.monotonic() - last_change < args.debounce:
+                continue
+
+            added, removed = apply_changes(files, pending)
+            edited = sorted(pending - set(added) - set(removed))
+            pending = set()
+            stamp = datetime.now().strftime("%H:%M:%S")
+            if added or removed:
+                write_text(INDEX_PATH, render_manifest({"files": files}))
+                print(f"[{stamp}] Manifest updated: +{len(added)} -{len(removed)} ({len(files)} digests)")
+            if edited:
+                print(f"[{stamp}] Digests rewritten: {', '.join(edited)}")
+            if args.render:
+                subprocess.run([sys.executable, str(RENDER_SCRIPT)], check=False)
+    except KeyboardInterrupt:
+        return 0
+    finally:
+        source.close()
 
 
-def build_manifest() -> dict[str, list[str]]:
-    all_digest_files = [
-        path for path in NEWS_DIGESTS_DIR.glob("*.md") if DIGEST_PATTERN.match(path.name)
-    ]
-    # The scheduled shared news filter writes new local digest files before
-    # publication, so the live preview manifest must reflect files on disk.
-    digest_files = all_digest_files
-    ordered_files = [
-        path.name
-        for path in sorted(digest_files, key=digest_sort_key, reverse=True)
-    ]
-    return {"files": ordered_files}
+def run(args: argparse.Namespace) -> int:
+    if args.watch:
+        return watch(args)
 
-
-def main() -> int:
-    parser = argparse.ArgumentParser(description="Update or verify news-digests/index.json")
-    parser.add_argument(
-        "--check",
-        action="store_true",
-        help="Exit non-zero when the manifest does not match the current digest files.",
-    )
-    args = parser.parse_args()
-
-    manifest = build_manifest()
-    rendered = json.dumps(manifest, indent=2, ensure_ascii=False) + "\n"
+    with stage("scan"):
+        manifest = build_manifest(NEWS_DIGESTS_DIR)
+    rendered = render_manifest(manifest)
 
     if args.check:
         if not INDEX_PATH.exists():
@@ -76,11 +185,36 @@ def main() -> int:
         print("news-digests/index.json is up to date.")
         return 0
 
-    INDEX_PATH.write_text(rendered, encoding="utf-8")
+    with stage("write"):
+        write_text(INDEX_PATH, rendered)
     print(f"Updated {INDEX_PATH}")
     print(f"Digest files indexed: {len(manifest['files'])}")
     return 0
 
 
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Update or verify news-digests/index.json")
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Exit non-zero when the manifest does not match the current digest files.",
+    )
+    parser.add_argument("--watch", action="store_true", help="Keep running and update the manifest as digests change.")
+    parser.add_argument("--interval", type=float, default=1.0, help="Seconds between polls in --watch mode (default: 1)")
+    parser.add_argument(
+        "--debounce",
+        type=float,
+        default=2.0,
+        help="Seconds of quiet after a change before --watch applies it (default: 2)",
+    )
+    parser.add_argument("--render", action="store_true", help="In --watch mode, run render-cinematic-site.py after each change.")
+    add_profile_argument(parser)
+    args = parser.parse_args()
+    if args.watch and args.check:
+        parser.error("--watch and --check cannot be combined")
+    with profiling("update-news-digest-index", args):
+        return run(args)
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
@@ -14,28 +14,42 @@ Warnings:
 
 from __future__ import annotations
 
+import argparse
 import json
 import os
+import importlib.util
 import re
-import subprocess
-import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
 from html.parser import HTMLParser
 from pathlib import Path
+from typing import Iterable, Mapping
 from urllib.parse import urlparse
 
+from build_profile import add_profile_argument, profiling, stage
+from digest_manifest import DIGEST_PATTERN, build_manifest
+from gallery_columns import open_columns
+from gallery_data import load_items
+from hashed_payload import MANIFEST_PATH, load_manifest
+from site_io import file_sha256
+
 
 PROJECT_DIR = Path(__file__).resolve().parent.parent
 ROOT_HTML_FILES = sorted(PROJECT_DIR.glob("*.html"))
 ADMIN_HTML_FILES = sorted((PROJECT_DIR / "admin").glob("*.html"))
 ALIST_HTML_FILES = sorted((PROJECT_DIR / "a-list").glob("*.html"))
-HTML_FILES = ROOT_HTML_FILES + ADMIN_HTML_FILES + ALIST_HTML_FILES
-PUBLIC_HTML_FILES = ROOT_HTML_FILES + ALIST_HTML_FILES
+NEWS_HTML_FILES = sorted((PROJECT_DIR / "news").glob("*.html"))
+HTML_FILES = ROOT_HTML_FILES + ADMIN_HTML_FILES + ALIST_HTML_FILES + NEWS_HTML_FILES
+GALLERY_SHARD_FILES = sorted((PROJECT_DIR / "gallery").glob("page-*.json"))
+SKIPPED_WALK_DIRS = {".git", ".cache", "node_modules", "__pycache__"}
+PUBLIC_HTML_FILES = ROOT_HTML_FILES + ALIST_HTML_FILES + NEWS_HTML_FILES
 NEWS_DIGESTS_DIR = PROJECT_DIR / "news-digests"
 INDEX_PATH = NEWS_DIGESTS_DIR / "index.json"
 ALIST_DATA_PATH = PROJECT_DIR / "data" / "a-list-benchmarks.json"
 ALIST_SYNC_SCRIPT = PROJECT_DIR / "scripts" / "sync-a-list-benchmarks.py"
 ALIST_RENDER_SCRIPT = PROJECT_DIR / "scripts" / "render-a-list.py"
+CINEMATIC_RENDER_SCRIPT = PROJECT_DIR / "scripts" / "render-cinematic-site.py"
 ALIST_SHARED_SOURCE = Path(
     os.environ.get(
         "AXYLUSION_ALIST_SOURCE",
@@ -46,10 +60,8 @@ HEAD_REQUIREMENT_PATTERNS = {
     "icon": re.compile(r'rel=["\']icon["\']', re.IGNORECASE),
     "manifest": re.compile(r'rel=["\']manifest["\']', re.IGNORECASE),
 }
-LOCAL_REF_PATTERN = re.compile(r"\b(?P<attr>href|src)=[\"'](?P<value>[^\"']+)[\"']", re.IGNORECASE)
-DIGEST_PATTERN = re.compile(
-    r"(?:(\d{4})-(\d{2})-(\d{2})-digest|digest-(\d{4})-(\d{2})-(\d{2}))\.md$"
-)
+QUOTED_VALUE_PATTERN = re.compile(rb"[\"'](?P<value>[^\"']+)[\"']")
+EXTERNAL_REF_PREFIXES = ("http://", "https://", "mailto:", "tel:", "javascript:", "#", "data:")
 UUID_PATTERN = re.compile(
     r"([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})",
     re.IGNORECASE,
@@ -72,14 +84,7 @@ class RefParser(HTMLParser):
 
 
 def load_json_items(path: Path) -> list[dict]:
-    payload = json.loads(path.read_text(encoding="utf-8"))
-    if isinstance(payload, dict):
-        items = payload.get("items", [])
-    else:
-        items = payload
-    if not isinstance(items, list):
-        raise ValueError(f"{path} does not contain a list of items")
-    return items
+    return load_items(path)
 
 
 def load_alist_snapshot(path: Path) -> dict:
@@ -112,32 +117,101 @@ def extract_job_id(value: str) -> str:
     return match.group(1).lower() if match else ""
 
 
-def check_local_refs() -> list[str]:
+def build_path_index(root: Path) -> set[str]:
+    """Return every file and directory under root as a normalized relative path."""
+    paths = {"."}
+    pending = [root]
+    while pending:
+        directory = pending.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name in SKIPPED_WALK_DIRS:
+                    continue
+                rel = os.path.normpath(os.path.relpath(entry.path, root))
+                paths.add(rel)
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(Path(entry.path))
+    return paths
+
+
+def _is_word_char_before(data: bytes, index: int) -> bool:
+    if index == 0:
+        return False
+    start = index - 1
+    while start > 0 and 0x80 <= data[start] < 0xC0:
+        start -= 1
+    char = data[start:index].decode("utf-8", errors="ignore")
+    return bool(char) and (char.isalnum() or char == "_")
+
+
+def find_ref_values(data: bytes) -> list[str]:
+    """Return every href/src value in UTF-8 page bytes.
+
+    An attribute matches when "href=" or "src=" (any case) does not follow a
+    word character and is followed directly by a non-empty value in single
+    or double quotes; the value runs to the next quote of either kind, and
+    matches that overlap an earlier one are skipped. A case-insensitive regex scan of the multi-megabyte gallery page is slow,
+    so the bytes are ASCII-lowercased once (which keeps every offset in
+    place) and searched with bytes.find instead.
+    """
+    lowered = data.lower()
+    found: list[tuple[int, int, bytes]] = []
+    for needle in (b"href=", b"src="):
+        index = lowered.find(needle)
+        while index != -1:
+            if not _is_word_char_before(data, index):
+                match = QUOTED_VALUE_PATTERN.match(data, index + len(needle))
+                if match:
+                    found.append((index, match.end(), match.group("value")))
+            index = lowered.find(needle, index + 1)
+
+    values: list[str] = []
+    consumed = 0
+    for start, end, value in sorted(found):
+        if start >= consumed:
+            values.append(value.decode("utf-8", errors="ignore"))
+            consumed = end
+    return values
+
+
+def scan_local_refs(path: str) -> tuple[str, list[str], float]:
+    """Return the local href/src values in one page (or gallery shard) and the scan time."""
+    started = time.perf_counter()
+    data = Path(path).read_bytes()
+    if path.endswith(".json"):
+        # Gallery shards carry their card markup as a JSON string.
+        data = json.loads(data).get("cards", "").encode("utf-8")
+    values = [value for value in find_ref_values(data) if not value.startswith(EXTERNAL_REF_PREFIXES)]
+    return path, values, time.perf_counter() - started
+
+
+def check_local_refs(jobs: int = 1, timings: list[tuple[str, float]] | None = None) -> list[str]:
     issues: list[str] = []
-    exists_cache: dict[str, bool] = {}
-
-    for html_path in HTML_FILES:
-        contents = html_path.read_text(encoding="utf-8", errors="ignore")
+    known_paths = build_path_index(PROJECT_DIR)
+    sources = [str(path) for path in HTML_FILES + GALLERY_SHARD_FILES]
 
-        for match in LOCAL_REF_PATTERN.finditer(contents):
-            value = match.group("value")
-            if value.startswith(("http://", "https://", "mailto:", "tel:", "javascript:", "#", "data:")):
-                continue
-
-            parsed = urlparse(value)
-            path_part = parsed.path
+    if jobs > 1 and len(sources) > jobs:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(scan_local_refs, sources, chunksize=max(1, len(sources) // (jobs * 4))))
+    else:
+        results = [scan_local_refs(source) for source in sources]
+
+    for source, values, elapsed in results:
+        source_path = Path(source)
+        if timings is not None:
+            timings.append((rel_path(source_path), elapsed))
+        # Shard fragments are inserted into gallery.html, so they resolve from the root.
+        base = "." if source_path.suffix == ".json" else os.path.relpath(source_path.parent, PROJECT_DIR)
+        for value in values:
+            path_part = urlparse(value).path
             if path_part.startswith("/"):
-                target = PROJECT_DIR / path_part.lstrip("/")
+                target = os.path.normpath(path_part.lstrip("/") or ".")
             else:
-                target = html_path.parent / path_part
-
-            target_key = str(target)
-            if target_key not in exists_cache:
-                exists_cache[target_key] = target.exists()
+                target = os.path.normpath(os.path.join(base, path_part))
 
-            if not exists_cache[target_key]:
+            if target not in known_paths:
                 issues.append(
-                    f"Missing local asset in {rel_path(html_path)}: {value}"
+                    f"Missing local asset in {rel_path(source_path)}: {value}"
                 )
 
     return issues
@@ -152,17 +226,7 @@ def digest_files_on_disk() -> list[Path]:
 
 
 def build_digest_manifest() -> dict[str, list[str]]:
-    digest_files = [path.name for path in digest_files_on_disk()]
-    digest_files.sort(
-        key=lambda name: (
-            int((match := DIGEST_PATTERN.match(name)).group(1) or match.group(4)),
-            int(match.group(2) or match.group(5)),
-            int(match.group(3) or match.group(6)),
-            name,
-        ),
-        reverse=True,
-    )
-    return {"files": digest_files}
+    return build_manifest(NEWS_DIGESTS_DIR)
 
 
 def check_digest_manifest() -> list[str]:
@@ -187,7 +251,7 @@ def check_digest_manifest() -> list[str]:
     return issues
 
 
-def summarize_hosts(items: list[dict]) -> dict[str, int]:
+def summarize_hosts(items: Iterable[Mapping]) -> dict[str, int]:
     counts: dict[str, int] = {}
     for item in items:
         for key in ("cdn_url", "url", "image", "src"):
@@ -199,13 +263,9 @@ def summarize_hosts(items: list[dict]) -> dict[str, int]:
     return counts
 
 
-def check_homepage_alignment(gallery_items: list[dict], homepage_items: list[dict]) -> list[str]:
+def check_homepage_alignment(gallery_ids: Iterable[str], homepage_items: list[dict]) -> list[str]:
     issues: list[str] = []
-    gallery_ids = {
-        str(item.get("id") or "").strip().lower()
-        for item in gallery_items
-        if str(item.get("id") or "").strip()
-    }
+    gallery_ids = {item_id.strip().lower() for item_id in gallery_ids if item_id.strip()}
 
     for index, item in enumerate(homepage_items, start=1):
         item_id = str(item.get("id") or "").strip().lower()
@@ -233,6 +293,21 @@ def check_public_head_requirements() -> list[str]:
     return issues
 
 
+def check_hashed_payload(gallery_count: int) -> list[str]:
+    """The manifest must name an existing hashed payload matching gallery.json."""
+    if not MANIFEST_PATH.exists():
+        return [f"Missing hashed gallery manifest: {rel_path(MANIFEST_PATH)}"]
+    entry = load_manifest(MANIFEST_PATH).get("gallery")
+    if not isinstance(entry, dict) or not entry.get("path"):
+        return [f"{rel_path(MANIFEST_PATH)} has no gallery entry."]
+    payload_path = PROJECT_DIR / str(entry["path"])
+    if file_sha256(payload_path) != entry.get("sha256"):
+        return [f"Hashed gallery payload is missing or does not match the manifest: {entry['path']}"]
+    if entry.get("items") != gallery_count:
+        return [f"Hashed gallery payload has {entry.get('items')} items; data/gallery.json has {gallery_count}."]
+    return []
+
+
 def check_support_files() -> list[str]:
     required_paths = [
         PROJECT_DIR / ".nojekyll",
@@ -262,46 +337,138 @@ def check_digest_hygiene() -> list[str]:
     return warnings
 
 
-def check_script_sync(script_path: Path, label: str) -> list[str]:
-    if not script_path.exists():
-        return [f"Missing validation script for {label}: {rel_path(script_path)}"]
+def check_news_archive() -> list[str]:
+    """Every digest with stories has its archive pages, and no archive page outlived its digest.
+
+    Only page coverage is checked here, reading the digest cache without
+    updating it; whether the pages are current is render-cinematic-site.py
+    --check's job (run in CI next to this script). The same digests then
+    go through check_news_stories.
+    """
+    render = load_script(CINEMATIC_RENDER_SCRIPT, "render_cinematic_site")
+    try:
+        digests = render.load_digests(limit=None, apply=False)
+        expected = {rel_path(entry[0]) for entry in render.news_archive_plan(digests)}
+    except (OSError, ValueError) as exc:
+        return [f"News archive could not be checked: {exc}"]
+    on_disk = {rel_path(path) for path in NEWS_HTML_FILES}
+    issues = [f"Missing news archive page (re-run render-cinematic-site.py): {path}" for path in sorted(expected - on_disk)]
+    issues.extend(f"News archive page has no digest behind it: {path}" for path in sorted(on_disk - expected))
+    issues.extend(check_news_stories(render, digests))
+    return issues
 
-    result = subprocess.run(
-        [sys.executable, str(script_path), "--check"],
-        cwd=PROJECT_DIR,
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode == 0:
-        return []
 
-    message = (result.stdout or result.stderr or "").strip().splitlines()
-    detail = message[-1] if message else "check failed"
-    return [f"{label} is out of date: {detail}"]
+def check_news_stories(render, digests: list[dict]) -> list[str]:
+    """Every digest that links stories parses to some, and a re-run story is one entry with a seen range.
+
+    The first half catches a digest layout the renderer does not read
+    (those digests would silently drop out of news/ and the search). The
+    second catches the late-January News Scout digests, which repeat most
+    of each other's items: every sighting of a title at one URL must fold
+    into a single story whose first/last seen range covers all of them.
+    """
+    parsed = {digest["slug"] for digest in digests if digest["stories"]}
+    issues = []
+    for path in render.digest_paths(None):
+        if path.name not in parsed and re.search(r"\]\(https?://", path.read_text(encoding="utf-8", errors="ignore")):
+            issues.append(f"Digest links stories the news renderer could not parse: {rel_path(path)}")
+    stories = render.build_story_index(digests)
+    sightings: dict[tuple[str, str], list[tuple[str, int]]] = {}
+    for digest in digests:
+        for story in digest["stories"]:
+            key = (render.story_url_key(story["href"]), render.story_title_key(story["title"]))
+            sightings.setdefault(key, []).append((digest["date"], story["story"]))
+    for (url, _), seen in sorted(sightings.items()):
+        indexes = {index for _, index in seen}
+        dates = sorted(date for date, _ in seen)
+        if len(indexes) > 1:
+            issues.append(f"News story repeated across digests is listed {len(indexes)} times: {url}")
+            continue
+        entry = stories[indexes.pop()]
+        if not entry["first_seen"] <= dates[0] <= dates[-1] <= entry["last_seen"]:
+            issues.append(f"News story seen {dates[0]} - {dates[-1]} is dated {entry['first_seen']} - {entry['last_seen']}: {url}")
+    return issues
 
 
-def main() -> int:
+def load_script(script_path: Path, module_name: str):
+    """Import one of the hyphenated sibling scripts as a module."""
+    spec = importlib.util.spec_from_file_location(module_name, script_path)
+    if spec is None or spec.loader is None:
+        raise RuntimeError(f"Unable to load {script_path}")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def check_alist_snapshot_sync(snapshot: dict) -> list[str]:
+    if not ALIST_SYNC_SCRIPT.exists():
+        return [f"Missing validation script for A-List snapshot: {rel_path(ALIST_SYNC_SCRIPT)}"]
+
+    sync = load_script(ALIST_SYNC_SCRIPT, "sync_a_list_benchmarks")
+    try:
+        differences = sync.check_snapshot(ALIST_SHARED_SOURCE, snapshot)
+    except (OSError, ValueError) as exc:
+        return [f"A-List snapshot could not be checked: {exc}"]
+    return [f"A-List snapshot is out of date: {difference}" for difference in differences]
+
+
+def check_alist_render_sync(snapshot: dict) -> list[str]:
+    if not ALIST_RENDER_SCRIPT.exists():
+        return [f"Missing validation script for A-List rendered pages: {rel_path(ALIST_RENDER_SCRIPT)}"]
+
+    render = load_script(ALIST_RENDER_SCRIPT, "render_a_list")
+    return [
+        f"A-List rendered pages are out of date: {rel_path(path)} ({detail})"
+        for path, detail in render.output_differences(snapshot).items()
+    ]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Static validation checks for the Axy Lusion repo.")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for the local reference scan; 0 uses one per CPU (default: scan serially)",
+    )
+    parser.add_argument("--timings", action="store_true", help="Report per-file scan time for the local reference check")
+    add_profile_argument(parser)
+    return parser.parse_args()
+
+
+def run(args: argparse.Namespace) -> int:
+    if args.jobs < 1:
+        args.jobs = os.cpu_count() or 1
     failures: list[str] = []
     warnings: list[str] = []
     alist_category_count: int | None = None
+    alist_snapshot: dict | None = None
 
+    # The gallery checks only need short fields, so they read the columnar
+    # sidecar (rebuilt from, and so validating, the JSON whenever it changed).
     try:
-        gallery_items = load_json_items(PROJECT_DIR / "data" / "gallery.json")
+        with stage("load-gallery"):
+            gallery = open_columns(PROJECT_DIR / "data" / "gallery.json")
     except (OSError, ValueError, json.JSONDecodeError) as exc:
         failures.append(f"Unable to load data/gallery.json: {exc}")
-        gallery_items = []
+        gallery = None
+    gallery_count = len(gallery) if gallery is not None else 0
+    gallery_ids = gallery.column("id") if gallery is not None else []
 
     try:
-        homepage_items = load_json_items(PROJECT_DIR / "data" / "homepage-gallery.json")
+        with stage("load-homepage"):
+            homepage_items = load_json_items(PROJECT_DIR / "data" / "homepage-gallery.json")
     except (OSError, ValueError, json.JSONDecodeError) as exc:
         failures.append(f"Unable to load data/homepage-gallery.json: {exc}")
         homepage_items = []
 
     if ALIST_DATA_PATH.exists():
         try:
-            alist_snapshot = load_alist_snapshot(ALIST_DATA_PATH)
+            with stage("load-a-list"):
+                alist_snapshot = load_alist_snapshot(ALIST_DATA_PATH)
         except (OSError, ValueError, json.JSONDecodeError) as exc:
             failures.append(f"Unable to load data/a-list-benchmarks.json: {exc}")
+            alist_snapshot = None
         else:
             categories = alist_snapshot.get("categories", [])
             alist_category_count = len(categories)
@@ -317,28 +484,47 @@ def main() -> int:
                         f"A-List snapshot is older than 48 hours ({age_hours:.1f}h): {rel_path(ALIST_DATA_PATH)}"
                     )
 
-    if not gallery_items:
+    if not gallery_count:
         failures.append("data/gallery.json has no items.")
     if not homepage_items:
         failures.append("data/homepage-gallery.json has no items.")
 
-    failures.extend(check_local_refs())
-    failures.extend(check_digest_manifest())
-    failures.extend(check_homepage_alignment(gallery_items, homepage_items))
-    failures.extend(check_public_head_requirements())
-    failures.extend(check_support_files())
-    if ALIST_SHARED_SOURCE.exists():
-        failures.extend(check_script_sync(ALIST_SYNC_SCRIPT, "A-List snapshot"))
-    else:
-        warnings.append(
-            "A-List shared benchmark cache is unavailable; skipped source freshness check: "
-            f"{ALIST_SHARED_SOURCE}"
-        )
-    failures.extend(check_script_sync(ALIST_RENDER_SCRIPT, "A-List rendered pages"))
-    warnings.extend(check_digest_hygiene())
-
-    gallery_hosts = summarize_hosts(gallery_items)
-    homepage_hosts = summarize_hosts(homepage_items)
+    ref_timings: list[tuple[str, float]] | None = [] if args.timings else None
+    started = time.perf_counter()
+    with stage("local-refs"):
+        failures.extend(check_local_refs(jobs=args.jobs, timings=ref_timings))
+    ref_elapsed = time.perf_counter() - started
+    with stage("digest-manifest"):
+        failures.extend(check_digest_manifest())
+    with stage("homepage-alignment"):
+        failures.extend(check_homepage_alignment(gallery_ids, homepage_items))
+    with stage("head-requirements"):
+        failures.extend(check_public_head_requirements())
+    with stage("support-files"):
+        failures.extend(check_support_files())
+    if gallery is not None:
+        with stage("hashed-payload"):
+            failures.extend(check_hashed_payload(gallery_count))
+    # Both A-List checks run in-process against the snapshot parsed above.
+    if alist_snapshot is not None:
+        if ALIST_SHARED_SOURCE.exists():
+            with stage("a-list-snapshot"):
+                failures.extend(check_alist_snapshot_sync(alist_snapshot))
+        else:
+            warnings.append(
+                "A-List shared benchmark cache is unavailable; skipped source freshness check: "
+                f"{ALIST_SHARED_SOURCE}"
+            )
+        with stage("a-list-render"):
+            failures.extend(check_alist_render_sync(alist_snapshot))
+    with stage("news-archive"):
+        failures.extend(check_news_archive())
+    with stage("digest-hygiene"):
+        warnings.extend(check_digest_hygiene())
+
+    with stage("cdn-hosts"):
+        gallery_hosts = summarize_hosts(gallery.rows() if gallery is not None else [])
+        homepage_hosts = summarize_hosts(homepage_items)
 
     midjourney_gallery = gallery_hosts.get("cdn.midjourney.com", 0)
     midjourney_homepage = homepage_hosts.get("cdn.midjourney.com", 0)
@@ -354,12 +540,20 @@ def main() -> int:
     print("Axy Lusion validation summary")
     print("=" * 32)
     print(f"HTML files checked: {len(HTML_FILES)}")
-    print(f"Gallery items: {len(gallery_items)}")
+    if GALLERY_SHARD_FILES:
+        print(f"Gallery shards checked: {len(GALLERY_SHARD_FILES)}")
+    print(f"Gallery items: {gallery_count}")
     print(f"Homepage items: {len(homepage_items)}")
     print(f"Digest files indexed: {len(build_digest_manifest()['files'])}")
     if alist_category_count is not None:
         print(f"A-List categories: {alist_category_count}")
 
+    if ref_timings is not None:
+        print(f"\nLocal reference scan: {ref_elapsed * 1000:.1f} ms ({args.jobs} job(s))")
+        print("-" * 20)
+        for name, elapsed in sorted(ref_timings, key=lambda entry: entry[1], reverse=True):
+            print(f"{elapsed * 1000:8.1f} ms  {name}")
+
     if warnings:
         print("\nWarnings")
         print("-" * 8)
@@ -377,5 +571,11 @@ def main() -> int:
     return 0
 
 
+def main() -> int:
+    args = parse_args()
+    with profiling("validate-site", args):
+        return run(args)
+
+
 if __name__ == "__main__":
     raise SystemExit(main())